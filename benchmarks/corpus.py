@@ -0,0 +1,428 @@
+"""
+Generate a deterministic synthetic PDF corpus with ground truth.
+
+Each document is written as ``name.pdf`` with its ground-truth text in
+``name.txt`` (pages separated by form feeds, as the extractor benchmark
+expects). Entity documents also get ``name.entities.json`` listing the
+emails, phones, URLs and dates they contain. The same seed and options
+always produce byte-identical files. Run from the repository root:
+
+    python -m benchmarks.corpus corpus/ --documents 5 --pages 10 --long-pages 500
+    
+Document kinds:
+    text      Text-layer pages of prose
+    scanned   Image-only pages, as from a scanner, with no text layer
+    mixed     Pages with a text layer above a scanned image region
+    long      One long text document per seed (--long-pages pages)
+    tables    Dense ruled tables with a value in every cell
+    entities  Prose dense with emails, phone numbers, URLs and dates
+"""
+import os
+import json
+import random
+import argparse
+from typing import Dict, Any, List, Tuple
+from PIL import Image, ImageDraw, ImageFont
+from PyPDF2 import PdfWriter, PageObject
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, EncodedStreamObject, NameObject, NumberObject
+
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 50
+FONT_SIZE = 10
+LEADING = 12
+LINE_CHARS = 90
+
+KINDS = ['text', 'scanned', 'mixed', 'long', 'tables', 'entities']
+
+_WORDS = (
+    "the of and to in is that for it as was with be by on not he this are or his from at which but have "
+    "an they you were their one all we can her has there been if more when will would who so no report "
+    "revenue quarter customer account balance statement invoice payment period total amount policy risk "
+    "analysis market growth product service contract agreement schedule section table figure result data "
+    "system process review annual interest credit loan income expense asset liability equity tax rate"
+).split()
+
+_MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
+           'September', 'October', 'November', 'December']
+
+_FIRST_NAMES = ['alice', 'bob', 'carol', 'dave', 'erin', 'frank', 'grace', 'heidi', 'ivan', 'judy']
+_DOMAINS = ['example.com', 'example.org', 'mail.example.net', 'corp.example.co.uk']
+
+# Joins the words of an entity while lines are wrapped, so no entity is split
+# across lines; it is not whitespace, so _wrap keeps it inside one word
+_GLUE = '\0'
+
+
+def _sentence(rng: random.Random) -> str:
+    """Build a random sentence from the vocabulary."""
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 16))]
+    return " ".join(words).capitalize() + "."
+
+
+def _wrap(text: str, width: int = LINE_CHARS) -> List[str]:
+    """Wrap text into lines of at most width characters."""
+    lines, line = [], ""
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _prose_lines(rng: random.Random, count: int) -> List[str]:
+    """Generate wrapped lines of prose."""
+    lines = []
+    while len(lines) < count:
+        lines.extend(_wrap(" ".join(_sentence(rng) for _ in range(4))))
+    return lines[:count]
+
+
+def _entity_lines(rng: random.Random, count: int, entities: Dict[str, set]) -> List[str]:
+    """
+    Generate lines of prose that mention many entities.
+    
+    Entities are never broken across lines, and only those on the returned
+    lines are recorded, so every recorded entity appears verbatim.
+    
+    Args:
+        rng: Random generator
+        count: Number of lines
+        entities: Sets of 'emails', 'phones', 'urls' and 'dates' to add the
+            entities of the returned lines to
+            
+    Returns:
+        Wrapped lines
+    """
+    def email():
+        return f"{rng.choice(_FIRST_NAMES)}.{rng.choice(_FIRST_NAMES)}{rng.randint(1, 99)}@{rng.choice(_DOMAINS)}"
+    
+    def phone():
+        a, b, c = rng.randint(200, 989), rng.randint(200, 999), rng.randint(0, 9999)
+        return rng.choice([f"{a}-{b}-{c:04d}", f"{a}.{b}.{c:04d}", f"+1 {a}-{b}-{c:04d}"])
+    
+    def url():
+        return f"https://www.{rng.choice(_DOMAINS)}/{rng.choice(_WORDS)}/{rng.randint(1, 9999)}"
+    
+    def date():
+        month, day, year = rng.randint(1, 12), rng.randint(1, 28), rng.randint(1990, 2030)
+        return rng.choice([
+            f"{month:02d}/{day:02d}/{year}",
+            f"{_MONTHS[month - 1]} {day}, {year}",
+            f"{day} {_MONTHS[month - 1]} {year}"
+        ])
+    
+    makers = [('emails', email), ('phones', phone), ('urls', url), ('dates', date)]
+    # Entity types by glued entity word
+    glued = {}
+    lines = []
+    while len(lines) < count:
+        parts = []
+        for _ in range(3):
+            words = [rng.choice(_WORDS) for _ in range(rng.randint(3, 8))]
+            entity_type, make = rng.choice(makers)
+            word = make().replace(" ", _GLUE)
+            glued[word] = entity_type
+            parts.append(" ".join(words) + " " + word)
+        lines.extend(_wrap(" ".join(parts) + " ."))
+    
+    lines = lines[:count]
+    for line in lines:
+        for word in line.split():
+            if word in glued:
+                entities[glued[word]].add(word.replace(_GLUE, " "))
+    return [line.replace(_GLUE, " ") for line in lines]
+
+
+def _escape(text: str) -> str:
+    """Escape a string for a PDF literal string."""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _text_ops(lines: List[str], top: float) -> str:
+    """Content stream operators drawing lines of text from a top position."""
+    if not lines:
+        return ""
+    shown = " ".join(f"({_escape(line)}) '" for line in lines)
+    return f"BT /F1 {FONT_SIZE} Tf {LEADING} TL {MARGIN} {top + LEADING} Td {shown} ET"
+
+
+def render_text_image(lines: List[str], width: int, height: int, dpi: int, rng: random.Random) -> Image.Image:
+    """
+    Render lines of text as a scanned grayscale image.
+    
+    Args:
+        lines: Text lines
+        width: Region width in points
+        height: Region height in points
+        dpi: Scan resolution
+        rng: Random generator for the scan skew and speckle
+        
+    Returns:
+        Grayscale image of the region
+    """
+    scale = dpi / 72
+    image = Image.new('L', (int(width * scale), int(height * scale)), 255)
+    draw = ImageDraw.Draw(image)
+    
+    try:
+        font = ImageFont.load_default(size=int(FONT_SIZE * scale))
+    except (TypeError, OSError):
+        # Older Pillow or no FreeType: fixed-size bitmap font
+        font = ImageFont.load_default()
+    
+    y = MARGIN * scale / 2
+    for line in lines:
+        draw.text((MARGIN * scale, y), line, fill=0, font=font)
+        y += LEADING * scale
+    
+    # A slight skew and speckle, as from a flatbed scanner
+    image = image.rotate(rng.uniform(-0.5, 0.5), fillcolor=255)
+    pixels = image.load()
+    for _ in range(image.width * image.height // 2000):
+        pixels[rng.randrange(image.width), rng.randrange(image.height)] = rng.choice([0, 128])
+    
+    return image
+
+
+class CorpusPDF:
+    """Builder for one synthetic PDF."""
+    
+    def __init__(self):
+        """Initialize an empty document."""
+        self.writer = PdfWriter()
+        self.font = DictionaryObject({
+            NameObject('/Type'): NameObject('/Font'),
+            NameObject('/Subtype'): NameObject('/Type1'),
+            NameObject('/BaseFont'): NameObject('/Helvetica'),
+            NameObject('/Encoding'): NameObject('/WinAnsiEncoding')
+        })
+    
+    def add_page(self, content: str, images: Dict[str, Image.Image] = None) -> None:
+        """
+        Add a page from a content stream and the images it draws.
+        
+        Args:
+            content: Content stream operators
+            images: Image XObjects by resource name
+        """
+        page = PageObject.create_blank_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        
+        stream = DecodedStreamObject()
+        stream.set_data(content.encode('latin-1'))
+        # Streams are stored as indirect objects when the document is written
+        page[NameObject('/Contents')] = stream.flate_encode()
+        
+        resources = DictionaryObject({
+            NameObject('/Font'): DictionaryObject({NameObject('/F1'): self.font})
+        })
+        if images:
+            resources[NameObject('/XObject')] = DictionaryObject({
+                NameObject(f'/{name}'): self._add_image(image) for name, image in images.items()
+            })
+        page[NameObject('/Resources')] = resources
+        
+        self.writer.add_page(page)
+    
+    def add_text_page(self, lines: List[str]) -> None:
+        """Add a page with a text layer."""
+        self.add_page(_text_ops(lines, PAGE_HEIGHT - MARGIN))
+    
+    def add_scanned_page(self, image: Image.Image) -> None:
+        """Add an image-only page filled by one scanned image."""
+        self.add_page(f"q {PAGE_WIDTH} 0 0 {PAGE_HEIGHT} 0 0 cm /Im0 Do Q", {'Im0': image})
+    
+    def add_mixed_page(self, lines: List[str], image: Image.Image, image_height: float) -> None:
+        """Add a page with a text layer above a scanned region at the bottom."""
+        content = (_text_ops(lines, PAGE_HEIGHT - MARGIN) +
+                   f" q {PAGE_WIDTH} 0 0 {image_height} 0 0 cm /Im0 Do Q")
+        self.add_page(content, {'Im0': image})
+    
+    def add_table_page(self, rows: List[List[str]], column_width: float, row_height: float) -> None:
+        """Add a page with a ruled table, one value per cell."""
+        ops = ["0.5 w"]
+        top = PAGE_HEIGHT - MARGIN
+        columns = len(rows[0]) if rows else 0
+        
+        for r, row in enumerate(rows):
+            y = top - (r + 1) * row_height
+            for c, cell in enumerate(row):
+                x = MARGIN + c * column_width
+                ops.append(f"{x} {y} {column_width} {row_height} re S")
+                ops.append(f"BT /F1 {FONT_SIZE - 2} Tf {x + 2} {y + 3} Td ({_escape(cell)}) Tj ET")
+        
+        if columns:
+            ops.append(f"{MARGIN} {top - len(rows) * row_height} {columns * column_width} "
+                       f"{len(rows) * row_height} re S")
+        self.add_page("\n".join(ops))
+    
+    def write(self, path: str) -> None:
+        """Write the PDF with fixed metadata so output is reproducible."""
+        # The writer adds no timestamps or random file identifier, so the
+        # bytes are identical across runs
+        self.writer.add_metadata({
+            '/Producer': 'ScoreME synthetic corpus',
+            '/Title': os.path.splitext(os.path.basename(path))[0]
+        })
+        with open(path, 'wb') as f:
+            self.writer.write(f)
+    
+    def _add_image(self, image: Image.Image) -> EncodedStreamObject:
+        """Build a grayscale image XObject."""
+        stream = DecodedStreamObject()
+        stream.set_data(image.tobytes())
+        encoded = stream.flate_encode()
+        encoded.update({
+            NameObject('/Type'): NameObject('/XObject'),
+            NameObject('/Subtype'): NameObject('/Image'),
+            NameObject('/Width'): NumberObject(image.width),
+            NameObject('/Height'): NumberObject(image.height),
+            NameObject('/ColorSpace'): NameObject('/DeviceGray'),
+            NameObject('/BitsPerComponent'): NumberObject(8)
+        })
+        return encoded
+
+
+def build_document(kind: str, rng: random.Random, pages: int, dpi: int = 150) -> Tuple[CorpusPDF, List[str], Dict[str, Any]]:
+    """
+    Build one synthetic document of a given kind.
+    
+    Args:
+        kind: Document kind, one of KINDS
+        rng: Random generator
+        pages: Number of pages
+        dpi: Resolution of scanned images
+        
+    Returns:
+        Tuple of (PDF builder, ground-truth page texts, extra ground truth)
+    """
+    pdf = CorpusPDF()
+    truth = []
+    extra: Dict[str, Any] = {}
+    lines_per_page = (PAGE_HEIGHT - 2 * MARGIN) // LEADING
+    
+    if kind in ('text', 'long'):
+        for _ in range(pages):
+            lines = _prose_lines(rng, lines_per_page)
+            pdf.add_text_page(lines)
+            truth.append("\n".join(lines))
+    
+    elif kind == 'scanned':
+        for _ in range(pages):
+            lines = _prose_lines(rng, rng.randint(20, 40))
+            pdf.add_scanned_page(render_text_image(lines, PAGE_WIDTH, PAGE_HEIGHT, dpi, rng))
+            truth.append("\n".join(lines))
+    
+    elif kind == 'mixed':
+        image_height = PAGE_HEIGHT // 2 - MARGIN
+        for _ in range(pages):
+            text_lines = _prose_lines(rng, (PAGE_HEIGHT // 2) // LEADING)
+            image_lines = _prose_lines(rng, 12)
+            image = render_text_image(image_lines, PAGE_WIDTH, image_height, dpi, rng)
+            pdf.add_mixed_page(text_lines, image, image_height)
+            truth.append("\n".join(text_lines + image_lines))
+    
+    elif kind == 'tables':
+        columns, row_height = 6, 14
+        column_width = (PAGE_WIDTH - 2 * MARGIN) / columns
+        for _ in range(pages):
+            rows = [[f"{rng.choice(_WORDS)}{rng.randint(0, 999)}" if c == 0 else f"{rng.uniform(-1e5, 1e5):.2f}"
+                     for c in range(columns)]
+                    for _ in range(int((PAGE_HEIGHT - 2 * MARGIN) // row_height))]
+            pdf.add_table_page(rows, column_width, row_height)
+            truth.append("\n".join(" ".join(row) for row in rows))
+    
+    elif kind == 'entities':
+        entities = {'emails': set(), 'phones': set(), 'urls': set(), 'dates': set()}
+        for _ in range(pages):
+            lines = _entity_lines(rng, lines_per_page, entities)
+            pdf.add_text_page(lines)
+            truth.append("\n".join(lines))
+        extra['entities'] = {name: sorted(values) for name, values in entities.items()}
+    
+    else:
+        raise ValueError(f"Unsupported document kind: {kind}")
+    
+    return pdf, truth, extra
+
+
+def generate_corpus(output_dir: str, seed: int = 0, kinds: List[str] = None, documents: int = 3,
+                    pages: int = 5, long_pages: int = 200, dpi: int = 150) -> Dict[str, Any]:
+    """
+    Generate a synthetic corpus.
+    
+    Args:
+        output_dir: Directory to write the corpus to
+        seed: Random seed; the same seed and options give identical files
+        kinds: Document kinds to generate (default: all)
+        documents: Documents per kind ('long' always gets one)
+        pages: Pages per document
+        long_pages: Pages of the long document
+        dpi: Resolution of scanned images
+        
+    Returns:
+        Manifest describing the generated files, also saved as manifest.json
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    kinds = kinds or KINDS
+    
+    manifest = {
+        'seed': seed,
+        'pages': pages,
+        'long_pages': long_pages,
+        'dpi': dpi,
+        'documents': []
+    }
+    
+    for kind in kinds:
+        count = 1 if kind == 'long' else documents
+        for index in range(count):
+            # One generator per document, so documents do not depend on each other
+            rng = random.Random(f"{seed}:{kind}:{index}")
+            name = f"{kind}_{index:03d}"
+            page_count = long_pages if kind == 'long' else pages
+            
+            pdf, truth, extra = build_document(kind, rng, page_count, dpi)
+            pdf.write(os.path.join(output_dir, f"{name}.pdf"))
+            
+            with open(os.path.join(output_dir, f"{name}.txt"), 'w', encoding='utf-8') as f:
+                f.write("\f".join(truth))
+            
+            if 'entities' in extra:
+                with open(os.path.join(output_dir, f"{name}.entities.json"), 'w', encoding='utf-8') as f:
+                    json.dump(extra['entities'], f, indent=2)
+            
+            manifest['documents'].append({'name': name, 'kind': kind, 'pages': page_count})
+    
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    
+    return manifest
+
+
+def main():
+    """Main entry point for the corpus generator."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic PDF corpus with ground truth")
+    parser.add_argument("output_dir", help="Directory to write the corpus to")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--kinds", nargs='+', choices=KINDS, default=KINDS, help="Document kinds")
+    parser.add_argument("--documents", type=int, default=3, help="Documents per kind")
+    parser.add_argument("--pages", type=int, default=5, help="Pages per document")
+    parser.add_argument("--long-pages", type=int, default=200, help="Pages of the long document")
+    parser.add_argument("--dpi", type=int, default=150, help="Resolution of scanned images")
+    
+    args = parser.parse_args()
+    
+    manifest = generate_corpus(args.output_dir, args.seed, args.kinds, args.documents,
+                               args.pages, args.long_pages, args.dpi)
+    total_pages = sum(document['pages'] for document in manifest['documents'])
+    print(f"Generated {len(manifest['documents'])} documents, {total_pages} pages in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
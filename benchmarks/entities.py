@@ -0,0 +1,156 @@
+"""
+Benchmark EntityExtractor against the previous per-pattern implementation.
+
+The previous implementation ran re.findall once per entity pattern, nine
+passes over the text, with every pattern compiled from a string literal on
+each call. It is kept here as the reference, and the current output is
+checked to be identical. Documents are generated as plain prose, prose
+mentioning many entities, or number-dense tables. With --positions, the
+memory of the positional entity table is compared with one dictionary per
+entity instead. Run from the repository root:
+
+    python -m benchmarks.entities --pages 1000 --kind prose entities tables
+    python -m benchmarks.entities --pages 5000 --positions
+"""
+import re
+import time
+import tracemalloc
+import random
+import argparse
+from typing import Dict, List
+from benchmarks.corpus import _prose_lines, _entity_lines
+from src.models.document import Document
+from src.processors.entity_extractor import EntityExtractor
+
+
+def legacy_extract(text: str) -> Dict[str, List[str]]:
+    """Extract entities the way EntityExtractor did before, with all types enabled."""
+    emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    
+    phones = []
+    for pattern in [r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',
+                    r'\b\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}\b',
+                    r'\b\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b']:
+        phones.extend(re.findall(pattern, text))
+    
+    urls = re.findall(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+[^\s]*', text)
+    
+    dates = []
+    for pattern in [r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
+                    r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b',
+                    r'\b\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b']:
+        dates.extend(re.findall(pattern, text, re.IGNORECASE))
+    
+    return {
+        'emails': sorted(set(emails)),
+        'phones': sorted(set(phones)),
+        'urls': sorted(set(urls)),
+        'dates': sorted(set(dates))
+    }
+
+
+def _table_lines(rng: random.Random, count: int) -> List[str]:
+    """Generate table rows of codes, amounts and percentages."""
+    lines = []
+    for _ in range(count):
+        cells = [f"{rng.randint(1000, 99999)}", f"{rng.randint(0, 999)}.{rng.randint(0, 99):02d}",
+                 f"{rng.randint(0, 100)}%", f"Q{rng.randint(1, 4)}", f"{rng.randint(1, 28)}/{rng.randint(1, 12)}"]
+        lines.append("  ".join(cells))
+    return lines
+
+
+def make_text(kind: str, pages: int, seed: int = 0) -> str:
+    """
+    Generate a document of the given kind.
+    
+    Args:
+        kind: 'prose', 'entities' or 'tables'
+        pages: Number of 50-line pages
+        seed: Random seed
+        
+    Returns:
+        Document text
+    """
+    rng = random.Random(seed)
+    if kind == 'prose':
+        lines = _prose_lines(rng, pages * 50)
+    elif kind == 'entities':
+        entities = {'emails': set(), 'phones': set(), 'urls': set(), 'dates': set()}
+        lines = _entity_lines(rng, pages * 50, entities)
+    else:
+        lines = _table_lines(rng, pages * 50)
+    return "\n".join(lines)
+
+
+def benchmark_positions(pages: int):
+    """
+    Compare the memory of the entity table with a dictionary per entity.
+    
+    Args:
+        pages: Number of entity-dense pages
+    """
+    lines = make_text('entities', pages).split("\n")
+    text_by_page = {n: "\n".join(lines[n * 50:(n + 1) * 50]) for n in range(pages)}
+    document = Document(path="", filename="", text_by_page=text_by_page)
+    extractor = EntityExtractor()
+    
+    start = time.perf_counter()
+    extractor.process(document)
+    seconds = time.perf_counter() - start
+    
+    tracemalloc.start()
+    extractor.process(document)
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    # The dictionaries share the table's value strings, so only their own cost is counted
+    tracemalloc.start()
+    records = [{'type': record.type, 'value': record.value, 'page': record.page,
+                'start': record.start, 'end': record.end} for record in document.entity_table]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    count = len(document.entity_table)
+    print(f"Entities: {count} on {pages} pages, extracted in {seconds:.3f} s")
+    print(f"Entity table:   {table_bytes / 1e6:.1f} MB ({table_bytes / count:.0f} bytes/entity)")
+    print(f"Dictionaries:   {dict_bytes / 1e6:.1f} MB ({dict_bytes / len(records):.0f} bytes/entity)")
+
+
+def main():
+    """Main entry point for the entity benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark EntityExtractor")
+    parser.add_argument("--pages", type=int, default=1000, help="Pages in each generated document")
+    parser.add_argument("--kind", nargs="+", choices=['prose', 'entities', 'tables'],
+                        default=['prose', 'entities', 'tables'], help="Kinds of document to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation; the best is kept")
+    parser.add_argument("--positions", action="store_true", help="Compare entity table memory instead")
+    
+    args = parser.parse_args()
+    
+    if args.positions:
+        benchmark_positions(args.pages)
+        return
+    
+    extractor = EntityExtractor()
+    print(f"{'kind':>8} {'M chars':>8} {'previous':>9} {'current':>9} {'speedup':>8} {'identical':>9}")
+    
+    for kind in args.kind:
+        text = make_text(kind, args.pages)
+        
+        timings = {}
+        for name, extract in (('previous', legacy_extract), ('current', extractor._extract_entities)):
+            best = float('inf')
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                entities = extract(text)
+                best = min(best, time.perf_counter() - start)
+            timings[name] = (best, entities)
+        
+        legacy_seconds, legacy_entities = timings['previous']
+        current_seconds, current_entities = timings['current']
+        print(f"{kind:>8} {len(text) / 1e6:>8.1f} {legacy_seconds:>8.3f}s {current_seconds:>8.3f}s "
+              f"{legacy_seconds / current_seconds:>7.2f}x {str(legacy_entities == current_entities):>9}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
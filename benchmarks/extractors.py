@@ -0,0 +1,305 @@
+"""
+Benchmark every registered extractor over a corpus of PDFs.
+
+For each extractor the corpus is processed in a fresh process, recording
+pages per second, per-page latency percentiles, peak RSS and CPU time. When
+a PDF has a ground-truth file next to it (``name.txt`` for ``name.pdf``,
+pages separated by form feeds), the character error rate is computed too.
+
+Results are written as JSON and can be compared against a stored baseline;
+the exit status is 1 if any metric regressed. Run from the repository root:
+
+    python -m benchmarks.extractors corpus/ --output results.json --baseline baseline.json
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import resource
+import multiprocessing
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from benchmarks.metrics import character_errors, percentile
+
+
+# Allowed relative change before a speed or memory metric counts as a regression
+DEFAULT_TOLERANCE = 0.10
+
+# Allowed absolute increase of the character error rate
+DEFAULT_CER_TOLERANCE = 0.005
+
+
+def find_corpus(corpus_dir: str) -> List[str]:
+    """
+    List the PDF files of a corpus.
+    
+    Args:
+        corpus_dir: Directory searched recursively
+        
+    Returns:
+        Sorted PDF paths
+    """
+    pdf_files = []
+    for root, _, files in os.walk(corpus_dir):
+        pdf_files.extend(os.path.join(root, f) for f in files if f.lower().endswith('.pdf'))
+    return sorted(pdf_files)
+
+
+def load_ground_truth(pdf_path: str) -> Optional[List[str]]:
+    """
+    Load the ground-truth pages of a PDF, if present.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Page texts split on form feeds, or None without a ground-truth file
+    """
+    truth_path = os.path.splitext(pdf_path)[0] + '.txt'
+    if not os.path.exists(truth_path):
+        return None
+    
+    with open(truth_path, 'r', encoding='utf-8') as f:
+        return f.read().split('\f')
+
+
+def _peak_rss_bytes() -> int:
+    """Peak RSS of this process and its finished children, in bytes."""
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _cpu_seconds() -> float:
+    """User plus system CPU time of this process and its finished children."""
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+def _benchmark_worker(extractor_type: str, config: Dict[str, Any], pdf_files: List[str]) -> Dict[str, Any]:
+    """
+    Run one extractor over the corpus in the current (fresh) process.
+    
+    Args:
+        extractor_type: Registered extractor type
+        config: Configuration for the extractor
+        pdf_files: PDFs to extract
+        
+    Returns:
+        Metrics dictionary for the extractor
+    """
+    from src.extractors.extractor_factory import ExtractorFactory
+    
+    extractor = ExtractorFactory.create_extractor(extractor_type, config)
+    
+    latencies = []
+    failed_documents = 0
+    truth_errors = 0
+    truth_characters = 0
+    
+    cpu_start = _cpu_seconds()
+    wall_start = time.perf_counter()
+    
+    for pdf_path in pdf_files:
+        pages = []
+        try:
+            page_start = time.perf_counter()
+            for _, text in extractor.iter_pages(pdf_path):
+                now = time.perf_counter()
+                latencies.append(now - page_start)
+                pages.append(text)
+                page_start = now
+        except Exception as e:
+            print(f"Error benchmarking {extractor_type} on {pdf_path}: {str(e)}")
+            failed_documents += 1
+            continue
+        
+        truth = load_ground_truth(pdf_path)
+        if truth is not None:
+            doc_errors, doc_characters = character_errors(pages, truth)
+            truth_errors += doc_errors
+            truth_characters += doc_characters
+    
+    seconds = time.perf_counter() - wall_start
+    cpu_seconds = _cpu_seconds() - cpu_start
+    
+    close = getattr(extractor, 'close', None)
+    if close:
+        close()
+    
+    pages = len(latencies)
+    return {
+        'documents': len(pdf_files),
+        'failed_documents': failed_documents,
+        'pages': pages,
+        'seconds': round(seconds, 4),
+        'pages_per_second': round(pages / seconds, 3) if seconds else 0.0,
+        'latency_ms': {
+            name: round(percentile(latencies, q) * 1000, 3) if latencies else None
+            for name, q in (('p50', 50), ('p90', 90), ('p99', 99), ('max', 100))
+        },
+        'cpu_seconds': round(cpu_seconds, 4),
+        'peak_rss_mb': round(_peak_rss_bytes() / (1024 * 1024), 1),
+        'cer': round(truth_errors / truth_characters, 5) if truth_characters else None
+    }
+
+
+def _worker_main(conn, extractor_type: str, config: Dict[str, Any], pdf_files: List[str]) -> None:
+    """Process entry point sending the worker's metrics back over a pipe."""
+    conn.send(_benchmark_worker(extractor_type, config, pdf_files))
+    conn.close()
+
+
+def run_benchmark(corpus_dir: str, extractor_types: List[str],
+                  config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Benchmark extractors over a corpus, each in a fresh process.
+    
+    Args:
+        corpus_dir: Directory containing the PDFs
+        extractor_types: Registered extractor types to run
+        config: Extractor configuration by type
+        
+    Returns:
+        Results dictionary with run information and per-extractor metrics
+    """
+    config = config or {}
+    pdf_files = find_corpus(corpus_dir)
+    
+    results = {
+        'corpus': os.path.abspath(corpus_dir),
+        'documents': len(pdf_files),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'extractors': {}
+    }
+    
+    # A fresh process per extractor keeps peak RSS and CPU time separate. It
+    # is not a pool worker, so extractors may start processes of their own.
+    context = multiprocessing.get_context('spawn')
+    for extractor_type in extractor_types:
+        print(f"Benchmarking {extractor_type} on {len(pdf_files)} documents...")
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        process = context.Process(target=_worker_main,
+                                  args=(child_conn, extractor_type, config.get(extractor_type, {}), pdf_files))
+        process.start()
+        child_conn.close()
+        try:
+            results['extractors'][extractor_type] = parent_conn.recv()
+        except EOFError:
+            print(f"Error benchmarking {extractor_type}: worker exited with code {process.exitcode}")
+        process.join()
+    
+    return results
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE,
+                        cer_tolerance: float = DEFAULT_CER_TOLERANCE) -> List[str]:
+    """
+    Find metrics that regressed against a baseline run.
+    
+    Args:
+        results: Current results
+        baseline: Baseline results
+        tolerance: Allowed relative change of speed and memory metrics
+        cer_tolerance: Allowed absolute increase of the character error rate
+        
+    Returns:
+        Human-readable descriptions of the regressions
+    """
+    regressions = []
+    
+    for extractor_type, current in results['extractors'].items():
+        base = baseline.get('extractors', {}).get(extractor_type)
+        if not base:
+            continue
+        
+        checks = [
+            ('pages_per_second', current['pages_per_second'], base['pages_per_second'], -1),
+            ('latency p99', current['latency_ms']['p99'], base['latency_ms']['p99'], 1),
+            ('peak_rss_mb', current['peak_rss_mb'], base['peak_rss_mb'], 1),
+            ('cpu_seconds', current['cpu_seconds'], base['cpu_seconds'], 1)
+        ]
+        for name, value, base_value, direction in checks:
+            if value is None or not base_value:
+                continue
+            change = (value - base_value) / base_value
+            if change * direction > tolerance:
+                regressions.append(f"{extractor_type}: {name} {base_value} -> {value} ({change:+.1%})")
+        
+        if current['cer'] is not None and base['cer'] is not None:
+            if current['cer'] - base['cer'] > cer_tolerance:
+                regressions.append(f"{extractor_type}: cer {base['cer']} -> {current['cer']}")
+    
+    return regressions
+
+
+def main():
+    """Main entry point for the extractor benchmark."""
+    from src.extractors.extractor_factory import ExtractorFactory
+    
+    parser = argparse.ArgumentParser(description="Benchmark PDF extractors over a corpus")
+    parser.add_argument("corpus_dir", help="Directory of PDFs, with optional name.txt ground truth")
+    parser.add_argument("--extractors", nargs='+', default=ExtractorFactory.get_available_extractors(),
+                        help="Extractor types to benchmark (default: all registered)")
+    parser.add_argument("--config", help="JSON file with extractor configuration by type")
+    parser.add_argument("--output", default="benchmark_results.json", help="Results file")
+    parser.add_argument("--baseline", help="Baseline results file to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write the results to the baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown or memory growth")
+    parser.add_argument("--cer-tolerance", type=float, default=DEFAULT_CER_TOLERANCE,
+                        help="Allowed absolute increase of the character error rate")
+    
+    args = parser.parse_args()
+    
+    config = {}
+    if args.config:
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    
+    results = run_benchmark(args.corpus_dir, args.extractors, config)
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    
+    print(f"\n{'extractor':<12} {'pages/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'cpu s':>8} {'rss MB':>8} {'cer':>8}")
+    for extractor_type, metrics in results['extractors'].items():
+        latency = metrics['latency_ms']
+        cer = f"{metrics['cer']:.4f}" if metrics['cer'] is not None else '-'
+        print(f"{extractor_type:<12} {metrics['pages_per_second']:>9.1f} {latency['p50'] or 0:>9.2f} "
+              f"{latency['p99'] or 0:>9.2f} {metrics['cpu_seconds']:>8.2f} {metrics['peak_rss_mb']:>8.1f} {cer:>8}")
+    
+    if not args.baseline:
+        return
+    
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+    
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    
+    regressions = compare_to_baseline(results, baseline, args.tolerance, args.cer_tolerance)
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    
+    print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Measure import time of the CLI entry points against a budget.
+
+Each entry point is imported in a fresh interpreter with ``-X importtime``,
+so only the cost of importing the module itself is counted, not interpreter
+start-up. Exits with status 1 if any entry point is over its budget. Run from
+the repository root:
+
+    python -m benchmarks.import_time --repeat 5
+"""
+import sys
+import argparse
+import subprocess
+
+
+# Import-time budgets in milliseconds. PDF, OCR and NLP libraries are only
+# imported when an extractor or processor is created, so these cover the
+# standard library and the project's own light modules.
+BUDGETS_MS = {
+    'main': 150,
+    'process_test_files': 150,
+    'processor_pipeline': 150
+}
+
+# Libraries no entry point should import before they are needed
+HEAVY_MODULES = ['PyPDF2', 'pdfplumber', 'pdfminer', 'pdf2image', 'pytesseract', 'PIL', 'nltk']
+
+
+def measure_import_ms(module: str) -> float:
+    """
+    Measure the cumulative import time of a module in a fresh interpreter.
+    
+    Args:
+        module: Module name to import
+        
+    Returns:
+        Import time in milliseconds
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                               capture_output=True, text=True, check=True)
+    
+    # The last line reports the module itself: "import time: self | cumulative | name"
+    for line in reversed(completed.stderr.splitlines()):
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def imported_heavy_modules(module: str) -> list:
+    """
+    List the heavy libraries importing a module pulls in.
+    
+    Args:
+        module: Module name to import
+        
+    Returns:
+        Names from HEAVY_MODULES found in sys.modules afterwards
+    """
+    code = (f"import sys, {module}; "
+            f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))")
+    completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    output = completed.stdout.strip()
+    return output.split(',') if output else []
+
+
+def main():
+    """Main entry point for the import-time benchmark."""
+    parser = argparse.ArgumentParser(description="Check CLI entry point import times against budgets")
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per entry point; the best is kept")
+    
+    args = parser.parse_args()
+    
+    over_budget = False
+    print(f"{'module':<20} {'best ms':>8} {'budget':>7}  heavy imports")
+    for module, budget in BUDGETS_MS.items():
+        best = min(measure_import_ms(module) for _ in range(args.repeat))
+        heavy = imported_heavy_modules(module)
+        over_budget = over_budget or best > budget or bool(heavy)
+        print(f"{module:<20} {best:>8.1f} {budget:>7}  {', '.join(heavy) or '-'}")
+    
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
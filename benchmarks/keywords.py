@@ -0,0 +1,62 @@
+"""
+Benchmark the keyword engines of ContentAnalyzer on a long document.
+
+The 'nltk' engine tokenizes with word_tokenize; the 'fast' engine counts
+words with one regex scan. Both are timed on the same cleaned text and
+their top keywords compared. Both need the stopwords data and the NLTK
+engine the punkt_tab data, from NLTK's data path or --nltk-data. Run from
+the repository root:
+
+    python -m benchmarks.keywords --pages 500 --nltk-data /opt/nltk_data
+"""
+import sys
+import time
+import argparse
+from benchmarks.text_processor import make_pages
+from src.models.extraction_result import ExtractionResult
+from src.processors.text_processor import TextProcessor
+from src.processors.content_analyzer import ContentAnalyzer, _nltk_resource
+
+
+def main():
+    """Main entry point for the keyword benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark ContentAnalyzer keyword engines")
+    parser.add_argument("--pages", type=int, default=500, help="Pages in the generated document")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per engine; the best is kept")
+    parser.add_argument("--keywords", type=int, default=15, help="Number of top keywords to compare")
+    parser.add_argument("--nltk-data", help="Directory with the NLTK data")
+    
+    args = parser.parse_args()
+    
+    text_by_page = make_pages(args.pages)
+    text = TextProcessor()._clean_text(ExtractionResult.join_pages(text_by_page[n] for n in sorted(text_by_page)))
+    print(f"Document: {args.pages} pages, {len(text) / 1e6:.1f} M characters")
+    
+    analyzer = ContentAnalyzer({'nltk_data': args.nltk_data})
+    try:
+        stop_words = _nltk_resource('stopwords', analyzer.language, analyzer.nltk_data)
+        analyzer._nltk_word_counts("Load the tokenizers.", stop_words)
+    except LookupError as e:
+        print(f"NLTK data not found: {str(e)}")
+        sys.exit(1)
+    
+    results = {}
+    for engine, count_words in (('nltk', analyzer._nltk_word_counts),
+                                ('fast', analyzer._fast_word_counts)):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            word_freq = count_words(text, stop_words)
+            best = min(best, time.perf_counter() - start)
+        results[engine] = (best, [word for word, _ in word_freq.most_common(args.keywords)])
+    
+    nltk_seconds, nltk_keywords = results['nltk']
+    fast_seconds, fast_keywords = results['fast']
+    print(f"nltk: {nltk_seconds:.3f} s ({len(text) / nltk_seconds / 1e6:.2f} M characters/s)")
+    print(f"fast: {fast_seconds:.3f} s ({len(text) / fast_seconds / 1e6:.2f} M characters/s, "
+          f"{nltk_seconds / fast_seconds:.1f}x)")
+    print(f"Identical top {args.keywords}: {nltk_keywords == fast_keywords}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Accuracy and latency metrics shared by the benchmarks.
+"""
+import math
+from typing import List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Compute the edit distance between two strings.
+    
+    Uses the bit-parallel algorithm of Myers (as formulated by Hyyrö), with
+    Python integers as bit vectors, so long pages cost one pass over the
+    longer string instead of a full dynamic-programming table.
+    
+    Args:
+        a: First string
+        b: Second string
+        
+    Returns:
+        Number of single-character insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    
+    # Bit masks of where each character occurs in the shorter string
+    peq = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    
+    mask = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    vp, vn = mask, 0
+    score = len(b)
+    
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        
+        hp = (hp << 1) | 1
+        hn = hn << 1
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv & mask
+    
+    return score
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so layout differences do not count as errors."""
+    return " ".join(text.split())
+
+
+def character_errors(extracted: List[str], truth: List[str]) -> Tuple[int, int]:
+    """
+    Count character errors of extracted text against ground truth.
+    
+    Pages are compared one to one when the page counts match, otherwise the
+    whole documents are compared.
+    
+    Args:
+        extracted: Extracted page texts in page order
+        truth: Ground-truth page texts in page order
+        
+    Returns:
+        Tuple of (edit distance, number of ground-truth characters)
+    """
+    if len(extracted) != len(truth):
+        extracted = ["\n".join(extracted)]
+        truth = ["\n".join(truth)]
+    
+    errors = 0
+    characters = 0
+    for page_text, page_truth in zip(extracted, truth):
+        page_truth = normalize_text(page_truth)
+        errors += levenshtein(normalize_text(page_text), page_truth)
+        characters += len(page_truth)
+    
+    return errors, characters
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    Compute a percentile with the nearest-rank method.
+    
+    Args:
+        values: Sample values
+        q: Percentile between 0 and 100
+        
+    Returns:
+        The percentile, or None for an empty sample
+    """
+    if not values:
+        return None
+    
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Benchmark OCR backends on the same rendered pages.
+
+Pages are rasterized once up front so only OCR time is measured. Run from the
+repository root:
+
+    python -m benchmarks.ocr_backends path/to/scan.pdf --pages 20
+"""
+import sys
+import time
+import argparse
+from pdf2image import convert_from_path
+from src.extractors.ocr_backends import get_backend, get_available_backends
+
+
+def benchmark_backend(name: str, images: list, lang: str, batch_size: int, repeat: int) -> dict:
+    """
+    Measure the OCR throughput of one backend.
+    
+    Args:
+        name: Backend name
+        images: Rendered pages
+        lang: OCR language
+        batch_size: Pages handed to the backend per call (a rendering window)
+        repeat: Number of passes over the pages
+        
+    Returns:
+        Dictionary with pages, seconds and pages per second
+    """
+    backend = get_backend(name)
+    
+    # Engine start-up counts against the backend: a persistent worker pays it
+    # once, the per-page backend pays it on every page.
+    start = time.perf_counter()
+    backend.warm_up(lang)
+    for _ in range(repeat):
+        for i in range(0, len(images), batch_size):
+            backend.recognize(images[i:i + batch_size], lang)
+    elapsed = time.perf_counter() - start
+    backend.close()
+    
+    pages = len(images) * repeat
+    return {
+        'backend': name,
+        'pages': pages,
+        'seconds': elapsed,
+        'pages_per_second': pages / elapsed if elapsed else 0.0
+    }
+
+
+def main():
+    """Main entry point for the OCR backend benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark OCR backends")
+    parser.add_argument("pdf_path", help="PDF file to OCR")
+    parser.add_argument("--pages", type=int, default=10, help="Number of pages to OCR")
+    parser.add_argument("--dpi", type=int, default=300, help="Rendering DPI")
+    parser.add_argument("--lang", default='eng', help="OCR language")
+    parser.add_argument("--batch-size", type=int, default=4, help="Pages per backend call")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the pages")
+    parser.add_argument("--backends", nargs='+', default=get_available_backends(),
+                        choices=get_available_backends(), help="Backends to compare")
+    
+    args = parser.parse_args()
+    
+    print(f"Rendering {args.pages} pages at {args.dpi} DPI...")
+    images = convert_from_path(args.pdf_path, dpi=args.dpi, first_page=1, last_page=args.pages)
+    
+    results = []
+    for name in args.backends:
+        try:
+            results.append(benchmark_backend(name, images, args.lang, args.batch_size, args.repeat))
+        except Exception as e:
+            print(f"Skipping backend {name}: {str(e)}")
+            
+    if not results:
+        sys.exit(1)
+        
+    baseline = next((r for r in results if r['backend'] == 'pytesseract'), results[0])
+    
+    print(f"\n{'backend':<12} {'pages':>6} {'seconds':>9} {'pages/s':>9} {'speedup':>8}")
+    print("-" * 48)
+    for result in results:
+        speedup = result['pages_per_second'] / baseline['pages_per_second'] if baseline['pages_per_second'] else 0.0
+        print(f"{result['backend']:<12} {result['pages']:>6} {result['seconds']:>9.2f} "
+              f"{result['pages_per_second']:>9.2f} {speedup:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Benchmark peak memory of pdfplumber extraction as page count grows.
+
+Each run extracts a synthetic text PDF in a fresh process and reports that
+process's peak RSS, with and without low-memory mode. Run from the repository
+root:
+
+    python -m benchmarks.pdfplumber_memory --pages 50 100 200 400
+"""
+import os
+import sys
+import random
+import resource
+import argparse
+import tempfile
+import multiprocessing
+from benchmarks.corpus import build_document
+
+
+def _peak_rss_worker(pdf_path: str, config: dict) -> int:
+    """Extract a PDF and return this process's peak RSS in bytes."""
+    from src.extractors.pdf_plumber_extractor import PDFPlumberExtractor
+    
+    PDFPlumberExtractor(config).extract_all(pdf_path)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def measure_peak_rss(pdf_path: str, config: dict) -> int:
+    """
+    Measure peak RSS of one extraction in a fresh process.
+    
+    Args:
+        pdf_path: PDF to extract
+        config: PDFPlumberExtractor configuration
+        
+    Returns:
+        Peak resident set size in bytes
+    """
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(_peak_rss_worker, (pdf_path, config))
+
+
+def main():
+    """Main entry point for the pdfplumber memory benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark pdfplumber peak memory by page count")
+    parser.add_argument("--pages", type=int, nargs='+', default=[50, 100, 200, 400],
+                        help="Page counts to test")
+    parser.add_argument("--text-mode", choices=['default', 'simple'], default='default',
+                        help="Text extraction mode for low-memory runs")
+    
+    args = parser.parse_args()
+    
+    modes = [
+        ('default', {}),
+        ('low_memory', {'low_memory': True, 'text_mode': args.text_mode})
+    ]
+    
+    print(f"{'pages':>6}  " + "  ".join(f"{name:>14}" for name, _ in modes))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for pages in args.pages:
+            pdf_path = os.path.join(temp_dir, f"text_{pages}.pdf")
+            pdf, _, _ = build_document('text', random.Random(pages), pages)
+            pdf.write(pdf_path)
+            
+            peaks = [measure_peak_rss(pdf_path, config) for _, config in modes]
+            print(f"{pages:>6}  " + "  ".join(f"{peak / (1024 * 1024):>11.1f} MB" for peak in peaks))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
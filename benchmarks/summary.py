@@ -0,0 +1,47 @@
+"""
+Benchmark TextRank sentence ranking as documents grow.
+
+Sentences are generated with the corpus prose generator and ranked by
+ContentAnalyzer._rank_sentences. The time per sentence should stay roughly
+flat, since each sentence is only compared within a window; --window 0
+compares every pair instead, for reference on small sizes. Run from the
+repository root:
+
+    python -m benchmarks.summary --sentences 1000 10000 50000
+"""
+import time
+import random
+import argparse
+from benchmarks.corpus import _sentence
+from src.processors.content_analyzer import ContentAnalyzer
+
+
+# A short stopword list, so the benchmark needs no NLTK data
+STOP_WORDS = frozenset(['the', 'and', 'for', 'are', 'was', 'were', 'with', 'that', 'this', 'from'])
+
+
+def main():
+    """Main entry point for the summary benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TextRank sentence ranking")
+    parser.add_argument("--sentences", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="Sentence counts to rank")
+    parser.add_argument("--window", type=int, default=50, help="Ranking window; 0 compares all pairs")
+    
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    print(f"{'sentences':>10} {'seconds':>9} {'us/sentence':>12}")
+    
+    for count in args.sentences:
+        sentences = [_sentence(rng) for _ in range(count)]
+        analyzer = ContentAnalyzer({'summary_window': args.window})
+        
+        start = time.perf_counter()
+        analyzer._rank_sentences(sentences, STOP_WORDS)
+        seconds = time.perf_counter() - start
+        
+        print(f"{count:>10} {seconds:>9.2f} {seconds / count * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
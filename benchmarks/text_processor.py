@@ -0,0 +1,197 @@
+"""
+Benchmark TextProcessor against the previous two-pass implementation.
+
+The previous implementation cleaned the full text and then every page
+again, applying character replacements one at a time with regexes compiled
+from string literals. It is kept here as the reference, and the current
+output is checked to be identical. With --stream, the streaming cleaner is
+compared with cleaning the whole text for peak memory instead, and with
+--headers, cross-page header/footer removal is timed on pages with running
+headers and footers. Run from the repository root:
+
+    python -m benchmarks.text_processor --pages 2000
+    python -m benchmarks.text_processor --pages 2000 --stream --chunk-size 65536
+    python -m benchmarks.text_processor --pages 1000 --headers
+"""
+import re
+import time
+import tracemalloc
+import random
+import argparse
+from typing import Dict, Iterator
+from benchmarks.corpus import _prose_lines
+from src.models.document import Document
+from src.models.extraction_result import ExtractionResult
+from src.processors.text_processor import TextProcessor
+
+
+_REPLACEMENTS = {
+    '‘': "'", '’': "'", '“': '"', '”': '"', '–': '-', '—': '--',
+    ' ': ' ', '­': '-', '·': '*', '': '*', '•': '*', '…': '...',
+    '©': '(c)', '®': '(R)'
+}
+
+
+def legacy_clean_text(text: str) -> str:
+    """Clean text the way TextProcessor did before, with default settings."""
+    if not text:
+        return text
+    
+    for orig, repl in _REPLACEMENTS.items():
+        text = text.replace(orig, repl)
+    
+    text = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', text)
+    text = re.sub(r'(\w)\s*\n\s*(\w)', r'\1 \2', text)
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    
+    text = re.sub(r' +', ' ', text)
+    text = re.sub(r'\n ', '\n', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def make_pages(pages: int, seed: int = 0) -> Dict[int, str]:
+    """
+    Generate raw extracted-looking pages: wrapped prose with hyphenated line
+    ends, typographic quotes and dashes, and ragged spacing.
+    
+    Args:
+        pages: Number of pages
+        seed: Random seed
+        
+    Returns:
+        Dictionary mapping page numbers to text
+    """
+    rng = random.Random(seed)
+    decorations = ['“quoted”', 'it’s', '–', '—', '•', '…', ' ']
+    text_by_page = {}
+    
+    for page_num in range(pages):
+        lines = []
+        for line in _prose_lines(rng, 50):
+            if rng.random() < 0.2:
+                line = line + " " + rng.choice(decorations)
+            if rng.random() < 0.1:
+                line = line[:-3] + "-"
+            lines.append(line + " " * rng.randint(0, 3))
+        text_by_page[page_num] = "\n".join(lines)
+    
+    return text_by_page
+
+
+def iter_pages(pages: int, seed: int = 0) -> Iterator[str]:
+    """Generate the pages of make_pages one at a time, without keeping them."""
+    for page_num in range(pages):
+        yield make_pages(1, seed + page_num)[0]
+
+
+def benchmark_stream(pages: int, chunk_size: int):
+    """
+    Compare peak memory of streaming cleaning with cleaning the whole text.
+    
+    Args:
+        pages: Pages in the generated document
+        chunk_size: Chunk size for the streaming cleaner
+    """
+    processor = TextProcessor()
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    characters = 0
+    stream_digest = 0
+    for chunk in processor.clean_stream(iter_pages(pages), chunk_size=chunk_size):
+        characters += len(chunk)
+        stream_digest = hash((stream_digest, chunk))
+    stream_seconds = time.perf_counter() - start
+    stream_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    whole_text = processor._clean_text(ExtractionResult.join_pages(iter_pages(pages)))
+    whole_seconds = time.perf_counter() - start
+    whole_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    stream_text = "".join(processor.clean_stream(iter_pages(pages), chunk_size=chunk_size))
+    print(f"Document: {pages} pages, {characters / 1e6:.1f} M cleaned characters")
+    print(f"Whole text: {whole_seconds:.3f} s, peak {whole_peak / 1e6:.1f} MB")
+    print(f"Streaming:  {stream_seconds:.3f} s, peak {stream_peak / 1e6:.1f} MB "
+          f"(chunk size {chunk_size})")
+    print(f"Identical output: {stream_text == whole_text}")
+
+
+def benchmark_headers(pages: int, repeat: int):
+    """
+    Time header/footer removal on pages with a running header and footer.
+    
+    Args:
+        pages: Pages in the generated document
+        repeat: Runs; the best is kept
+    """
+    text_by_page = {
+        n: f"Annual Report 2023 - Section {n // 20 + 1}\n{text}\nPage {n + 1} of {pages}"
+        for n, text in make_pages(pages).items()
+    }
+    processor = TextProcessor()
+    
+    best = float('inf')
+    for _ in range(repeat):
+        stripped = dict(text_by_page)
+        start = time.perf_counter()
+        processor._remove_headers_footers(stripped)
+        best = min(best, time.perf_counter() - start)
+    
+    removed = sum(text.count("\n") for text in text_by_page.values()) - \
+        sum(text.count("\n") for text in stripped.values())
+    print(f"Document: {pages} pages")
+    print(f"Header/footer removal: {best * 1000:.1f} ms, {removed} lines removed "
+          f"({2 * pages} expected)")
+
+
+def main():
+    """Main entry point for the TextProcessor benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TextProcessor cleaning")
+    parser.add_argument("--pages", type=int, default=2000, help="Pages in the generated document")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation; the best is kept")
+    parser.add_argument("--stream", action="store_true", help="Compare streaming cleaning memory instead")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="Chunk size for --stream")
+    parser.add_argument("--headers", action="store_true", help="Time header/footer removal instead")
+    
+    args = parser.parse_args()
+    
+    if args.stream:
+        benchmark_stream(args.pages, args.chunk_size)
+        return
+    if args.headers:
+        benchmark_headers(args.pages, args.repeat)
+        return
+    
+    text_by_page = make_pages(args.pages)
+    extracted_text = ExtractionResult.join_pages(text_by_page[n] for n in sorted(text_by_page))
+    print(f"Document: {args.pages} pages, {len(extracted_text) / 1e6:.1f} M characters")
+    
+    legacy_seconds = float('inf')
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        legacy_text = legacy_clean_text(extracted_text)
+        legacy_pages = {n: legacy_clean_text(text) for n, text in text_by_page.items()}
+        legacy_seconds = min(legacy_seconds, time.perf_counter() - start)
+    
+    # The previous implementation had no cross-page header/footer removal
+    processor = TextProcessor({'remove_headers_footers': False})
+    current_seconds = float('inf')
+    for _ in range(args.repeat):
+        document = Document(path="", filename="", extracted_text=extracted_text, text_by_page=dict(text_by_page))
+        start = time.perf_counter()
+        processor.process(document)
+        current_seconds = min(current_seconds, time.perf_counter() - start)
+    
+    identical = document.extracted_text == legacy_text and document.text_by_page == legacy_pages
+    print(f"Previous: {legacy_seconds:.3f} s")
+    print(f"Current:  {current_seconds:.3f} s ({legacy_seconds / current_seconds:.2f}x)")
+    print(f"Identical output: {identical}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
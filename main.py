@@ -1,11 +1,13 @@
 import os
 import sys
 import argparse
+from src.extractors.base_extractor import BaseExtractor
 from src.extractors.extractor_factory import ExtractorFactory
 from src.models.document import Document
 
 
-def process_pdf(pdf_path: str, extractor_type: str = 'auto', output_dir: str = None):
+def process_pdf(pdf_path: str, extractor_type: str = 'auto', output_dir: str = None,
+                extractor_config: dict = None, extractor: BaseExtractor = None):
     """
     Process a PDF file: extract text and save results.
     
@@ -13,19 +15,28 @@ def process_pdf(pdf_path: str, extractor_type: str = 'auto', output_dir: str = N
         pdf_path: Path to the PDF file
         extractor_type: Type of extractor to use
         output_dir: Directory to save output files
+        extractor_config: Optional configuration for the extractor
+        extractor: Extractor to reuse across files; the caller closes it. If
+            None, one is created from extractor_type and extractor_config for
+            this file and closed afterwards
         
     Returns:
         Document object with extracted contents
     """
     print(f"Processing PDF: {pdf_path}")
     
-    # Create extractor
-    extractor = ExtractorFactory.create_extractor(extractor_type)
-    
-    # Extract text and metadata
-    extracted_text = extractor.extract_text(pdf_path)
-    text_by_page = extractor.extract_text_by_page(pdf_path)
-    metadata = extractor.get_metadata(pdf_path)
+    # Extract text and metadata in a single pass
+    if extractor is None:
+        extractor = ExtractorFactory.create_extractor(extractor_type, extractor_config)
+        try:
+            result = extractor.extract_all(pdf_path)
+        finally:
+            extractor.close()
+    else:
+        result = extractor.extract_all(pdf_path)
+    extracted_text = result.extracted_text
+    text_by_page = result.text_by_page
+    metadata = result.metadata
     
     # Create document object
     filename = os.path.basename(pdf_path)
@@ -35,9 +46,13 @@ def process_pdf(pdf_path: str, extractor_type: str = 'auto', output_dir: str = N
         extracted_text=extracted_text,
         text_by_page=text_by_page,
         metadata=metadata,
-        extraction_method=extractor_type
+        extraction_method=extractor_type,
+        errors=result.errors
     )
     
+    for error in doc.errors:
+        print(f"Error extracting {filename} ({error.kind}): {error.message}")
+    
     # Save extracted text if output directory is specified
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
@@ -66,21 +81,41 @@ def main():
     parser.add_argument("--extractor", choices=ExtractorFactory.get_available_extractors(),
                         default='auto', help="Extraction method to use")
     parser.add_argument("--output", help="Output directory for extracted text")
+    parser.add_argument("--cache-dir", help="Directory for caching extraction results")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="Extraction cache budget in megabytes")
+    parser.add_argument("--sandbox", action="store_true",
+                        help="Run each extraction in an isolated worker process")
+    parser.add_argument("--timeout", type=int, default=120,
+                        help="Per-document time limit in seconds when sandboxed")
+    parser.add_argument("--max-memory", type=int, default=2048,
+                        help="Worker memory limit in megabytes when sandboxed")
     
     args = parser.parse_args()
     
+    extractor_config = {}
+    if args.cache_dir:
+        extractor_config['cache'] = {'dir': args.cache_dir, 'max_bytes': args.cache_size * 1024 * 1024}
+    if args.sandbox:
+        extractor_config['sandbox'] = {'enabled': True, 'timeout': args.timeout, 'max_memory_mb': args.max_memory}
+    
     # Process single file or directory
     if os.path.isdir(args.pdf_path):
         # Process all PDFs in directory
         pdf_files = [os.path.join(args.pdf_path, f) for f in os.listdir(args.pdf_path)
                     if f.lower().endswith('.pdf')]
         
-        for pdf_file in pdf_files:
-            try:
-                doc = process_pdf(pdf_file, args.extractor, args.output)
-                print(f"Successfully processed: {doc.filename}, {doc.page_count} pages")
-            except Exception as e:
-                print(f"Error processing {pdf_file}: {str(e)}")
+        # One extractor for all files, so sandbox workers and OCR pools are reused
+        extractor = ExtractorFactory.create_extractor(args.extractor, extractor_config)
+        try:
+            for pdf_file in pdf_files:
+                try:
+                    doc = process_pdf(pdf_file, args.extractor, args.output, extractor=extractor)
+                    print(f"Successfully processed: {doc.filename}, {doc.page_count} pages")
+                except Exception as e:
+                    print(f"Error processing {pdf_file}: {str(e)}")
+        finally:
+            extractor.close()
     else:
         # Process single PDF file
         if not os.path.isfile(args.pdf_path):
@@ -88,7 +123,7 @@ def main():
             sys.exit(1)
         
         try:
-            doc = process_pdf(args.pdf_path, args.extractor, args.output)
+            doc = process_pdf(args.pdf_path, args.extractor, args.output, extractor_config)
             print(f"Successfully processed: {doc.filename}, {doc.page_count} pages")
             
             # Print sample of extracted text
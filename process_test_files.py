@@ -42,9 +42,13 @@ def process_test_files():
                 
                 # Extract text
                 print("Extracting text...")
-                extracted_text = extractor.extract_text(test_file)
-                text_by_page = extractor.extract_text_by_page(test_file)
-                metadata = extractor.get_metadata(test_file)
+                try:
+                    result = extractor.extract_all(test_file)
+                finally:
+                    extractor.close()
+                extracted_text = result.extracted_text
+                text_by_page = result.text_by_page
+                metadata = result.metadata
                 
                 # Create document
                 doc = Document(
@@ -53,9 +57,13 @@ def process_test_files():
                     extracted_text=extracted_text,
                     text_by_page=text_by_page,
                     metadata=metadata,
-                    extraction_method=extractor_type
+                    extraction_method=extractor_type,
+                    errors=result.errors
                 )
                 
+                for error in doc.errors:
+                    print(f"Error extracting {doc.filename} ({error.kind}): {error.message}")
+                
                 # Process document
                 print("Processing text...")
                 processors = ProcessorFactory.create_default_processors()
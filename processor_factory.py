@@ -1,8 +1,14 @@
 from typing import Dict, Any, Optional, List
 from src.processors.base_processor import BaseProcessor
-from src.processors.text_processor import TextProcessor
-from src.processors.content_analyzer import ContentAnalyzer
-from src.processors.entity_extractor import EntityExtractor
+from src.utils.registry import PluginRegistry
+
+
+# Processors by type, imported on first use (the content analyzer pulls in
+# NLTK). Third-party processors register under 'scoreme.processors'.
+processor_registry = PluginRegistry('scoreme.processors')
+processor_registry.register('text', 'src.processors.text_processor:TextProcessor')
+processor_registry.register('content', 'src.processors.content_analyzer:ContentAnalyzer')
+processor_registry.register('entity', 'src.processors.entity_extractor:EntityExtractor')
 
 
 class ProcessorFactory:
@@ -14,7 +20,8 @@ class ProcessorFactory:
         Create a processor instance based on the specified type.
         
         Args:
-            processor_type: Type of processor to create ('text', 'content', 'entity')
+            processor_type: Type of processor to create ('text', 'content', 'entity'
+                or a plugin type)
             config: Optional configuration parameters
             
         Returns:
@@ -25,14 +32,12 @@ class ProcessorFactory:
         """
         config = config or {}
         
-        if processor_type == 'text':
-            return TextProcessor(config)
-        elif processor_type == 'content':
-            return ContentAnalyzer(config)
-        elif processor_type == 'entity':
-            return EntityExtractor(config)
-        else:
+        try:
+            processor_class = processor_registry.load(processor_type)
+        except KeyError:
             raise ValueError(f"Unsupported processor type: {processor_type}")
+            
+        return processor_class(config)
     
     @staticmethod
     def create_default_processors(config: Optional[Dict[str, Any]] = None) -> List[BaseProcessor]:
@@ -50,17 +55,17 @@ class ProcessorFactory:
         entity_config = config.get('entity_extractor', {}) if config else {}
         
         return [
-            TextProcessor(text_config),        # First clean the text
-            ContentAnalyzer(content_config),   # Then analyze content
-            EntityExtractor(entity_config)     # Finally extract entities
+            ProcessorFactory.create_processor('text', text_config),        # First clean the text
+            ProcessorFactory.create_processor('content', content_config),  # Then analyze content
+            ProcessorFactory.create_processor('entity', entity_config)     # Finally extract entities
         ]
     
     @staticmethod
     def get_available_processors() -> list:
         """
-        Get a list of available processor types.
+        Get a list of available processor types, without importing them.
         
         Returns:
-            List of available processor type names
+            List of available processor type names, including plugins
         """
-        return ['text', 'content', 'entity']
\ No newline at end of file
+        return processor_registry.names()
\ No newline at end of file
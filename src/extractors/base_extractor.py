@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+from ..models.extraction_result import ExtractionResult
+from ..utils.pdf_source import PDFSource
 
 
 class BaseExtractor(ABC):
@@ -15,12 +17,12 @@ class BaseExtractor(ABC):
         self.config = config or {}
     
     @abstractmethod
-    def extract_text(self, pdf_path: str) -> str:
+    def extract_text(self, pdf_path: PDFSource) -> str:
         """
         Extract text from a PDF file.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Extracted text as a string
@@ -28,26 +30,86 @@ class BaseExtractor(ABC):
         pass
     
     @abstractmethod
-    def extract_text_by_page(self, pdf_path: str) -> Dict[int, str]:
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
         """
         Extract text from a PDF file, organized by page.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary mapping page numbers (0-indexed) to extracted text
         """
         pass
     
-    def get_metadata(self, pdf_path: str) -> Dict[str, Any]:
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
         Extract metadata from a PDF file.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary containing metadata fields
         """
-        return {}  # Default implementation returns empty metadata
\ No newline at end of file
+        return {}  # Default implementation returns empty metadata
+    
+    def close(self) -> None:
+        """
+        Release long-lived resources such as worker processes.
+        
+        Wrapping extractors forward this to the extractors they wrap.
+        """
+        pass
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract page texts, full text and metadata from a PDF file.
+        
+        Extractors should override this to read everything from a single
+        parse; the default falls back to the individual methods.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with page texts, joined text and metadata
+        """
+        text_by_page = self.extract_text_by_page(pdf_path)
+        return ExtractionResult.from_pages(text_by_page, self.get_metadata(pdf_path))
+    
+    def iter_pages(self, pdf_path: PDFSource, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text page by page.
+        
+        Extractors should override this to parse one page at a time; the
+        default falls back to extract_text_by_page.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            pages: Page numbers (0-indexed) to extract, e.g. a range; all pages if None
+            
+        Yields:
+            Tuples of (page number (0-indexed), extracted text) in page order
+        """
+        pages_text = self.extract_text_by_page(pdf_path)
+        
+        for page_num in self._select_pages(len(pages_text), pages):
+            yield page_num, pages_text.get(page_num, "")
+    
+    @staticmethod
+    def _select_pages(page_count: int, pages: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Resolve a page selection against the document's page count.
+        
+        Args:
+            page_count: Number of pages in the document
+            pages: Page numbers (0-indexed) to select; all pages if None
+            
+        Returns:
+            Sorted, de-duplicated page numbers that exist in the document
+        """
+        if pages is None:
+            return list(range(page_count))
+            
+        return sorted({page_num for page_num in pages if 0 <= page_num < page_count})
\ No newline at end of file
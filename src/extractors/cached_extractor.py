@@ -0,0 +1,186 @@
+import json
+import zlib
+import hashlib
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from .base_extractor import BaseExtractor
+from ..models.extraction_result import ExtractionResult
+from ..utils.pdf_source import PDFSource, check_source, source_digest
+from ..utils.cache import DiskCache, DEFAULT_MAX_BYTES
+
+
+# Configuration keys that change how fast an extractor runs but not what it
+# returns; they are left out of the cache key so tuning them keeps hits.
+_NON_OUTPUT_KEYS = {'cache', 'sandbox', 'workers', 'window_size', 'max_pages_in_memory'}
+
+
+def _output_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip performance-only keys from an extractor configuration."""
+    return {
+        key: _output_config(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+        if key not in _NON_OUTPUT_KEYS
+    }
+
+
+def _int_keys(pairs):
+    """JSON object hook restoring integer page-number keys."""
+    return {int(key) if key.isdigit() else key: value for key, value in pairs}
+
+
+class CachedExtractor(BaseExtractor):
+    """Extractor wrapper that caches extraction results on disk by content hash."""
+    
+    def __init__(self, extractor: BaseExtractor, extractor_type: str, config: Dict[str, Any] = None):
+        """
+        Initialize the cached extractor.
+        
+        Args:
+            extractor: Extractor to wrap
+            extractor_type: Name of the wrapped extractor type, part of the cache key
+            config: Extractor configuration; its 'cache' section may include:
+                - dir: Cache directory (required)
+                - max_bytes: Byte budget for the cache (default: 1 GiB)
+        """
+        super().__init__(config)
+        cache_config = self.config.get('cache', {})
+        
+        self.extractor = extractor
+        self.extractor_type = extractor_type
+        self.cache = DiskCache(cache_config['dir'], cache_config.get('max_bytes', DEFAULT_MAX_BYTES))
+        
+        self._config_key = json.dumps(_output_config(self.config), sort_keys=True, default=str)
+    
+    def extract_text(self, pdf_path: PDFSource) -> str:
+        """
+        Extract all text from a PDF file, reusing a cached result when available.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Extracted text as a string
+        """
+        return self.extract_all(pdf_path).extracted_text
+    
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
+        """
+        Extract text by page from a PDF file, reusing a cached result when available.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary mapping page numbers (0-indexed) to extracted text
+        """
+        return self.extract_all(pdf_path).text_by_page
+    
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
+        """
+        Extract metadata from a PDF file, reusing a cached result when available.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary containing metadata fields
+        """
+        check_source(pdf_path)
+            
+        cached = self._load(self._cache_key(pdf_path))
+        if cached is not None:
+            return cached.metadata
+            
+        return self.extractor.get_metadata(pdf_path)
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract page texts, full text and metadata, skipping parsing on a cache hit.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with page texts, joined text and metadata
+        """
+        check_source(pdf_path)
+            
+        key = self._cache_key(pdf_path)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+            
+        result = self.extractor.extract_all(pdf_path)
+        
+        # Failed or partly failed extractions carry errors; never cache those
+        if result.metadata and not result.errors:
+            self._store(key, result)
+            
+        return result
+    
+    def iter_pages(self, pdf_path: PDFSource, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text page by page, serving pages from the cache on a hit.
+        
+        On a miss the wrapped extractor streams the pages; partial results are
+        not cached.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            pages: Page numbers (0-indexed) to extract, e.g. a range; all pages if None
+            
+        Yields:
+            Tuples of (page number (0-indexed), extracted text) in page order
+        """
+        check_source(pdf_path)
+            
+        cached = self._load(self._cache_key(pdf_path))
+        if cached is None:
+            yield from self.extractor.iter_pages(pdf_path, pages)
+            return
+            
+        for page_num in self._select_pages(len(cached.text_by_page), pages):
+            yield page_num, cached.text_by_page[page_num]
+    
+    def close(self) -> None:
+        """Release the wrapped extractor's resources."""
+        self.extractor.close()
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the underlying cache."""
+        return self.cache.stats
+    
+    def _cache_key(self, pdf_path: PDFSource) -> str:
+        """Build the cache key from the PDF contents, extractor type and configuration."""
+        key = hashlib.sha256()
+        key.update(source_digest(pdf_path).encode())
+        key.update(b'\0' + self.extractor_type.encode())
+        key.update(b'\0' + self._config_key.encode())
+        return key.hexdigest()
+    
+    def _load(self, key: str):
+        """Read a cached result, or None on a miss or unreadable entry."""
+        data = self.cache.get(key)
+        if data is None:
+            return None
+            
+        try:
+            entry = json.loads(zlib.decompress(data).decode('utf-8'), object_pairs_hook=_int_keys)
+        except (zlib.error, ValueError) as e:
+            print(f"Error reading extraction cache entry: {str(e)}")
+            return None
+            
+        return ExtractionResult.from_pages(entry['text_by_page'], entry['metadata'])
+    
+    def _store(self, key: str, result: ExtractionResult) -> None:
+        """Write a result to the cache; the full text is derived again on load."""
+        entry = {
+            'text_by_page': result.text_by_page,
+            'metadata': result.metadata
+        }
+        
+        try:
+            data = zlib.compress(json.dumps(entry, default=str).encode('utf-8'))
+            self.cache.put(key, data)
+        except OSError as e:
+            print(f"Error writing extraction cache entry: {str(e)}")
\ No newline at end of file
@@ -1,8 +1,19 @@
 from typing import Dict, Any, Optional
 from src.extractors.base_extractor import BaseExtractor
-from src.extractors.pypdf_extractor import PyPDFExtractor
-from src.extractors.pdf_plumber_extractor import PDFPlumberExtractor
-from src.extractors.ocr_extractor import OCRExtractor
+from src.utils.registry import PluginRegistry
+
+
+# Extractors by type. Each backend module (and the PDF libraries it uses) is
+# only imported when an extractor of that type is first created. Third-party
+# engines register under the 'scoreme.extractors' entry point group.
+extractor_registry = PluginRegistry('scoreme.extractors')
+extractor_registry.register('pypdf', 'src.extractors.pypdf_extractor:PyPDFExtractor')
+extractor_registry.register('pdfplumber', 'src.extractors.pdf_plumber_extractor:PDFPlumberExtractor')
+extractor_registry.register('ocr', 'src.extractors.ocr_extractor:OCRExtractor')
+# Text layer where usable, OCR for empty or garbage pages
+extractor_registry.register('auto', 'src.extractors.hybrid_extractor:HybridExtractor')
+# Race the text-layer engines and keep the first good result
+extractor_registry.register('hedged', 'src.extractors.hedged_extractor:HedgedExtractor')
 
 
 class ExtractorFactory:
@@ -14,8 +25,12 @@ class ExtractorFactory:
         Create an extractor instance based on the specified type.
         
         Args:
-            extractor_type: Type of extractor to create ('pypdf', 'pdfplumber', 'ocr', 'auto')
-            config: Optional configuration parameters
+            extractor_type: Type of extractor to create ('pypdf', 'pdfplumber', 'ocr', 'auto',
+                'hedged' or a plugin type)
+            config: Optional configuration parameters; a 'cache' section with a
+                'dir' entry wraps the extractor in an on-disk result cache, and
+                a 'sandbox' section with 'enabled' set runs extraction in an
+                isolated, resource-limited worker process
             
         Returns:
             An instance of the requested extractor
@@ -25,24 +40,32 @@ class ExtractorFactory:
         """
         config = config or {}
         
-        if extractor_type == 'pypdf':
-            return PyPDFExtractor(config)
-        elif extractor_type == 'pdfplumber':
-            return PDFPlumberExtractor(config)
-        elif extractor_type == 'ocr':
-            return OCRExtractor(config)
-        elif extractor_type == 'auto':
-            # Auto selection based on PDF content
-            return PyPDFExtractor(config)  # Default for now
+        if config.get('sandbox', {}).get('enabled'):
+            if extractor_type not in extractor_registry.names():
+                raise ValueError(f"Unsupported extractor type: {extractor_type}")
+            # The worker process imports and creates the extractor itself, so
+            # its engine is never loaded here
+            from src.extractors.sandboxed_extractor import SandboxedExtractor
+            extractor = SandboxedExtractor(extractor_type, config)
         else:
-            raise ValueError(f"Unsupported extractor type: {extractor_type}")
+            try:
+                extractor_class = extractor_registry.load(extractor_type)
+            except KeyError:
+                raise ValueError(f"Unsupported extractor type: {extractor_type}")
+            extractor = extractor_class(config)
+            
+        if config.get('cache', {}).get('dir'):
+            from src.extractors.cached_extractor import CachedExtractor
+            extractor = CachedExtractor(extractor, extractor_type, config)
+            
+        return extractor
     
     @staticmethod
     def get_available_extractors() -> list:
         """
-        Get a list of available extractor types.
+        Get a list of available extractor types, without importing them.
         
         Returns:
-            List of available extractor type names
+            List of available extractor type names, including plugins
         """
-        return ['pypdf', 'pdfplumber', 'ocr', 'auto']
\ No newline at end of file
+        return extractor_registry.names()
\ No newline at end of file
@@ -0,0 +1,207 @@
+import time
+import queue
+import multiprocessing
+from typing import Dict, Any, List, Optional, Tuple
+from .base_extractor import BaseExtractor
+from .pypdf_extractor import PyPDFExtractor
+from .pdf_plumber_extractor import PDFPlumberExtractor
+from ..models.extraction_result import ExtractionResult, ExtractionError
+from ..utils.pdf_source import PDFSource, check_source, pdf_source_path
+
+
+# Engines that can take part in a race
+_ENGINES = {
+    'pypdf': PyPDFExtractor,
+    'pdfplumber': PDFPlumberExtractor
+}
+
+
+def _run_engine(engine: str, config: Dict[str, Any], pdf_path: str, results) -> None:
+    """
+    Run one engine in a child process and report its result.
+    
+    Args:
+        engine: Engine name
+        config: Configuration for the engine's extractor
+        pdf_path: Path to the PDF file
+        results: Queue receiving (engine, text_by_page, metadata, elapsed seconds, errors)
+    """
+    start = time.perf_counter()
+    try:
+        result = _ENGINES[engine](config).extract_all(pdf_path)
+        results.put((engine, result.text_by_page, result.metadata, time.perf_counter() - start, result.errors))
+    except Exception as e:
+        print(f"Error extracting with {engine}: {str(e)}")
+        results.put((engine, {}, {}, time.perf_counter() - start, [ExtractionError.from_exception(e, engine)]))
+
+
+class HedgedExtractor(BaseExtractor):
+    """PDF text extractor that races several engines and keeps the first good result."""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the hedged extractor.
+        
+        Args:
+            config: Configuration dictionary that may include:
+                - engines: Engines to race (default: ['pypdf', 'pdfplumber'])
+                - deadline: Seconds to wait for an acceptable result before
+                  giving up on the slower engines (default: 30)
+                - min_text_ratio: Minimum share of pages with text for a result
+                  to be accepted (default: 0.5)
+                - pypdf, pdfplumber: Configuration for each engine's extractor
+        """
+        super().__init__(config)
+        self.engines = self.config.get('engines', ['pypdf', 'pdfplumber'])
+        self.deadline = self.config.get('deadline', 30)
+        self.min_text_ratio = self.config.get('min_text_ratio', 0.5)
+        
+        for engine in self.engines:
+            if engine not in _ENGINES:
+                raise ValueError(f"Unsupported hedging engine: {engine}")
+    
+    def extract_text(self, pdf_path: PDFSource) -> str:
+        """
+        Extract all text from a PDF file with the fastest acceptable engine.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Extracted text as a string
+        """
+        return self.extract_all(pdf_path).extracted_text
+    
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
+        """
+        Extract text from a PDF file, organized by page, with the fastest acceptable engine.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary mapping page numbers (0-indexed) to extracted text
+        """
+        return self.extract_all(pdf_path).text_by_page
+    
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
+        """
+        Extract metadata from a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary containing metadata fields
+        """
+        return PyPDFExtractor(self.config.get('pypdf', {})).get_metadata(pdf_path)
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Race the configured engines and return the first acceptable result.
+        
+        Each engine runs in its own process. The first result that passes the
+        quality check wins and the remaining engines are terminated. If none
+        passes before the deadline, the best result received so far is used.
+        The metadata records the winning engine as 'hedge_winner' and its
+        run time as 'hedge_seconds'.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with the winning engine's text, metadata and
+            errors; if no engine returned in time it is empty and carries a
+            'timeout' ExtractionError, and if the engines could not be
+            started it carries the error that stopped them
+        """
+        check_source(pdf_path)
+        
+        try:
+            with pdf_source_path(pdf_path) as path:
+                winner = self._race(path)
+        except Exception as e:
+            print(f"Error starting hedged extraction: {str(e)}")
+            return ExtractionResult(errors=[ExtractionError.from_exception(e, 'hedged')])
+        
+        if winner is None:
+            message = f"No engine finished within {self.deadline} seconds"
+            return ExtractionResult(errors=[ExtractionError('timeout', message, 'hedged')])
+        
+        engine, text_by_page, metadata, elapsed, errors = winner
+        metadata = dict(metadata, hedge_winner=engine, hedge_seconds=round(elapsed, 3))
+        result = ExtractionResult.from_pages(text_by_page, metadata)
+        result.errors = errors
+        return result
+    
+    def _race(self, pdf_path: str) -> Optional[Tuple[str, Dict[int, str], Dict[str, Any], float,
+                                                     List[ExtractionError]]]:
+        """
+        Run all engines concurrently and pick a result.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Winning (engine, text_by_page, metadata, elapsed, errors) tuple, or None if
+            no engine returned in time
+        """
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        processes = [
+            context.Process(target=_run_engine, args=(engine, self.config.get(engine, {}), pdf_path, results),
+                            daemon=True)
+            for engine in self.engines
+        ]
+        
+        received: List[Tuple[str, Dict[int, str], Dict[str, Any], float, List[ExtractionError]]] = []
+        deadline = time.monotonic() + self.deadline
+        
+        try:
+            for process in processes:
+                process.start()
+            
+            while len(received) < len(processes):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    result = results.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                
+                if self._is_acceptable(result[1]):
+                    return result
+                received.append(result)
+        finally:
+            # Only processes that were started can be stopped; a failed start
+            # must not be hidden by an error from joining the others
+            for process in processes:
+                if process.pid is None:
+                    continue
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            results.close()
+        
+        if not received:
+            return None
+        
+        # Nothing passed the quality check: keep whichever found the most text
+        return max(received, key=lambda result: sum(len(text.strip()) for text in result[1].values()))
+    
+    def _is_acceptable(self, text_by_page: Dict[int, str]) -> bool:
+        """
+        Check whether an engine's result is good enough to stop the race.
+        
+        Args:
+            text_by_page: Extracted text by page
+            
+        Returns:
+            True if enough pages contain text
+        """
+        if not text_by_page:
+            return False
+        
+        pages_with_text = sum(1 for text in text_by_page.values() if text.strip())
+        return pages_with_text / len(text_by_page) >= self.min_text_ratio
\ No newline at end of file
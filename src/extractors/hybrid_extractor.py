@@ -0,0 +1,186 @@
+import re
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from .base_extractor import BaseExtractor
+from .pypdf_extractor import PyPDFExtractor
+from .ocr_extractor import OCRExtractor
+from ..models.extraction_result import ExtractionResult, ExtractionError
+from ..utils.pdf_source import PDFSource, check_source
+
+
+# Characters that do not belong in ordinary extracted text. A text layer made
+# mostly of these (unmapped glyphs, replacement characters, private-use code
+# points) is treated as garbage.
+_GARBAGE_CHARS = re.compile(r"[^\w\s.,;:!?'\"()\[\]{}<>\-/\\&%$@#*+=|~^`]")
+
+# Unmapped glyph references some producers leave in the text layer
+_CID_MARKER = re.compile(r"\(cid:\d+\)")
+
+
+class HybridExtractor(BaseExtractor):
+    """PDF text extractor that reads the text layer and OCRs only pages without one."""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the hybrid extractor.
+        
+        Args:
+            config: Configuration dictionary that may include:
+                - min_text_chars: Minimum non-whitespace characters for a page's
+                  text layer to be used (default: 20)
+                - min_valid_ratio: Minimum share of ordinary characters in a
+                  page's text layer (default: 0.8)
+                - pypdf: Configuration for the text-layer extractor
+                - ocr: Configuration for the OCR extractor
+        """
+        super().__init__(config)
+        self.min_text_chars = self.config.get('min_text_chars', 20)
+        self.min_valid_ratio = self.config.get('min_valid_ratio', 0.8)
+        
+        self.text_extractor = PyPDFExtractor(self.config.get('pypdf', {}))
+        self.ocr_extractor = OCRExtractor(self.config.get('ocr', {}))
+    
+    def extract_text(self, pdf_path: PDFSource) -> str:
+        """
+        Extract all text from a PDF file, using OCR only where needed.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Extracted text as a string
+        """
+        return self.extract_all(pdf_path).extracted_text
+    
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
+        """
+        Extract text from a PDF file, organized by page, using OCR only where needed.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary mapping page numbers (0-indexed) to extracted text
+        """
+        return self.extract_all(pdf_path).text_by_page
+    
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
+        """
+        Extract metadata from a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary containing metadata fields
+        """
+        return self.text_extractor.get_metadata(pdf_path)
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract the text layer and OCR only empty or garbage pages.
+        
+        The metadata records which engine produced each page under
+        'page_engines' (page number -> 'pypdf' or 'ocr').
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with merged page texts, joined text and metadata;
+            it carries an ExtractionError for each engine that failed
+        """
+        check_source(pdf_path)
+            
+        result = self.text_extractor.extract_all(pdf_path)
+        
+        # PyPDF2 could not read the text layer, so OCR is the only option
+        if result.errors:
+            ocr_result = self.ocr_extractor.extract_all(pdf_path)
+            ocr_result.metadata['page_engines'] = {page_num: 'ocr' for page_num in ocr_result.text_by_page}
+            if ocr_result.errors:
+                ocr_result.errors = result.errors + ocr_result.errors
+            return ocr_result
+            
+        pages_text = result.text_by_page
+        page_engines = {page_num: 'pypdf' for page_num in pages_text}
+        ocr_pages = [page_num for page_num, text in pages_text.items() if self._needs_ocr(text)]
+        errors = []
+        
+        if ocr_pages:
+            try:
+                for page_num, text in self.ocr_extractor.extract_pages(pdf_path, ocr_pages).items():
+                    pages_text[page_num] = text
+                    page_engines[page_num] = 'ocr'
+            except Exception as e:
+                print(f"Error extracting text with OCR: {str(e)}")
+                errors.append(ExtractionError.from_exception(e, 'ocr'))
+                
+        metadata = result.metadata
+        metadata['page_engines'] = page_engines
+        
+        merged = ExtractionResult.from_pages(pages_text, metadata)
+        merged.errors = errors
+        return merged
+    
+    def iter_pages(self, pdf_path: PDFSource, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text page by page, using OCR only where needed.
+        
+        Text-layer pages are probed in blocks; the unusable pages of each
+        block are OCRed together before the block is yielded, so memory stays
+        bounded by the block size.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            pages: Page numbers (0-indexed) to extract, e.g. a range; all pages if None
+            
+        Yields:
+            Tuples of (page number (0-indexed), extracted text) in page order
+        """
+        block_size = self.ocr_extractor.max_pages_in_memory
+        block = []
+        
+        for page_num, text in self.text_extractor.iter_pages(pdf_path, pages):
+            block.append((page_num, text))
+            if len(block) >= block_size:
+                yield from self._ocr_block(pdf_path, block)
+                block = []
+                
+        if block:
+            yield from self._ocr_block(pdf_path, block)
+    
+    def _ocr_block(self, pdf_path: PDFSource, block: list) -> Iterator[Tuple[int, str]]:
+        """Replace unusable text-layer pages of a block with OCR output."""
+        ocr_pages = [page_num for page_num, text in block if self._needs_ocr(text)]
+        ocr_text = {}
+        
+        if ocr_pages:
+            try:
+                ocr_text = self.ocr_extractor.extract_pages(pdf_path, ocr_pages)
+            except Exception as e:
+                print(f"Error extracting text with OCR: {str(e)}")
+                
+        for page_num, text in block:
+            yield page_num, ocr_text.get(page_num, text)
+    
+    def close(self) -> None:
+        """Shut down the OCR extractor's worker pool, if one was started."""
+        self.ocr_extractor.close()
+    
+    def _needs_ocr(self, text: str) -> bool:
+        """
+        Decide whether a page's text layer is empty or garbage.
+        
+        Args:
+            text: Text extracted from the page's text layer
+            
+        Returns:
+            True if the page should be OCRed
+        """
+        stripped = _CID_MARKER.sub("\ufffd", text).strip()
+        
+        if not stripped or len("".join(stripped.split())) < self.min_text_chars:
+            return True
+            
+        garbage = len(_GARBAGE_CHARS.findall(stripped))
+        return 1 - garbage / len(stripped) < self.min_valid_ratio
\ No newline at end of file
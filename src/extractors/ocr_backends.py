@@ -0,0 +1,226 @@
+import os
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+import pytesseract
+from PIL import Image
+
+
+def _page_confidences(tsv: str) -> Dict[int, float]:
+    """
+    Compute the mean word confidence per page from Tesseract TSV output.
+    
+    This is the data pytesseract's image_to_data parses; rows with a negative
+    confidence are layout blocks rather than words and are skipped.
+    
+    Args:
+        tsv: Tesseract TSV output for one or more images
+        
+    Returns:
+        Dictionary mapping page numbers (1-indexed, as in the TSV) to the mean
+        word confidence (0-100)
+    """
+    rows = tsv.strip().split('\n')
+    if len(rows) < 2:
+        return {}
+        
+    header = rows[0].split('\t')
+    page_col = header.index('page_num') if 'page_num' in header else None
+    conf_col = header.index('conf')
+    text_col = header.index('text')
+    
+    totals = {}
+    for row in rows[1:]:
+        cells = row.split('\t')
+        if len(cells) <= text_col or not cells[text_col].strip():
+            continue
+        confidence = float(cells[conf_col])
+        if confidence < 0:
+            continue
+        page = int(cells[page_col]) if page_col is not None else 1
+        total, count = totals.get(page, (0.0, 0))
+        totals[page] = (total + confidence, count + 1)
+        
+    return {page: total / count for page, (total, count) in totals.items()}
+
+
+class OCRBackend(ABC):
+    """Base class for engines that turn rendered page images into text."""
+    
+    @abstractmethod
+    def recognize(self, images: List[Image.Image], lang: str,
+                  with_confidence: bool = False) -> List[Tuple[str, Optional[float]]]:
+        """
+        OCR a batch of page images.
+        
+        Args:
+            images: Rendered pages in page order
+            lang: OCR language
+            with_confidence: Also compute the mean word confidence per page
+            
+        Returns:
+            List of (text, mean word confidence or None) tuples in page order
+        """
+        pass
+    
+    def warm_up(self, lang: str) -> None:
+        """
+        Load engine resources for a language ahead of the first page.
+        
+        Args:
+            lang: OCR language
+        """
+        pass
+    
+    def close(self) -> None:
+        """Release any long-lived engine resources."""
+        pass
+
+
+class PytesseractBackend(OCRBackend):
+    """Runs one tesseract process per page through pytesseract."""
+    
+    def recognize(self, images: List[Image.Image], lang: str,
+                  with_confidence: bool = False) -> List[Tuple[str, Optional[float]]]:
+        results = []
+        
+        for image in images:
+            if not with_confidence:
+                results.append((pytesseract.image_to_string(image, lang=lang) or "", None))
+                continue
+                
+            # One Tesseract run produces both the plain text and the word-level TSV
+            text, tsv = pytesseract.pytesseract.run_and_get_multiple_output(image, ['txt', 'tsv'], lang=lang)
+            results.append((text or "", _page_confidences(tsv).get(1, 0.0)))
+            
+        return results
+
+
+class TesseractBatchBackend(OCRBackend):
+    """Runs a single tesseract process per batch using its list-file input mode."""
+    
+    # Tesseract writes this after every page of a multi-image run
+    PAGE_SEPARATOR = '\f'
+    
+    def recognize(self, images: List[Image.Image], lang: str,
+                  with_confidence: bool = False) -> List[Tuple[str, Optional[float]]]:
+        if not images:
+            return []
+            
+        with tempfile.TemporaryDirectory(prefix='tess_batch_') as temp_dir:
+            # Uncompressed PNM keeps the hand-off to tesseract cheap
+            image_paths = []
+            for i, image in enumerate(images):
+                image_path = os.path.join(temp_dir, f"page_{i:05d}.pnm")
+                image.save(image_path, format='PPM')
+                image_paths.append(image_path)
+                
+            list_path = os.path.join(temp_dir, "pages.txt")
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(image_paths) + '\n')
+                
+            output_base = os.path.join(temp_dir, "out")
+            command = [pytesseract.pytesseract.tesseract_cmd, list_path, output_base, '-l', lang,
+                       '-c', f'page_separator={self.PAGE_SEPARATOR}', 'txt']
+            if with_confidence:
+                command.append('tsv')
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            
+            with open(output_base + '.txt', 'r', encoding='utf-8') as f:
+                pages = f.read().split(self.PAGE_SEPARATOR)
+                
+            confidences = {}
+            if with_confidence:
+                with open(output_base + '.tsv', 'r', encoding='utf-8') as f:
+                    confidences = _page_confidences(f.read())
+                    
+        # Keep the separator on each page so output matches the per-page backend
+        return [
+            (pages[i] + self.PAGE_SEPARATOR if i < len(pages) else "",
+             confidences.get(i + 1, 0.0) if with_confidence else None)
+            for i in range(len(images))
+        ]
+
+
+class TesserocrBackend(OCRBackend):
+    """Keeps Tesseract loaded in-process through the optional tesserocr bindings."""
+    
+    def __init__(self):
+        """Initialize the backend; tesserocr is imported only when it is selected."""
+        try:
+            import tesserocr
+        except ImportError as e:
+            raise ImportError("The 'tesserocr' OCR backend requires the tesserocr package") from e
+            
+        self._tesserocr = tesserocr
+        self._apis = {}
+    
+    def recognize(self, images: List[Image.Image], lang: str,
+                  with_confidence: bool = False) -> List[Tuple[str, Optional[float]]]:
+        api = self._api(lang)
+        results = []
+        
+        for image in images:
+            api.SetImage(image)
+            # Match the CLI output, which ends every page with a form feed
+            text = (api.GetUTF8Text() or "") + '\f'
+            results.append((text, float(api.MeanTextConf()) if with_confidence else None))
+            
+        return results
+    
+    def warm_up(self, lang: str) -> None:
+        self._api(lang)
+    
+    def close(self) -> None:
+        for api in self._apis.values():
+            api.End()
+        self._apis = {}
+    
+    def _api(self, lang: str):
+        """Return the API handle for a language, loading its model on first use."""
+        if lang not in self._apis:
+            self._apis[lang] = self._tesserocr.PyTessBaseAPI(lang=lang)
+        return self._apis[lang]
+
+
+_BACKEND_CLASSES = {
+    'pytesseract': PytesseractBackend,
+    'batch': TesseractBatchBackend,
+    'tesserocr': TesserocrBackend,
+}
+
+# Backends live for the lifetime of the process, so each OCR worker loads its
+# engine (and for tesserocr, its language data) only once.
+_backends = {}
+
+
+def get_backend(name: str) -> OCRBackend:
+    """
+    Get the process-wide instance of an OCR backend.
+    
+    Args:
+        name: Backend name ('pytesseract', 'batch' or 'tesserocr')
+        
+    Returns:
+        OCRBackend instance
+        
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unsupported OCR backend: {name}")
+        
+    if name not in _backends:
+        _backends[name] = _BACKEND_CLASSES[name]()
+    return _backends[name]
+
+
+def get_available_backends() -> list:
+    """
+    Get a list of available OCR backend names.
+    
+    Returns:
+        List of OCR backend names
+    """
+    return list(_BACKEND_CLASSES)
\ No newline at end of file
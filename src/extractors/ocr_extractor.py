@@ -1,10 +1,154 @@
 import os
 import tempfile
-from typing import Dict, Any
-from pdf2image import convert_from_path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Tuple
+import PyPDF2
+from pdf2image import convert_from_path, pdfinfo_from_path
 import pytesseract
 from PIL import Image
 from .base_extractor import BaseExtractor
+from .pypdf_extractor import PyPDFExtractor
+from .ocr_backends import get_backend
+from ..models.extraction_result import ExtractionResult, ExtractionError
+from ..utils.pdf_source import PDFSource, check_source, open_pdf_stream, pdf_source_path, source_digest
+from ..utils.render_cache import RenderCache
+from ..utils.cache import DEFAULT_MAX_BYTES
+
+
+# Render caches opened in this process, by cache directory
+_render_caches = {}
+
+
+def _init_ocr_worker(tesseract_cmd: str = None, backend: str = 'pytesseract', lang: str = 'eng') -> None:
+    """Prepare a worker process for OCR and load its engine up front."""
+    # Each worker already runs one page at a time; keep Tesseract single-threaded
+    # so the pool does not oversubscribe the CPU.
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        
+    get_backend(backend).warm_up(lang)
+
+
+def _get_render_cache(cache_config: Optional[Dict[str, Any]]) -> Optional[RenderCache]:
+    """Return this process's render cache for a configuration, if one is enabled."""
+    if not cache_config or not cache_config.get('dir'):
+        return None
+        
+    cache_dir = cache_config['dir']
+    if cache_dir not in _render_caches:
+        _render_caches[cache_dir] = RenderCache(cache_dir, cache_config.get('max_bytes', DEFAULT_MAX_BYTES))
+    return _render_caches[cache_dir]
+
+
+def _render_pages(pdf_path: str, first_page: int, last_page: int, dpi: int,
+                  options: Dict[str, Any]) -> List[Image.Image]:
+    """
+    Rasterize a range of pages, reusing cached renders where available.
+    
+    With a render cache configured, pages are rendered in grayscale and looked
+    up by document hash, page, DPI and colour mode; only the missing pages are
+    sent to poppler, in contiguous runs, and then stored.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        first_page: First page (1-indexed, inclusive)
+        last_page: Last page (1-indexed, inclusive)
+        dpi: Rendering DPI
+        options: OCR settings, optionally with 'grayscale', 'render_cache' and 'doc_key'
+        
+    Returns:
+        List of page images in page order
+    """
+    cache = _get_render_cache(options.get('render_cache'))
+    grayscale = options.get('grayscale', False) or cache is not None
+    render_kwargs = {'grayscale': True} if grayscale else {}
+    
+    if cache is None:
+        return convert_from_path(pdf_path, dpi=dpi, first_page=first_page, last_page=last_page, **render_kwargs)
+        
+    doc_key = options['doc_key']
+    mode = 'L' if grayscale else 'RGB'
+    images = {}
+    missing = []
+    
+    for page in range(first_page, last_page + 1):
+        image = cache.get(doc_key, page, dpi, mode)
+        if image is None:
+            missing.append(page)
+        else:
+            images[page] = image
+            
+    runs = []
+    for page in missing:
+        if runs and runs[-1][1] == page - 1:
+            runs[-1][1] = page
+        else:
+            runs.append([page, page])
+            
+    for start, end in runs:
+        rendered = convert_from_path(pdf_path, dpi=dpi, first_page=start, last_page=end, **render_kwargs)
+        for page, image in zip(range(start, end + 1), rendered):
+            cache.put(doc_key, page, dpi, image)
+            images[page] = image
+            
+    return [images[page] for page in range(first_page, last_page + 1) if page in images]
+
+
+def _ocr_page_window(pdf_path: str, first_page: int, last_page: int,
+                     options: Dict[str, Any]) -> List[Tuple[str, int, Optional[float]]]:
+    """
+    Rasterize a window of pages and OCR them.
+    
+    Runs in worker processes, so only the recognized text is sent back and the
+    rendered images are released as soon as the window is done. The window is
+    handed to the OCR backend as one batch. In adaptive mode the window is
+    rendered at the low DPI, and pages whose mean word confidence falls below
+    the threshold are re-rendered one at a time at the high DPI once the
+    window's images have been released.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        first_page: First page of the window (1-indexed, inclusive)
+        last_page: Last page of the window (1-indexed, inclusive)
+        options: OCR settings with 'dpi', 'lang' and 'backend', plus 'adaptive',
+            'high_dpi' and 'min_confidence' for adaptive mode and
+            'render_cache' and 'doc_key' when renders are cached
+        
+    Returns:
+        List of (text, DPI used, mean confidence or None) tuples in page order
+    """
+    dpi = options['dpi']
+    lang = options['lang']
+    adaptive = options.get('adaptive', False)
+    backend = get_backend(options.get('backend', 'pytesseract'))
+    
+    images = _render_pages(pdf_path, first_page, last_page, dpi, options)
+    try:
+        results = [(text, dpi, confidence) for text, confidence in backend.recognize(images, lang, adaptive)]
+    finally:
+        for image in images:
+            image.close()
+        del images
+        
+    if not adaptive or options['high_dpi'] <= dpi:
+        return results
+        
+    for offset, (text, _, confidence) in enumerate(results):
+        if confidence >= options['min_confidence']:
+            continue
+            
+        page = first_page + offset
+        image = _render_pages(pdf_path, page, page, options['high_dpi'], options)[0]
+        high_text, high_confidence = backend.recognize([image], lang, True)[0]
+        image.close()
+        
+        if high_confidence >= confidence:
+            results[offset] = (high_text, options['high_dpi'], high_confidence)
+            
+    return results
 
 
 class OCRExtractor(BaseExtractor):
@@ -19,6 +163,22 @@ class OCRExtractor(BaseExtractor):
                 - tesseract_cmd: Path to Tesseract executable
                 - lang: OCR language (default: 'eng')
                 - dpi: DPI for PDF rendering (default: 300)
+                - workers: Number of OCR worker processes (default: 1, in-process)
+                - window_size: Pages rasterized per rendering window (default: 4)
+                - max_pages_in_memory: Upper bound on rendered pages held at once
+                  (default: workers * window_size)
+                - adaptive_dpi: OCR at low_dpi first and re-render only pages below
+                  min_confidence at dpi (default: False)
+                - low_dpi: DPI for the first adaptive pass (default: 150)
+                - min_confidence: Mean word confidence (0-100) below which a page is
+                  re-rendered at dpi (default: 60)
+                - ocr_backend: 'pytesseract' (one tesseract process per page),
+                  'batch' (one tesseract process per window via a list file) or
+                  'tesserocr' (engine kept loaded in each worker) (default: 'pytesseract')
+                - grayscale: Render pages in grayscale (default: False)
+                - render_cache: Dictionary with 'dir' and optional 'max_bytes' to
+                  cache rendered pages on disk across OCR runs; cached pages are
+                  always rendered in grayscale
         """
         super().__init__(config)
         
@@ -29,91 +189,330 @@ class OCRExtractor(BaseExtractor):
         # Default configuration
         self.lang = self.config.get('lang', 'eng')
         self.dpi = self.config.get('dpi', 300)
+        self.workers = max(1, self.config.get('workers', 1))
+        self.window_size = max(1, self.config.get('window_size', 4))
+        self.max_pages_in_memory = max(1, self.config.get('max_pages_in_memory',
+                                                         self.workers * self.window_size))
+        
+        # Never render a window larger than the memory bound allows
+        self.window_size = min(self.window_size, self.max_pages_in_memory)
+        
+        self.adaptive_dpi = self.config.get('adaptive_dpi', False)
+        self.low_dpi = self.config.get('low_dpi', 150)
+        self.min_confidence = self.config.get('min_confidence', 60)
+        self.ocr_backend = self.config.get('ocr_backend', 'pytesseract')
+        self.grayscale = self.config.get('grayscale', False)
+        render_cache = self.config.get('render_cache') or {}
+        self.render_cache = render_cache if render_cache.get('dir') else None
+        
+        # Worker pool, created on first use and kept for the extractor's lifetime
+        # so worker processes (and their loaded OCR engines) serve many documents
+        self._executor = None
     
-    def extract_text(self, pdf_path: str) -> str:
+    def extract_text(self, pdf_path: PDFSource) -> str:
         """
         Extract all text from a PDF file using OCR.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Extracted text as a string
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        check_source(pdf_path)
             
-        full_text = ""
-        
         try:
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=self.dpi)
-            
-            # Process each image with OCR
-            for image in images:
-                text = pytesseract.image_to_string(image, lang=self.lang)
-                if text:
-                    full_text += text + "\n\n"
+            pages_text = self._ocr_document(pdf_path)
         except Exception as e:
             print(f"Error extracting text with OCR: {str(e)}")
             return ""
             
-        return full_text.strip()
+        return ExtractionResult.join_pages(pages_text.values())
     
-    def extract_text_by_page(self, pdf_path: str) -> Dict[int, str]:
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
         """
         Extract text from a PDF file using OCR, organized by page.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary mapping page numbers (0-indexed) to extracted text
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        check_source(pdf_path)
             
-        pages_text = {}
-        
         try:
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=self.dpi)
-            
-            # Process each image with OCR
-            for i, image in enumerate(images):
-                text = pytesseract.image_to_string(image, lang=self.lang)
-                if text:
-                    pages_text[i] = text
-                else:
-                    pages_text[i] = ""
+            return self._ocr_document(pdf_path)
         except Exception as e:
             print(f"Error extracting text with OCR: {str(e)}")
             return {}
-            
-        return pages_text
     
-    def get_metadata(self, pdf_path: str) -> Dict[str, Any]:
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
-        Extract basic metadata from a PDF file.
+        Extract metadata from a PDF file without rasterizing it.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
-            Dictionary containing basic metadata
+            Dictionary containing document info fields and OCR settings
         """
         metadata = {}
         
         try:
-            # Convert PDF to images to count pages
-            images = convert_from_path(pdf_path, dpi=self.dpi)
-            metadata = {
-                'pages': len(images),
-                'extraction_method': 'ocr',
-                'ocr_lang': self.lang,
-                'dpi': self.dpi
-            }
+            metadata = self._build_metadata(self._read_document_info(pdf_path))
         except Exception as e:
             print(f"Error extracting metadata with OCR: {str(e)}")
             
+        return metadata
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract page texts, full text and metadata with a single rasterization pass.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with page texts, joined text and metadata; on
+            failure it is empty and carries an ExtractionError
+        """
+        check_source(pdf_path)
+            
+        pages_text = {}
+        page_dpi = {}
+        page_confidence = {}
+        
+        try:
+            info = self._read_document_info(pdf_path)
+            for page_num, text, dpi, confidence in self._ocr_pages(pdf_path, range(info['pages'])):
+                pages_text[page_num] = text
+                page_dpi[page_num] = dpi
+                page_confidence[page_num] = confidence
+        except Exception as e:
+            print(f"Error extracting text with OCR: {str(e)}")
+            return ExtractionResult(errors=[ExtractionError.from_exception(e, 'ocr')])
+            
+        metadata = self._build_metadata(info)
+        if self.adaptive_dpi:
+            metadata['page_dpi'] = page_dpi
+            metadata['page_confidence'] = page_confidence
+            
+        return ExtractionResult.from_pages(pages_text, metadata)
+    
+    def _ocr_document(self, pdf_path: PDFSource) -> Dict[int, str]:
+        """
+        OCR every page of a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary mapping page numbers (0-indexed) to extracted text
+        """
+        page_count = self._read_document_info(pdf_path)['pages']
+        return {page_num: text for page_num, text, _, _ in self._ocr_pages(pdf_path, range(page_count))}
+    
+    def iter_pages(self, pdf_path: PDFSource, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily OCR page by page.
+        
+        Pages are rendered window by window as the caller consumes them, so
+        at most ``max_pages_in_memory`` rendered pages exist at any time and
+        pages outside the selection are never rasterized.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            pages: Page numbers (0-indexed) to extract, e.g. a range; all pages if None
+            
+        Yields:
+            Tuples of (page number (0-indexed), extracted text) in page order
+        """
+        check_source(pdf_path)
+            
+        page_count = self._read_document_info(pdf_path)['pages']
+        for page_num, text, _, _ in self._ocr_pages(pdf_path, self._select_pages(page_count, pages)):
+            yield page_num, text
+    
+    def extract_pages(self, pdf_path: PDFSource, page_numbers: Iterable[int]) -> Dict[int, str]:
+        """
+        OCR only the given pages of a PDF file.
+        
+        Only the requested pages are rasterized, so callers that already have
+        a usable text layer for most pages pay OCR cost for the rest only.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            page_numbers: Page numbers (0-indexed) to OCR
+            
+        Returns:
+            Dictionary mapping the requested page numbers to extracted text
+        """
+        check_source(pdf_path)
+            
+        return {page_num: text for page_num, text, _, _ in self._ocr_pages(pdf_path, page_numbers)}
+    
+    def _page_windows(self, page_numbers: Iterable[int]) -> List[Tuple[int, int]]:
+        """Group page numbers (0-indexed) into contiguous 1-indexed rendering windows."""
+        windows = []
+        
+        for page_num in sorted(set(page_numbers)):
+            page = page_num + 1
+            if windows and windows[-1][1] == page - 1 and page - windows[-1][0] < self.window_size:
+                windows[-1] = (windows[-1][0], page)
+            else:
+                windows.append((page, page))
+                
+        return windows
+    
+    def _ocr_pages(self, pdf_path: PDFSource,
+                   page_numbers: Iterable[int]) -> Iterator[Tuple[int, str, int, Optional[float]]]:
+        """
+        OCR pages window by window, yielding results in page order.
+        
+        Contiguous pages are rasterized together in windows of at most
+        ``window_size`` pages. With more than one worker the windows are OCRed
+        on a process pool, and only as many windows are in flight as fit in
+        ``max_pages_in_memory`` rendered pages.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            page_numbers: Page numbers (0-indexed) to OCR
+            
+        Yields:
+            Tuples of (page number (0-indexed), extracted text, DPI used,
+            mean word confidence or None outside adaptive mode)
+        """
+        windows = self._page_windows(page_numbers)
+        if not windows:
+            return
+            
+        # Poppler only reads files, so in-memory sources are spooled to disk
+        # once per run rather than once per window
+        with pdf_source_path(pdf_path) as path:
+            options = self._window_options()
+            if options.get('render_cache'):
+                options['doc_key'] = source_digest(path)
+            yield from self._ocr_windows(path, windows, options)
+    
+    def _ocr_windows(self, pdf_path: str, windows: List[Tuple[int, int]],
+                     options: Dict[str, Any]) -> Iterator[Tuple[int, str, int, Optional[float]]]:
+        """
+        OCR rendering windows, in process or on a bounded process pool.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            windows: (first page, last page) tuples, 1-indexed and inclusive
+            options: Settings passed to each rendering window
+            
+        Yields:
+            Tuples of (page number (0-indexed), extracted text, DPI used, mean confidence)
+        """
+        if self.workers == 1 or len(windows) == 1:
+            for start, end in windows:
+                for offset, result in enumerate(_ocr_page_window(pdf_path, start, end, options)):
+                    yield (start - 1 + offset,) + result
+            return
+            
+        max_in_flight = max(1, min(self.workers, self.max_pages_in_memory // self.window_size))
+        
+        executor = self._get_executor()
+        pending = deque()
+        
+        try:
+            for start, end in windows:
+                pending.append((start, executor.submit(_ocr_page_window, pdf_path, start, end, options)))
+                if len(pending) < max_in_flight:
+                    continue
+                    
+                # Wait for the oldest window so results stay in page order
+                start, future = pending.popleft()
+                for offset, result in enumerate(future.result()):
+                    yield (start - 1 + offset,) + result
+                    
+            while pending:
+                start, future = pending.popleft()
+                for offset, result in enumerate(future.result()):
+                    yield (start - 1 + offset,) + result
+        finally:
+            # Abandoned or failed runs must not leave windows rendering in the pool
+            for _, future in pending:
+                future.cancel()
+    
+    def close(self) -> None:
+        """Shut down the OCR worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the long-lived OCR worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 initializer=_init_ocr_worker,
+                                                 initargs=(self.config.get('tesseract_cmd'),
+                                                           self.ocr_backend, self.lang))
+        return self._executor
+    
+    def _window_options(self) -> Dict[str, Any]:
+        """Build the settings passed to each rendering window."""
+        options = {'dpi': self.dpi, 'lang': self.lang, 'backend': self.ocr_backend}
+        
+        if self.grayscale:
+            options['grayscale'] = True
+        if self.render_cache:
+            options['render_cache'] = self.render_cache
+            
+        if self.adaptive_dpi:
+            options.update({
+                'dpi': min(self.low_dpi, self.dpi),
+                'adaptive': True,
+                'high_dpi': self.dpi,
+                'min_confidence': self.min_confidence
+            })
+            
+        return options
+    
+    @staticmethod
+    def _read_document_info(pdf_path: PDFSource) -> Dict[str, Any]:
+        """
+        Read the page count and document info from the PDF structure.
+        
+        Only the trailer, info dictionary and page tree are parsed, so this is
+        cheap even for large scans. Falls back to poppler's pdfinfo when
+        PyPDF2 cannot parse the file.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary with 'pages' and the same info fields as PyPDFExtractor
+        """
+        try:
+            with open_pdf_stream(pdf_path) as stream:
+                return PyPDFExtractor._read_metadata(PyPDF2.PdfReader(stream))
+        except Exception:
+            with pdf_source_path(pdf_path) as path:
+                info = pdfinfo_from_path(path)
+            
+        metadata = {'pages': int(info.get('Pages', 0))}
+        for key in ('Title', 'Author', 'Subject', 'Keywords', 'Creator', 'Producer',
+                    'CreationDate', 'ModDate'):
+            if info.get(key):
+                metadata[key] = info[key]
+                
+        return metadata
+    
+    def _build_metadata(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the OCR metadata dictionary from the document info."""
+        metadata = dict(info)
+        metadata.update({
+            'extraction_method': 'ocr',
+            'ocr_lang': self.lang,
+            'dpi': self.dpi
+        })
+        
+        if self.adaptive_dpi:
+            metadata['adaptive_dpi'] = True
+            metadata['low_dpi'] = min(self.low_dpi, self.dpi)
         return metadata
\ No newline at end of file
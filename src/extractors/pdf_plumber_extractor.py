@@ -1,74 +1,95 @@
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 import pdfplumber
 from .base_extractor import BaseExtractor
+from ..models.extraction_result import ExtractionResult, ExtractionError
+from ..utils.pdf_source import PDFSource, check_source, open_pdf_stream
 
 
 class PDFPlumberExtractor(BaseExtractor):
     """PDF text extractor using PDFPlumber library."""
     
-    def extract_text(self, pdf_path: str) -> str:
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the PDFPlumber extractor.
+        
+        Args:
+            config: Configuration dictionary that may include:
+                - low_memory: Release each page's parsed layout objects as soon
+                  as its text is taken, so peak memory does not grow with page
+                  count (default: False)
+                - text_mode: 'default' for pdfplumber's word-clustering text
+                  extraction or 'simple' for the cheaper line-only variant
+                  (default: 'default')
+                - text_settings: Keyword arguments for pdfplumber's text
+                  extraction, e.g. x_tolerance (default: {})
+        """
+        super().__init__(config)
+        self.low_memory = self.config.get('low_memory', False)
+        self.text_mode = self.config.get('text_mode', 'default')
+        self.text_settings = self.config.get('text_settings', {})
+    
+    def extract_text(self, pdf_path: PDFSource) -> str:
         """
         Extract all text from a PDF file using PDFPlumber.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Extracted text as a string
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        check_source(pdf_path)
             
-        full_text = ""
-        
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        full_text += text + "\n\n"
+            return ExtractionResult.join_pages(text for _, text in self.iter_pages(pdf_path))
         except Exception as e:
             print(f"Error extracting text with PDFPlumber: {str(e)}")
             return ""
-            
-        return full_text.strip()
     
-    def extract_text_by_page(self, pdf_path: str) -> Dict[int, str]:
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
         """
         Extract text from a PDF file, organized by page.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary mapping page numbers (0-indexed) to extracted text
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        check_source(pdf_path)
             
-        pages_text = {}
-        
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        pages_text[i] = text
-                    else:
-                        pages_text[i] = ""
+            return dict(self.iter_pages(pdf_path))
         except Exception as e:
             print(f"Error extracting text with PDFPlumber: {str(e)}")
             return {}
+    
+    def iter_pages(self, pdf_path: PDFSource, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text page by page using PDFPlumber.
+        
+        Only the selected pages are parsed, and each page's text is yielded
+        as soon as it is extracted.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            pages: Page numbers (0-indexed) to extract, e.g. a range; all pages if None
             
-        return pages_text
+        Yields:
+            Tuples of (page number (0-indexed), extracted text) in page order
+        """
+        check_source(pdf_path)
+            
+        with open_pdf_stream(pdf_path) as stream, pdfplumber.open(stream) as pdf:
+            for page_num in self._select_pages(len(pdf.pages), pages):
+                yield page_num, self._page_text(pdf, pdf.pages[page_num])
     
-    def get_metadata(self, pdf_path: str) -> Dict[str, Any]:
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
         Extract metadata from a PDF file.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary containing metadata fields
@@ -76,17 +97,82 @@ class PDFPlumberExtractor(BaseExtractor):
         metadata = {}
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                metadata = {
-                    'pages': len(pdf.pages),
-                }
-                
-                # Try to extract document info if available
-                if hasattr(pdf, 'metadata') and pdf.metadata:
-                    for key, value in pdf.metadata.items():
-                        metadata[key] = value
+            with open_pdf_stream(pdf_path) as stream, pdfplumber.open(stream) as pdf:
+                metadata = self._read_metadata(pdf)
                             
         except Exception as e:
             print(f"Error extracting metadata with PDFPlumber: {str(e)}")
             
+        return metadata
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract page texts, full text and metadata with a single PDFPlumber parse.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with page texts, joined text and metadata; if the
+            text cannot be read it has no text and carries an ExtractionError
+        """
+        check_source(pdf_path)
+            
+        pages_text = {}
+        metadata = {}
+        
+        try:
+            with open_pdf_stream(pdf_path) as stream, pdfplumber.open(stream) as pdf:
+                metadata = self._read_metadata(pdf)
+                
+                for i, page in enumerate(pdf.pages):
+                    pages_text[i] = self._page_text(pdf, page)
+        except Exception as e:
+            print(f"Error extracting text with PDFPlumber: {str(e)}")
+            return ExtractionResult(metadata=metadata, errors=[ExtractionError.from_exception(e, 'pdfplumber')])
+            
+        return ExtractionResult.from_pages(pages_text, metadata)
+    
+    def _page_text(self, pdf: pdfplumber.PDF, page) -> str:
+        """
+        Extract one page's text with the configured settings.
+        
+        In low-memory mode the page's cached chars, layout and text map are
+        dropped afterwards, along with the objects pdfminer resolved for it.
+        
+        Args:
+            pdf: Open pdfplumber document
+            page: Page to extract
+            
+        Returns:
+            Extracted text, empty if the page has none
+        """
+        if self.text_mode == 'simple':
+            text = page.extract_text_simple(**self.text_settings)
+        else:
+            text = page.extract_text(**self.text_settings)
+            
+        if self.low_memory:
+            page.close()
+            # pdfminer keeps every object it has resolved; pages only share
+            # fonts and resources, which are cheap to resolve again
+            for cache_name in ('_cached_objs', '_parsed_objs'):
+                cached_objects = getattr(pdf.doc, cache_name, None)
+                if cached_objects is not None:
+                    cached_objects.clear()
+                
+        return text or ""
+    
+    @staticmethod
+    def _read_metadata(pdf: pdfplumber.PDF) -> Dict[str, Any]:
+        """Build the metadata dictionary from an open pdfplumber document."""
+        metadata = {
+            'pages': len(pdf.pages),
+        }
+        
+        # Try to extract document info if available
+        if hasattr(pdf, 'metadata') and pdf.metadata:
+            for key, value in pdf.metadata.items():
+                metadata[key] = value
+                
         return metadata
\ No newline at end of file
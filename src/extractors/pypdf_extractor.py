@@ -1,80 +1,77 @@
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 import PyPDF2
 from .base_extractor import BaseExtractor
+from ..models.extraction_result import ExtractionResult, ExtractionError
+from ..utils.pdf_source import PDFSource, check_source, open_pdf_stream
 
 
 class PyPDFExtractor(BaseExtractor):
     """PDF text extractor using PyPDF2 library."""
     
-    def extract_text(self, pdf_path: str) -> str:
+    def extract_text(self, pdf_path: PDFSource) -> str:
         """
         Extract all text from a PDF file using PyPDF2.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Extracted text as a string
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        check_source(pdf_path)
             
-        full_text = ""
-        
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(reader.pages)):
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-                    if text:
-                        full_text += text + "\n\n"
+            return ExtractionResult.join_pages(text for _, text in self.iter_pages(pdf_path))
         except Exception as e:
             print(f"Error extracting text with PyPDF2: {str(e)}")
             return ""
-            
-        return full_text.strip()
     
-    def extract_text_by_page(self, pdf_path: str) -> Dict[int, str]:
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
         """
         Extract text from a PDF file, organized by page.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary mapping page numbers (0-indexed) to extracted text
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        check_source(pdf_path)
             
-        pages_text = {}
-        
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(reader.pages)):
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-                    if text:
-                        pages_text[page_num] = text
-                    else:
-                        pages_text[page_num] = ""
+            return dict(self.iter_pages(pdf_path))
         except Exception as e:
             print(f"Error extracting text with PyPDF2: {str(e)}")
             return {}
+    
+    def iter_pages(self, pdf_path: PDFSource, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text page by page using PyPDF2.
+        
+        Only the selected pages are parsed, and each page's text is yielded
+        as soon as it is extracted.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            pages: Page numbers (0-indexed) to extract, e.g. a range; all pages if None
             
-        return pages_text
+        Yields:
+            Tuples of (page number (0-indexed), extracted text) in page order
+        """
+        check_source(pdf_path)
+            
+        with open_pdf_stream(pdf_path) as stream:
+            reader = PyPDF2.PdfReader(stream)
+            
+            for page_num in self._select_pages(len(reader.pages), pages):
+                yield page_num, reader.pages[page_num].extract_text() or ""
     
-    def get_metadata(self, pdf_path: str) -> Dict[str, Any]:
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
         Extract metadata from a PDF file.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
             
         Returns:
             Dictionary containing metadata fields
@@ -82,21 +79,58 @@ class PyPDFExtractor(BaseExtractor):
         metadata = {}
         
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                metadata = {
-                    'pages': len(reader.pages),
-                }
-                
-                if reader.metadata:
-                    for key, value in reader.metadata.items():
-                        if key.startswith('/'):
-                            clean_key = key[1:]  # Remove leading slash
-                            metadata[clean_key] = value
-                        else:
-                            metadata[key] = value
+            with open_pdf_stream(pdf_path) as stream:
+                reader = PyPDF2.PdfReader(stream)
+                metadata = self._read_metadata(reader)
                             
         except Exception as e:
             print(f"Error extracting metadata with PyPDF2: {str(e)}")
             
+        return metadata
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract page texts, full text and metadata with a single PyPDF2 parse.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult with page texts, joined text and metadata; if the
+            text cannot be read it has no text and carries an ExtractionError
+        """
+        check_source(pdf_path)
+            
+        pages_text = {}
+        metadata = {}
+        
+        try:
+            with open_pdf_stream(pdf_path) as stream:
+                reader = PyPDF2.PdfReader(stream)
+                metadata = self._read_metadata(reader)
+                
+                for page_num in range(len(reader.pages)):
+                    text = reader.pages[page_num].extract_text()
+                    pages_text[page_num] = text or ""
+        except Exception as e:
+            print(f"Error extracting text with PyPDF2: {str(e)}")
+            return ExtractionResult(metadata=metadata, errors=[ExtractionError.from_exception(e, 'pypdf')])
+            
+        return ExtractionResult.from_pages(pages_text, metadata)
+    
+    @staticmethod
+    def _read_metadata(reader: PyPDF2.PdfReader) -> Dict[str, Any]:
+        """Build the metadata dictionary from an open PdfReader."""
+        metadata = {
+            'pages': len(reader.pages),
+        }
+        
+        if reader.metadata:
+            for key, value in reader.metadata.items():
+                if key.startswith('/'):
+                    clean_key = key[1:]  # Remove leading slash
+                    metadata[clean_key] = value
+                else:
+                    metadata[key] = value
+                    
         return metadata
\ No newline at end of file
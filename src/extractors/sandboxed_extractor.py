@@ -0,0 +1,270 @@
+import os
+import signal
+import multiprocessing
+from multiprocessing.util import Finalize
+from typing import Dict, Any, Optional
+from .base_extractor import BaseExtractor
+from ..models.extraction_result import ExtractionResult, ExtractionError
+from ..utils.pdf_source import PDFSource, check_source, pdf_source_path
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def _limit_memory(max_memory: int) -> None:
+    """Cap the address space of the current process."""
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        max_memory = min(max_memory, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, hard))
+
+
+def _sandbox_worker(conn, extractor_type: str, config: Dict[str, Any], max_memory: Optional[int]) -> None:
+    """
+    Serve extraction requests in a child process until told to stop.
+    
+    Requests are (method, pdf_path) tuples; None stops the worker. Each reply
+    is ('ok', value) or (error kind, message). Extractors report failures
+    they catch as ExtractionErrors in their result, which is sent back as
+    (text_by_page, metadata, errors); exceptions that escape the extractor
+    are classified here.
+    
+    Args:
+        conn: Pipe connection to the parent
+        extractor_type: Type of extractor to create
+        config: Configuration for the extractor
+        max_memory: Address-space limit in bytes, or None for no limit
+    """
+    from .extractor_factory import ExtractorFactory
+    
+    # Lead a process group, so processes the extractor starts can be killed with it
+    if hasattr(os, 'setsid'):
+        os.setsid()
+    
+    if max_memory:
+        _limit_memory(max_memory)
+    
+    extractor = ExtractorFactory.create_extractor(extractor_type, config)
+    
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            extractor.close()
+            break
+        
+        method, pdf_path = request
+        try:
+            value = getattr(extractor, method)(pdf_path)
+        except Exception as e:
+            error = ExtractionError.from_exception(e, extractor_type)
+            conn.send((error.kind, error.message))
+            continue
+        
+        if isinstance(value, ExtractionResult):
+            value = (value.text_by_page, value.metadata, value.errors)
+        conn.send(('ok', value))
+
+
+def _stop_worker(process, conn, grace: float) -> None:
+    """
+    Stop a worker process, killing it and its process group if needed.
+    
+    Args:
+        process: Worker process
+        conn: Parent end of the worker's pipe
+        grace: Seconds the worker has to close its extractor and exit after
+            being asked to, or 0 to kill it at once
+    """
+    if grace:
+        try:
+            conn.send(None)
+        except (OSError, ValueError):
+            pass
+        process.join(timeout=grace)
+    
+    if process.is_alive():
+        if hasattr(os, 'killpg'):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                process.kill()
+        else:
+            process.kill()
+    process.join()
+    conn.close()
+
+
+class SandboxedExtractor(BaseExtractor):
+    """Extractor wrapper that runs extraction in a reusable, resource-limited child process."""
+    
+    def __init__(self, extractor_type: str, config: Dict[str, Any] = None):
+        """
+        Initialize the sandboxed extractor.
+        
+        Args:
+            extractor_type: Type of extractor to run in the worker
+            config: Extractor configuration; its 'sandbox' section may include:
+                - timeout: Wall-clock seconds allowed per document (default: 120)
+                - max_memory_mb: Address-space limit of the worker in megabytes,
+                  or None for no limit (default: 2048)
+                - max_documents: Documents a worker handles before it is
+                  replaced by a fresh one (default: 50)
+        """
+        super().__init__(config)
+        sandbox_config = self.config.get('sandbox', {})
+        
+        self.extractor_type = extractor_type
+        self.timeout = sandbox_config.get('timeout', 120)
+        max_memory_mb = sandbox_config.get('max_memory_mb', 2048)
+        self.max_memory = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+        self.max_documents = sandbox_config.get('max_documents', 50)
+        
+        # The worker builds the plain extractor; caching stays in this process
+        self._worker_config = {key: value for key, value in self.config.items() if key not in ('sandbox', 'cache')}
+        self._process = None
+        self._conn = None
+        self._finalizer = None
+        self._documents = 0
+    
+    def extract_text(self, pdf_path: PDFSource) -> str:
+        """
+        Extract all text from a PDF file in the sandbox.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Extracted text as a string
+        """
+        return self.extract_all(pdf_path).extracted_text
+    
+    def extract_text_by_page(self, pdf_path: PDFSource) -> Dict[int, str]:
+        """
+        Extract text from a PDF file, organized by page, in the sandbox.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary mapping page numbers (0-indexed) to extracted text
+        """
+        return self.extract_all(pdf_path).text_by_page
+    
+    def get_metadata(self, pdf_path: PDFSource) -> Dict[str, Any]:
+        """
+        Extract metadata from a PDF file in the sandbox.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            Dictionary containing metadata fields, empty on failure
+        """
+        status, value = self._call('get_metadata', pdf_path)
+        return value if status == 'ok' else {}
+    
+    def extract_all(self, pdf_path: PDFSource) -> ExtractionResult:
+        """
+        Extract page texts, full text and metadata in the sandbox.
+        
+        Args:
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            ExtractionResult carrying the extractor's own ExtractionErrors; on
+            timeout, a worker crash or an exception escaping the extractor it
+            is empty and carries an ExtractionError
+        """
+        status, value = self._call('extract_all', pdf_path)
+        if status != 'ok':
+            return ExtractionResult(errors=[ExtractionError(status, value, self.extractor_type)])
+        
+        text_by_page, metadata, errors = value
+        result = ExtractionResult.from_pages(text_by_page, metadata)
+        result.errors = errors
+        return result
+    
+    def close(self) -> None:
+        """Stop the worker process, giving it time to close its extractor."""
+        if self._process is None:
+            return
+        
+        self._finalizer()
+        self._forget()
+    
+    def _call(self, method: str, pdf_path: PDFSource):
+        """
+        Run one extractor method in the worker.
+        
+        Args:
+            method: Name of the extractor method
+            pdf_path: Path to the PDF file, or its bytes, an mmap or a binary file object
+            
+        Returns:
+            (status, value) where status is 'ok' or an error kind and value is
+            the method's return value or an error message
+        """
+        check_source(pdf_path)
+        
+        if self._documents >= self.max_documents:
+            self.close()
+        
+        with pdf_source_path(pdf_path) as path:
+            self._start()
+            self._documents += 1
+            
+            try:
+                self._conn.send((method, path))
+                if not self._conn.poll(self.timeout):
+                    self._kill()
+                    return 'timeout', f"Extraction did not finish within {self.timeout} seconds"
+                return self._conn.recv()
+            except (EOFError, OSError):
+                # The worker died, e.g. killed by the OOM killer or a segfault
+                exitcode = self._process.exitcode
+                self._kill()
+                return 'crash', f"Extraction worker exited unexpectedly (exit code {exitcode})"
+    
+    def _start(self) -> None:
+        """Start a worker process if none is running."""
+        if self._process is not None and self._process.is_alive():
+            return
+        
+        self._kill()
+        context = multiprocessing.get_context()
+        self._conn, child_conn = context.Pipe()
+        # Not a daemon, since daemons cannot start processes of their own and
+        # the hedged and multi-worker OCR extractors do; close() and the
+        # timeout path stop it instead
+        self._process = context.Process(
+            target=_sandbox_worker,
+            args=(child_conn, self.extractor_type, self._worker_config, self.max_memory),
+            daemon=False
+        )
+        self._process.start()
+        child_conn.close()
+        self._documents = 0
+        
+        # Stops the worker if the extractor is never closed; at interpreter
+        # exit this runs before multiprocessing waits for non-daemon children
+        self._finalizer = Finalize(self, _stop_worker, args=(self._process, self._conn, 5), exitpriority=10)
+    
+    def _kill(self) -> None:
+        """Kill the worker process and forget it."""
+        if self._process is not None:
+            self._finalizer.cancel()
+            _stop_worker(self._process, self._conn, 0)
+        self._forget()
+    
+    def _forget(self) -> None:
+        """Drop the references to a stopped worker."""
+        self._process = None
+        self._conn = None
+        self._finalizer = None
\ No newline at end of file
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Any
 from datetime import datetime
+from .extraction_result import ExtractionError
+from .entity_table import EntityTable
 
 
 @dataclass
@@ -21,11 +23,14 @@ class Document:
     # Processing state
     processed: bool = False
     processing_timestamp: datetime = field(default_factory=datetime.now)
+    errors: List[ExtractionError] = field(default_factory=list)
     
     # Analysis results
     keywords: List[str] = field(default_factory=list)
     entities: Dict[str, List[str]] = field(default_factory=dict)
     summary: str = ""
+    # Every occurrence of the entities, with its page and offsets
+    entity_table: EntityTable = field(default_factory=EntityTable)
     
     def __post_init__(self):
         """Set page count from metadata if available."""
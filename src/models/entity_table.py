@@ -0,0 +1,93 @@
+from array import array
+from typing import Dict, List, Iterator, NamedTuple, Sequence
+
+
+class EntityRecord(NamedTuple):
+    """An entity found in a document, with its position."""
+    
+    # 'emails', 'phones', 'urls' or 'dates'
+    type: str
+    value: str
+    # Page number (0-indexed) and character offsets in that page's text
+    page: int
+    start: int
+    end: int
+
+
+class EntityTable:
+    """Positional entities of a document, stored column by column."""
+    
+    def __init__(self, entity_types: Sequence[str] = ()):
+        """
+        Create an empty table.
+        
+        Each column is an array of machine integers, so a record costs a few
+        bytes instead of a Python object. Values are stored once however
+        often they occur, and records refer to them by index.
+        
+        Args:
+            entity_types: Types that were extracted, in order; types without
+                records still appear in the values_by_type view
+        """
+        self.entity_types = tuple(entity_types)
+        self._type_codes = {entity_type: code for code, entity_type in enumerate(self.entity_types)}
+        self._values: List[str] = []
+        self._value_codes: Dict[str, int] = {}
+        
+        self._types = array('B')
+        self._value_ids = array('I')
+        self._pages = array('I')
+        self._starts = array('I')
+        self._ends = array('I')
+    
+    def append(self, entity_type: str, value: str, page: int, start: int, end: int) -> None:
+        """
+        Add a record.
+        
+        Args:
+            entity_type: One of the table's entity types
+            value: Entity text
+            page: Page number (0-indexed)
+            start: Offset of the entity in the page text
+            end: Offset just past the entity
+        """
+        value_id = self._value_codes.get(value)
+        if value_id is None:
+            value_id = self._value_codes[value] = len(self._values)
+            self._values.append(value)
+        
+        self._types.append(self._type_codes[entity_type])
+        self._value_ids.append(value_id)
+        self._pages.append(page)
+        self._starts.append(start)
+        self._ends.append(end)
+    
+    def __len__(self) -> int:
+        """Number of records."""
+        return len(self._types)
+    
+    def __getitem__(self, index: int) -> EntityRecord:
+        """Record at an index, in the order records were added."""
+        return EntityRecord(self.entity_types[self._types[index]], self._values[self._value_ids[index]],
+                            self._pages[index], self._starts[index], self._ends[index])
+    
+    def __iter__(self) -> Iterator[EntityRecord]:
+        """Records in the order they were added."""
+        types, values = self.entity_types, self._values
+        for type_code, value_id, page, start, end in zip(self._types, self._value_ids, self._pages,
+                                                         self._starts, self._ends):
+            yield EntityRecord(types[type_code], values[value_id], page, start, end)
+    
+    def values_by_type(self) -> Dict[str, List[str]]:
+        """
+        Distinct values of each entity type.
+        
+        Returns:
+            Dictionary mapping entity types to sorted, unique values
+        """
+        value_ids = [set() for _ in self.entity_types]
+        for type_code, value_id in zip(self._types, self._value_ids):
+            value_ids[type_code].add(value_id)
+        
+        return {entity_type: sorted(self._values[value_id] for value_id in ids)
+                for entity_type, ids in zip(self.entity_types, value_ids)}
\ No newline at end of file
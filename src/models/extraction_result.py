@@ -0,0 +1,72 @@
+import errno
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Iterable
+
+
+@dataclass
+class ExtractionError:
+    """A failure reported by an extraction, in place of an empty result."""
+    
+    # 'timeout', 'memory', 'crash' or 'error'
+    kind: str
+    message: str
+    extractor: str = ""
+    
+    @classmethod
+    def from_exception(cls, error: BaseException, extractor: str) -> 'ExtractionError':
+        """
+        Describe an exception raised during extraction.
+        
+        Args:
+            error: The exception
+            extractor: Name of the extractor that raised it
+            
+        Returns:
+            ExtractionError of kind 'memory' for memory exhaustion, 'error' otherwise
+        """
+        # Under an address-space limit, native code fails allocations with ENOMEM
+        out_of_memory = isinstance(error, MemoryError) or (isinstance(error, OSError) and error.errno == errno.ENOMEM)
+        kind = 'memory' if out_of_memory else 'error'
+        return cls(kind, f"{type(error).__name__}: {str(error)}", extractor)
+
+
+@dataclass
+class ExtractionResult:
+    """Everything an extractor produces from a single parse of a PDF."""
+    
+    extracted_text: str = ""
+    text_by_page: Dict[int, str] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    errors: List[ExtractionError] = field(default_factory=list)
+    
+    @staticmethod
+    def join_pages(pages: Iterable[str]) -> str:
+        """
+        Join page texts the same way the extractors build their full text.
+        
+        Args:
+            pages: Page texts in page order
+            
+        Returns:
+            Non-empty pages separated by blank lines
+        """
+        return "\n\n".join(text for text in pages if text).strip()
+    
+    @classmethod
+    def from_pages(cls, text_by_page: Dict[int, str], metadata: Dict[str, Any] = None) -> 'ExtractionResult':
+        """
+        Build a result from page texts, deriving the full text from them.
+        
+        Args:
+            text_by_page: Dictionary mapping page numbers (0-indexed) to text
+            metadata: Metadata dictionary for the document
+            
+        Returns:
+            ExtractionResult with the joined full text
+        """
+        pages = [text_by_page[page_num] for page_num in sorted(text_by_page)]
+        return cls(
+            extracted_text=cls.join_pages(pages),
+            text_by_page=text_by_page,
+            metadata=metadata or {}
+        )
\ No newline at end of file
@@ -1,13 +1,114 @@
 import re
-from collections import Counter
-from typing import Dict, Any, Optional, List
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
+import math
+import heapq
+import hashlib
+from collections import Counter, deque
+from typing import Dict, Any, Optional, List, FrozenSet, Tuple
 from ..models.document import Document
+from ..utils.term_index import DocumentFrequencyIndex
 from .base_processor import BaseProcessor
 
 
+# Candidate keywords: runs of letters in the lowercased text. An apostrophe
+# followed by more letters ends the word and the rest is dropped, so
+# "john's" counts as "john". This approximates the words the NLTK path
+# keeps after word_tokenize without following its token rules: words joined
+# by a hyphen or slash ("well-known", "and/or") count as their parts here,
+# where word_tokenize keeps them whole and they are filtered out, and
+# "wouldn't" gives the stopword "wouldn" instead of "would".
+_KEYWORD = re.compile(r"([^\W\d_]+)(?:'[^\W\d_]+)?")
+
+
+# NLTK data packages needed by each resource
+_NLTK_PACKAGES = {
+    'stopwords': 'stopwords',
+    'sentences': 'punkt_tab',
+}
+
+# Resources loaded in this process, or the error for missing data, keyed by
+# (resource, language, data directory)
+_nltk_resources: Dict[Tuple[str, str, Optional[str]], Any] = {}
+
+
+def _load_stopwords(language: str, paths: Optional[List[str]]) -> FrozenSet[str]:
+    """Read a stopword list from the NLTK stopwords corpus."""
+    import nltk.data
+    
+    with nltk.data.find(f'corpora/stopwords/{language}', paths=paths).open() as f:
+        return frozenset(line for line in f.read().decode('utf-8').splitlines() if line.strip())
+
+
+def _load_sentence_tokenizer(language: str, paths: Optional[List[str]]) -> Any:
+    """Build the Punkt sentence tokenizer that sent_tokenize uses."""
+    import nltk.data
+    from nltk.tokenize.punkt import PunktSentenceTokenizer, load_punkt_params
+    
+    # Same as nltk's PunktTokenizer, which only searches the global data path
+    tokenizer = PunktSentenceTokenizer()
+    tokenizer._params = load_punkt_params(nltk.data.find(f'tokenizers/punkt_tab/{language}/', paths=paths))
+    return tokenizer
+
+
+def _load_word_tokenizer(language: str, paths: Optional[List[str]]) -> Any:
+    """Build the word tokenizer that word_tokenize uses; it needs no data."""
+    from nltk.tokenize import NLTKWordTokenizer
+    
+    return NLTKWordTokenizer()
+
+
+_NLTK_LOADERS = {
+    'stopwords': _load_stopwords,
+    'sentences': _load_sentence_tokenizer,
+    'words': _load_word_tokenizer,
+}
+
+
+def _nltk_resource(name: str, language: str, data_dir: Optional[str] = None) -> Any:
+    """
+    Load an NLTK resource once per process, from local data only.
+    
+    Resources are shared by all analyzers and never downloaded. A missing
+    resource is remembered too, so later calls fail at once instead of
+    searching the data path again.
+    
+    Args:
+        name: 'stopwords', 'sentences' or 'words'
+        language: Language of the resource
+        data_dir: Directory to read NLTK data from (default: NLTK's data path)
+        
+    Returns:
+        The stopword set or tokenizer
+        
+    Raises:
+        LookupError: If the data is not installed
+    """
+    key = (name, language, data_dir)
+    if key not in _nltk_resources:
+        paths = None
+        if data_dir:
+            import nltk.data
+            
+            # NLTK only opens files under its data path, so the directory is
+            # added there, but it is the only one searched
+            if data_dir not in nltk.data.path:
+                nltk.data.path.append(data_dir)
+            paths = [data_dir]
+            
+        try:
+            _nltk_resources[key] = _NLTK_LOADERS[name](language, paths)
+        except LookupError:
+            package = _NLTK_PACKAGES[name]
+            location = data_dir or "the NLTK data path"
+            _nltk_resources[key] = LookupError(
+                f"NLTK data '{package}' for {language} not found in {location} "
+                f"(install it with: python -m nltk.downloader -d <dir> {package})")
+            
+    resource = _nltk_resources[key]
+    if isinstance(resource, LookupError):
+        raise resource
+    return resource
+
+
 class ContentAnalyzer(BaseProcessor):
     """Analyze document content and extract key information."""
     
@@ -21,23 +122,33 @@ class ContentAnalyzer(BaseProcessor):
                 - num_keywords: Number of keywords to extract (default: 15)
                 - language: Text language for analysis (default: 'english')
                 - generate_summary: Generate text summary (default: False)
+                - keyword_engine: 'nltk' for NLTK's word_tokenize, or 'fast'
+                  for a regex tokenizer (default: 'nltk')
+                - nltk_data: Directory with the NLTK stopwords and punkt_tab
+                  data (default: NLTK's data path). Data is never downloaded.
+                - corpus_index: Document-frequency index file; when set,
+                  keywords are ranked by TF-IDF across the corpus (default: None)
+                - update_corpus_index: Add each analyzed document to the
+                  corpus index (default: True)
+                - summary_sentences: Sentences in the summary (default: 5)
+                - summary_window: Sentences before and after each sentence
+                  that it is compared with when ranking; 0 compares every
+                  pair (default: 50)
         """
         super().__init__(config)
         self.extract_keywords = self.config.get('extract_keywords', True)
         self.num_keywords = self.config.get('num_keywords', 15)
         self.language = self.config.get('language', 'english')
         self.generate_summary = self.config.get('generate_summary', False)
+        self.keyword_engine = self.config.get('keyword_engine', 'nltk')
+        self.nltk_data = self.config.get('nltk_data')
+        self.corpus_index = self.config.get('corpus_index')
+        self.update_corpus_index = self.config.get('update_corpus_index', True)
+        self.summary_sentences = self.config.get('summary_sentences', 5)
+        self.summary_window = self.config.get('summary_window', 50)
         
-        # Download necessary NLTK resources if needed
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-            
-        try:
-            nltk.data.find(f'corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
+        # Opened on first use, in the process that analyzes documents
+        self._df_index = None
     
     def process(self, document: Document) -> Document:
         """
@@ -73,15 +184,16 @@ class ContentAnalyzer(BaseProcessor):
             List of keywords
         """
         try:
-            # Tokenize and prepare words
-            words = word_tokenize(text.lower())
-            
-            # Remove stopwords, numbers, and short words
-            stop_words = set(stopwords.words(self.language))
-            words = [word for word in words if word.isalpha() and word not in stop_words and len(word) > 2]
+            stop_words = _nltk_resource('stopwords', self.language, self.nltk_data)
+            if self.keyword_engine == 'nltk':
+                word_freq = self._nltk_word_counts(text, stop_words)
+            else:
+                word_freq = self._fast_word_counts(text, stop_words)
             
+            if self.corpus_index:
+                return self._tfidf_keywords(text, word_freq)
+                
             # Get most common words
-            word_freq = Counter(words)
             keywords = [word for word, _ in word_freq.most_common(self.num_keywords)]
             
             return keywords
@@ -89,6 +201,89 @@ class ContentAnalyzer(BaseProcessor):
             print(f"Error extracting keywords: {str(e)}")
             return []
     
+    def _tfidf_keywords(self, text: str, word_freq: Counter) -> List[str]:
+        """
+        Rank words by TF-IDF against the corpus document-frequency index.
+        
+        The document is added to the index first (once, keyed by a digest of
+        its text), then the frequencies of its own words are looked up, so
+        the cost depends on the document and not on the corpus size.
+        
+        Args:
+            text: Text being analyzed
+            word_freq: Counter of candidate keywords in the text
+            
+        Returns:
+            List of keywords
+        """
+        if self._df_index is None:
+            self._df_index = DocumentFrequencyIndex(self.corpus_index)
+            
+        if self.update_corpus_index:
+            key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            self._df_index.add(key, word_freq)
+            
+        documents = self._df_index.document_count
+        frequencies = self._df_index.document_frequencies(word_freq)
+        
+        # Smoothed inverse document frequency, as in scikit-learn
+        def tfidf(word: str) -> float:
+            return word_freq[word] * (math.log((1 + documents) / (1 + frequencies.get(word, 0))) + 1)
+            
+        return heapq.nlargest(self.num_keywords, word_freq, key=tfidf)
+    
+    def _nltk_word_counts(self, text: str, stop_words: FrozenSet[str]) -> Counter:
+        """
+        Count candidate keywords with NLTK's tokenizer.
+        
+        Args:
+            text: Text to analyze
+            stop_words: Words to leave out
+            
+        Returns:
+            Counter of lowercase words
+        """
+        # Tokenize and prepare words, as word_tokenize does
+        words = self._word_tokenize(text.lower())
+        
+        # Remove stopwords, numbers, and short words
+        return Counter(word for word in words if word.isalpha() and word not in stop_words and len(word) > 2)
+    
+    @staticmethod
+    def _fast_word_counts(text: str, stop_words: FrozenSet[str]) -> Counter:
+        """
+        Count candidate keywords with a single regex scan.
+        
+        The regex finds words of letters (see _KEYWORD for how they differ
+        from the NLTK path's), so tokens are never filtered one by one in
+        Python. Stopwords, short words, and words with numeric characters
+        such as superscripts that the regex takes for letters, are removed
+        from the counts afterwards, which costs one lookup per stopword and
+        distinct word.
+        
+        Args:
+            text: Text to analyze
+            stop_words: Words to leave out
+            
+        Returns:
+            Counter of lowercase words
+        """
+        word_freq = Counter(_KEYWORD.findall(text.lower()))
+        for word in stop_words:
+            word_freq.pop(word, None)
+        for word in [word for word in word_freq if len(word) < 3 or not word.isalpha()]:
+            del word_freq[word]
+        return word_freq
+    
+    def _sent_tokenize(self, text: str) -> List[str]:
+        """Split text into sentences, like nltk's sent_tokenize."""
+        return _nltk_resource('sentences', self.language, self.nltk_data).tokenize(text)
+    
+    def _word_tokenize(self, text: str) -> List[str]:
+        """Split text into words, like nltk's word_tokenize."""
+        word_tokenizer = _nltk_resource('words', self.language)
+        return [token for sentence in self._sent_tokenize(text) for token in word_tokenizer.tokenize(sentence)]
+    
     def _generate_summary(self, text: str) -> str:
         """
         Generate a summary of the text using extractive summarization.
@@ -101,16 +296,83 @@ class ContentAnalyzer(BaseProcessor):
         """
         try:
             # Split into sentences
-            sentences = sent_tokenize(text)
+            sentences = self._sent_tokenize(text)
             
-            if len(sentences) <= 5:
+            if len(sentences) <= self.summary_sentences:
                 return text  # Text is already short, return as is
                 
-            # Simple extractive summarization: use first few sentences
-            # A more sophisticated approach would use sentence ranking
-            summary = ' '.join(sentences[:5])
+            # Rank sentences with TextRank and keep the best in document order
+            stop_words = _nltk_resource('stopwords', self.language, self.nltk_data)
+            scores = self._rank_sentences(sentences, stop_words)
+            best = heapq.nlargest(self.summary_sentences, range(len(sentences)), key=scores.__getitem__)
+            summary = ' '.join(sentences[i] for i in sorted(best))
             
             return summary
         except Exception as e:
             print(f"Error generating summary: {str(e)}")
-            return text[:500] + "..."  # Fallback to simple truncation
\ No newline at end of file
+            return text[:500] + "..."  # Fallback to simple truncation
+    
+    def _rank_sentences(self, sentences: List[str], stop_words: FrozenSet[str],
+                        damping: float = 0.85, iterations: int = 50, tolerance: float = 1e-4) -> List[float]:
+        """
+        Score sentences with TextRank.
+        
+        Sentences are linked by word overlap, normalized by their lengths
+        (Mihalcea and Tarau, 2004), and scored with weighted PageRank. Each
+        sentence is only compared with the summary_window sentences before
+        it, through an inverted index of those sentences' words, so building
+        the sparse graph is linear in the number of sentences instead of
+        quadratic, and only pairs sharing a word become edges. A window of 0
+        compares every pair.
+        
+        Args:
+            sentences: Sentences in document order
+            stop_words: Words to ignore
+            damping: PageRank damping factor
+            iterations: Maximum PageRank iterations
+            tolerance: Stop when no score changes by more than this
+            
+        Returns:
+            Score of each sentence
+        """
+        words = [set(_KEYWORD.findall(sentence.lower())) - stop_words for sentence in sentences]
+        log_lengths = [math.log(len(sentence_words)) if sentence_words else 0.0 for sentence_words in words]
+        
+        # Undirected weighted edges, as adjacency lists
+        neighbors = [[] for _ in sentences]
+        postings: Dict[str, deque] = {}
+        window = self.summary_window or len(sentences)
+        
+        for i, sentence_words in enumerate(words):
+            overlaps = Counter()
+            for word in sentence_words:
+                recent = postings.get(word)
+                if recent is None:
+                    recent = postings[word] = deque()
+                # Drop sentences that fell out of the window
+                while recent and recent[0] < i - window:
+                    recent.popleft()
+                overlaps.update(recent)
+                recent.append(i)
+                
+            for j, overlap in overlaps.items():
+                norm = log_lengths[i] + log_lengths[j]
+                if norm > 0:
+                    weight = overlap / norm
+                    neighbors[i].append((j, weight))
+                    neighbors[j].append((i, weight))
+                    
+        out_weights = [sum(weight for _, weight in edges) for edges in neighbors]
+        
+        # Power iteration of weighted PageRank
+        scores = [1.0] * len(sentences)
+        for _ in range(iterations):
+            shares = [score / total if total else 0.0 for score, total in zip(scores, out_weights)]
+            updated = [(1 - damping) + damping * sum(shares[j] * weight for j, weight in edges)
+                       for edges in neighbors]
+            converged = max(abs(new - old) for new, old in zip(updated, scores)) < tolerance
+            scores = updated
+            if converged:
+                break
+                
+        return scores
\ No newline at end of file
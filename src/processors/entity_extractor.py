@@ -1,9 +1,92 @@
 import re
-from typing import Dict, Any, Optional, List
+import string
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Iterator, Pattern, Tuple
 from ..models.document import Document
+from ..models.entity_table import EntityTable
 from .base_processor import BaseProcessor
 
 
+# Entity patterns, by scanner group name. Each type keeps the matches of its
+# patterns as re.findall would find them one pattern at a time.
+_EMAIL_DOMAIN = r'@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_EMAIL_LOCAL_CHARACTERS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_URL = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+[^\s]*'
+_NUMBER_PATTERNS = [
+    ('phone_plain', r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # 123-456-7890
+    ('phone_area', r'\b\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # (123) 456-7890
+    ('phone_country', r'\b\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # +1 123-456-7890
+    ('date_numeric', r'(?i:\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b)'),  # MM/DD/YYYY or DD/MM/YYYY
+    ('date_day_first', r'(?i:\b\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b)'),  # DD Month YYYY
+]
+_MONTH_FIRST = r'(?i:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b)'  # Month DD, YYYY
+
+# Characters a month name can start with when ignoring case; the long s
+# matches 's'
+_MONTH_INITIALS = 'JFMASONDjfmasond\u017f'
+
+_GROUP_TYPES = {
+    'email': 'emails',
+    'url': 'urls',
+    'phone_plain': 'phones',
+    'phone_area': 'phones',
+    'phone_country': 'phones',
+    'date_numeric': 'dates',
+    'date_day_first': 'dates',
+    'date_month_first': 'dates',
+}
+
+
+@lru_cache(maxsize=None)
+def _build_scanner(entity_types: Tuple[str, ...]) -> Pattern:
+    """
+    Compile one scanner for the given entity types.
+    
+    Every entity starts at a distinctive character: '@' for emails (whose
+    local part is found by looking back from it), 'h' for URLs, a digit,
+    '(' or '+' for phones and numeric dates, and a month initial for the
+    other dates. The scanner consumes one such character, so the regex
+    engine skips everything else without trying any pattern, and then
+    captures every pattern that matches from that character in lookaheads.
+    All patterns are tried at the same position, so matches of different
+    types may overlap, as with separate findall calls.
+    
+    Args:
+        entity_types: Enabled types, from 'emails', 'phones', 'urls' and 'dates'
+        
+    Returns:
+        Compiled scanner with one named group per pattern
+    """
+    initials = []
+    branches = []
+    
+    def branch(first: str, captures: str) -> None:
+        initials.append(first)
+        # The lookbehind steps back onto the consumed character, so the
+        # captures start at it; the first lookahead rejects other characters
+        branches.append(f'(?<=(?=[{first}]){captures}.)')
+    
+    if 'emails' in entity_types:
+        branch('@', f'(?=(?P<email>{_EMAIL_DOMAIN}))')
+    if 'urls' in entity_types:
+        branch('h', f'(?=(?P<url>{_URL}))')
+    
+    numbers = [(name, pattern) for name, pattern in _NUMBER_PATTERNS if _GROUP_TYPES[name] in entity_types]
+    if numbers:
+        # Stop only where at least one pattern matches, then capture each that does
+        any_number = '|'.join(pattern for _, pattern in numbers)
+        branch(r'\d(+', f'(?={any_number})' + ''.join(f'(?=(?P<{name}>{pattern}))?' for name, pattern in numbers))
+    
+    if 'dates' in entity_types:
+        branch(_MONTH_INITIALS, f'(?=(?P<date_month_first>{_MONTH_FIRST}))')
+    
+    if not branches:
+        # Matches nothing
+        return re.compile(r'(?!)')
+    
+    return re.compile(f"[{''.join(initials)}](?:{'|'.join(branches)})", re.DOTALL)
+
+
 class EntityExtractor(BaseProcessor):
     """Extract structured entities from document text."""
     
@@ -23,10 +106,22 @@ class EntityExtractor(BaseProcessor):
         self.extract_phones = self.config.get('extract_phones', True)
         self.extract_urls = self.config.get('extract_urls', True)
         self.extract_dates = self.config.get('extract_dates', True)
+        
+        enabled = [('emails', self.extract_emails), ('phones', self.extract_phones),
+                   ('urls', self.extract_urls), ('dates', self.extract_dates)]
+        self.entity_types = tuple(name for name, extract in enabled if extract)
+        self._scanner = _build_scanner(self.entity_types)
     
     def process(self, document: Document) -> Document:
         """
-        Extract entities from the document.
+        Extract entities from the document, page by page.
+        
+        Entities are recorded with their page and offsets in the page text
+        in document.entity_table, and their distinct values by type are
+        derived from the table once, into document.entities. No entity
+        pattern can span the blank line between pages, so the distinct
+        values are the same as those found in the full text. A document
+        without per-page text is treated as a single page.
         
         Args:
             document: Document object with extracted text
@@ -34,69 +129,67 @@ class EntityExtractor(BaseProcessor):
         Returns:
             Document with extracted entities
         """
-        if not document.extracted_text:
+        if not document.extracted_text and not document.text_by_page:
             return document
         
-        # Initialize entity dictionary
-        document.entities = {}
+        text_by_page = document.text_by_page or {0: document.extracted_text}
+        table = EntityTable(self.entity_types)
+        
+        for page_num in sorted(text_by_page):
+            for entity_type, value, start, end in self._find_entities(text_by_page[page_num]):
+                table.append(entity_type, value, page_num, start, end)
+        
+        document.entity_table = table
+        document.entities = table.values_by_type()
         
-        # Extract various entity types based on configuration
-        if self.extract_emails:
-            document.entities['emails'] = self._extract_emails(document.extracted_text)
-            
-        if self.extract_phones:
-            document.entities['phones'] = self._extract_phones(document.extracted_text)
-            
-        if self.extract_urls:
-            document.entities['urls'] = self._extract_urls(document.extracted_text)
-            
-        if self.extract_dates:
-            document.entities['dates'] = self._extract_dates(document.extracted_text)
-            
         return document
     
-    @staticmethod
-    def _extract_emails(text: str) -> List[str]:
-        """Extract email addresses from text."""
-        # Email regex pattern
-        pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        return sorted(set(re.findall(pattern, text)))
-    
-    @staticmethod
-    def _extract_phones(text: str) -> List[str]:
-        """Extract phone numbers from text."""
-        # Phone number patterns (handles various formats)
-        patterns = [
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # 123-456-7890
-            r'\b\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}\b',  # (123) 456-7890
-            r'\b\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'  # +1 123-456-7890
-        ]
+    def _extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """
+        Extract the distinct entities of a text.
         
-        phones = []
-        for pattern in patterns:
-            phones.extend(re.findall(pattern, text))
+        Args:
+            text: Text to scan
             
-        return sorted(set(phones))
-    
-    @staticmethod
-    def _extract_urls(text: str) -> List[str]:
-        """Extract URLs from text."""
-        # URL pattern
-        pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+[^\s]*'
-        return sorted(set(re.findall(pattern, text)))
+        Returns:
+            Dictionary mapping entity types to sorted, unique values
+        """
+        found = {name: set() for name in self.entity_types}
+        for entity_type, value, _, _ in self._find_entities(text):
+            found[entity_type].add(value)
+        
+        return {name: sorted(values) for name, values in found.items()}
     
-    @staticmethod
-    def _extract_dates(text: str) -> List[str]:
-        """Extract dates from text."""
-        # Date patterns (various formats)
-        patterns = [
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # MM/DD/YYYY or DD/MM/YYYY
-            r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b',  # Month DD, YYYY
-            r'\b\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b',  # DD Month YYYY
-        ]
+    def _find_entities(self, text: str) -> Iterator[Tuple[str, str, int, int]]:
+        """
+        Find all enabled entity types in one scan of the text.
+        
+        Args:
+            text: Text to scan
+            
+        Yields:
+            Entity type, value, start and end offset of each match, in scan order
+        """
+        # Where each pattern's last match ended: like findall, a pattern's
+        # matches do not overlap each other
+        last_end = dict.fromkeys(_GROUP_TYPES, 0)
         
-        dates = []
-        for pattern in patterns:
-            dates.extend(re.findall(pattern, text, re.IGNORECASE))
+        for match in self._scanner.finditer(text):
+            start = match.start()
             
-        return sorted(set(dates))
\ No newline at end of file
+            for name, value in match.groupdict().items():
+                if value is None:
+                    continue
+                
+                if name == 'email':
+                    # The local part runs back from the '@', but not into the previous email
+                    local_start = start
+                    while local_start > last_end[name] and text[local_start - 1] in _EMAIL_LOCAL_CHARACTERS:
+                        local_start -= 1
+                    if local_start == start:
+                        continue
+                    end = last_end[name] = start + len(value)
+                    yield 'emails', text[local_start:end], local_start, end
+                elif start >= last_end[name]:
+                    end = last_end[name] = start + len(value)
+                    yield _GROUP_TYPES[name], value, start, end
\ No newline at end of file
@@ -1,9 +1,86 @@
 import re
-from typing import Dict, Any, Optional
+import math
+from collections import Counter, defaultdict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from ..models.document import Document
+from ..models.extraction_result import ExtractionResult
 from .base_processor import BaseProcessor
 
 
+# Replacements for common problematic characters, applied in one pass
+_CHARACTER_TABLE = {
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201c': '"',  # Left double quotation mark
+    '\u201d': '"',  # Right double quotation mark
+    '\u2013': '-',  # En dash
+    '\u2014': '--', # Em dash
+    '\u00a0': ' ',  # Non-breaking space
+    '\u00ad': '-',  # Soft hyphen
+    '\u00b7': '*',  # Middle dot
+    '\uf0b7': '*',  # Bullet
+    '\u2022': '*',  # Bullet
+    '\u2026': '...', # Ellipsis
+    '\u00a9': '(c)', # Copyright sign
+    '\u00ae': '(R)', # Registered sign
+}
+
+# One character class for the whole table. str.translate would do the same,
+# but CPython only has a fast path for it on ASCII text.
+_SPECIAL_CHARACTERS = re.compile('[' + ''.join(_CHARACTER_TABLE) + ']')
+
+_HYPHENATED_BREAK = re.compile(r'(\w)-\s*\n\s*(\w)')
+_LINE_BREAK = re.compile(r'(\w)\s*\n\s*(\w)')
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+# Runs of two or more: rewriting a single space with itself changes nothing
+_SPACES = re.compile(r' {2,}')
+_LINE_START_SPACE = re.compile(r'\n ')
+_BLANK_LINES = re.compile(r'\n{3,}')
+# Numbers in headers and footers (page numbers, dates) change from page to page
+_DIGITS = re.compile(r'\d+')
+
+# A position that no cleaning pattern can match across: every pattern spans
+# only one run of whitespace, plus the word characters (and hyphen) at its
+# ends, and a run that is a single space is left as it is. Cutting between
+# two non-whitespace characters, or after a single space between them, and
+# cleaning each side separately gives the same result as cleaning it whole.
+_SAFE_CUT = re.compile(r'(?:[^\w\s]|\w(?!-))(?=\S)|(?<=\S) (?=\S)')
+# Where clean_stream cuts when there is no safe cut for too long
+_WHITESPACE_BOUNDARY = re.compile(r'(?<=\s)(?=\S)|(?<=\S)(?=\s)')
+
+# Buffered chunks after which clean_stream forces a cut, but never fewer
+# characters than _MIN_FORCED_CUT so that small chunk sizes stay exact
+_MAX_BUFFERED_CHUNKS = 4
+_MIN_FORCED_CUT = 4096
+
+
+def _numbers_follow_pages(occurrences: List[Tuple[int, Tuple[int, ...]]]) -> bool:
+    """
+    Check that a repeated line's numbers behave like a header's or footer's.
+    
+    Args:
+        occurrences: (page number, numbers in the line) for each occurrence
+        
+    Returns:
+        True if every number is the same in all occurrences, like a year,
+        keeps a fixed offset from the page number, like a page number, or
+        only increases and stays on two pages or more on average, like a
+        section number
+    """
+    occurrences = sorted(occurrences, key=lambda occurrence: occurrence[0])
+    
+    for slot in zip(*(numbers for _, numbers in occurrences)):
+        values = len(set(slot))
+        if values == 1:
+            continue
+        if len({number - page_num for (page_num, _), number in zip(occurrences, slot)}) == 1:
+            continue
+        if list(slot) == sorted(slot) and 2 * values <= len(slot):
+            continue
+        return False
+    return True
+
+
 class TextProcessor(BaseProcessor):
     """Processor for cleaning and normalizing extracted text."""
     
@@ -15,34 +92,254 @@ class TextProcessor(BaseProcessor):
             config: Configuration dictionary that may include:
                 - remove_extra_whitespace: Remove extra whitespace (default: True)
                 - fix_line_breaks: Fix broken line breaks (default: True)
-                - remove_headers_footers: Attempt to remove headers/footers (default: False)
+                - remove_headers_footers: Remove lines repeated at the top or
+                  bottom of many pages (default: True)
+                - header_footer_lines: Lines at the top and at the bottom of each
+                  page that may be headers or footers (default: 3)
+                - header_footer_fraction: Fraction of pages a line must repeat on
+                  to be removed (default: 0.5)
+                - header_footer_min_pages: Fewest pages to look for repeated
+                  lines in (default: 3)
                 - normalize_characters: Normalize special characters (default: True)
+                - chunk_size: Characters cleaned at a time by clean_stream
+                  (default: 1048576)
         """
         super().__init__(config)
         self.remove_extra_whitespace = self.config.get('remove_extra_whitespace', True)
         self.fix_line_breaks = self.config.get('fix_line_breaks', True)
-        self.remove_headers_footers = self.config.get('remove_headers_footers', False)
+        self.remove_headers_footers = self.config.get('remove_headers_footers', True)
+        self.header_footer_lines = self.config.get('header_footer_lines', 3)
+        self.header_footer_fraction = self.config.get('header_footer_fraction', 0.5)
+        self.header_footer_min_pages = self.config.get('header_footer_min_pages', 3)
         self.normalize_characters = self.config.get('normalize_characters', True)
+        self.chunk_size = self.config.get('chunk_size', 1024 * 1024)
     
     def process(self, document: Document) -> Document:
         """
         Clean and normalize the text in the document.
         
+        Headers and footers are found across pages and removed from the raw
+        page text first, since line joining would merge them into the body.
+        When the full text is the join of the pages, as the extractors build
+        it, it is rebuilt from the remaining lines, each page is cleaned once
+        and the cleaned full text is derived from the cleaned pages. Otherwise
+        both are cleaned separately, and the full text keeps its headers.
+        
         Args:
             document: Document object with extracted text
             
         Returns:
             Document with cleaned text
         """
+        pages = document.text_by_page
+        joined = bool(pages) and document.extracted_text == ExtractionResult.join_pages(
+            pages[n] for n in sorted(pages))
+        
+        if self.remove_headers_footers and pages:
+            self._remove_headers_footers(pages)
+            if joined:
+                document.extracted_text = ExtractionResult.join_pages(pages[n] for n in sorted(pages))
+        
+        if joined and self.remove_extra_whitespace:
+            cleaned_pages, document.extracted_text = self._clean_pages(pages)
+            pages.update(cleaned_pages)
+            return document
+            
         # First clean the full text
         document.extracted_text = self._clean_text(document.extracted_text)
         
         # Then clean each page individually
-        for page_num, text in document.text_by_page.items():
-            document.text_by_page[page_num] = self._clean_text(text)
+        for page_num, text in pages.items():
+            pages[page_num] = self._clean_text(text)
         
         return document
     
+    def _clean_pages(self, pages: Dict[int, str]) -> Tuple[Dict[int, str], str]:
+        """
+        Clean each page once and derive the cleaned full text from the pages.
+        
+        Each page is split at its first and last safe cut into head, core and
+        tail, which are cleaned separately. The cleaned page is their
+        concatenation; the cleaned full text reuses the cores and only
+        re-cleans the short regions around page joins (a tail, the page
+        separator and the next head).
+        
+        Args:
+            pages: Dictionary mapping page numbers to raw page text
+            
+        Returns:
+            Tuple of (cleaned pages, cleaned full text), identical to cleaning
+            each page and the joined full text separately
+        """
+        cleaned = {}
+        full_pieces = []
+        pending = None
+        
+        for page_num in sorted(pages):
+            text = pages[page_num]
+            if not text:
+                # Empty pages are left out of the full text
+                cleaned[page_num] = text
+                continue
+                
+            if self.normalize_characters:
+                text = self._normalize_characters(text)
+                
+            cuts = self._cut_points(text)
+            if cuts is None:
+                # No safe cut: the whole page joins the region between cuts
+                cleaned[page_num] = self._clean_fragment(text).strip()
+                pending = text if pending is None else pending + "\n\n" + text
+                continue
+                
+            first, last = cuts
+            head, core, tail = text[:first], text[first:last], text[last:]
+            
+            clean_head = self._clean_fragment(head)
+            clean_core = self._clean_fragment(core)
+            clean_tail = self._clean_fragment(tail)
+            cleaned[page_num] = (clean_head + clean_core + clean_tail).strip()
+            
+            if pending is None:
+                full_pieces.append(clean_head)
+            else:
+                full_pieces.append(self._clean_fragment(pending + "\n\n" + head))
+            full_pieces.append(clean_core)
+            pending = tail
+            
+        if pending is not None:
+            full_pieces.append(self._clean_fragment(pending))
+            
+        return cleaned, "".join(full_pieces).strip()
+    
+    def clean_stream(self, pages: Iterable[str], chunk_size: Optional[int] = None) -> Iterator[str]:
+        """
+        Clean the full text of a document from its pages, in bounded chunks.
+        
+        The pages are joined as the extractors join them, and the text is
+        cleaned a chunk at a time, cutting only at safe cuts so rules such as
+        hyphenation and line joins see the same context as on the whole text.
+        Text that has no safe cut for several chunks (such as single letters
+        on separate lines) is cut at the last whitespace boundary instead, so
+        memory use stays proportional to the chunk size; only there can the
+        result differ from cleaning the whole text.
+        
+        Header/footer removal is not applied: it needs every page before the
+        first one can be cleaned.
+        
+        Args:
+            pages: Page texts in page order, e.g. from an extractor's iter_pages
+            chunk_size: Characters to collect before cleaning (default: the
+                configured chunk_size)
+            
+        Yields:
+            Pieces of cleaned text whose concatenation is identical to
+            cleaning the joined full text at once, apart from forced cuts
+        """
+        chunk_size = chunk_size or self.chunk_size
+        buffer = ""
+        started = False
+        # Length of the buffer already searched for a cut without finding one
+        searched = 0
+        forced_cut = max(_MAX_BUFFERED_CHUNKS * chunk_size, _MIN_FORCED_CUT)
+        
+        for page in pages:
+            if not page:
+                continue
+                
+            # Pages are joined with a blank line, like ExtractionResult.join_pages
+            if started:
+                page = "\n\n" + page
+                
+            for offset in range(0, len(page), chunk_size):
+                piece = page[offset:offset + chunk_size]
+                if self.normalize_characters:
+                    piece = self._normalize_characters(piece)
+                    
+                buffer += piece
+                if not started:
+                    # The joined text is stripped; skip whitespace before any content
+                    buffer = buffer.lstrip()
+                    started = bool(buffer)
+                    
+                if len(buffer) >= chunk_size:
+                    # A cut needs the characters around it, so the end of the
+                    # searched part is searched again
+                    cut = self._last_cut(buffer, max(0, searched - 2))
+                    if cut is None and len(buffer) >= forced_cut:
+                        cut = self._last_boundary(buffer)
+                    if cut is not None:
+                        yield self._clean_fragment(buffer[:cut])
+                        buffer = buffer[cut:]
+                    searched = len(buffer)
+                        
+        buffer = buffer.rstrip()
+        if buffer:
+            yield self._clean_fragment(buffer)
+    
+    @staticmethod
+    def _last_cut(text: str, start: int = 0) -> Optional[int]:
+        """
+        Find the last safe cut position in a text.
+        
+        Args:
+            text: Normalized text
+            start: Position to search from
+            
+        Returns:
+            The cut position, or None if there is no safe cut after start
+        """
+        # The last cut is almost always near the end; widen the window until found
+        window = 64
+        while True:
+            window_start = max(start, len(text) - window)
+            last = None
+            for match in _SAFE_CUT.finditer(text, window_start):
+                last = match.end()
+            if last is not None or window_start == start:
+                return last
+            window *= 2
+    
+    @staticmethod
+    def _last_boundary(text: str) -> int:
+        """
+        Find the last position where whitespace starts or ends in a text.
+        
+        Args:
+            text: Normalized text
+            
+        Returns:
+            The boundary position, or the end of the text if it has none
+        """
+        window = 64
+        while True:
+            window_start = max(0, len(text) - window)
+            last = None
+            for match in _WHITESPACE_BOUNDARY.finditer(text, window_start):
+                last = match.end()
+            if last:
+                return last
+            if window_start == 0:
+                return len(text)
+            window *= 2
+    
+    @staticmethod
+    def _cut_points(text: str) -> Optional[Tuple[int, int]]:
+        """
+        Find the first and last safe cut positions in a text.
+        
+        Args:
+            text: Normalized text
+            
+        Returns:
+            Tuple of (first, last) cut positions, or None if there is no safe cut
+        """
+        match = _SAFE_CUT.search(text)
+        if match is None:
+            return None
+        first = match.end()
+        return first, TextProcessor._last_cut(text, first - 1)
+    
     def _clean_text(self, text: str) -> str:
         """
         Apply cleaning operations to a text string.
@@ -60,104 +357,138 @@ class TextProcessor(BaseProcessor):
         if self.normalize_characters:
             text = self._normalize_characters(text)
             
-        # Fix broken line breaks
-        if self.fix_line_breaks:
-            text = self._fix_line_breaks(text)
-            
-        # Remove extra whitespace
+        # Fix broken line breaks and remove extra whitespace
+        text = self._clean_fragment(text)
         if self.remove_extra_whitespace:
-            text = self._remove_extra_whitespace(text)
+            text = text.strip()
             
-        # Remove headers and footers if requested
-        if self.remove_headers_footers:
-            text = self._remove_headers_footers(text)
+        return text
+    
+    def _clean_fragment(self, text: str) -> str:
+        """
+        Apply the line-break and whitespace rules, without trimming the ends.
+        
+        Args:
+            text: Normalized text, or a piece of it between safe cuts
             
+        Returns:
+            Cleaned text
+        """
+        if self.fix_line_breaks:
+            text = self._fix_line_breaks(text)
+        if self.remove_extra_whitespace:
+            text = self._collapse_whitespace(text)
         return text
     
     @staticmethod
     def _normalize_characters(text: str) -> str:
         """Normalize special characters and encodings."""
-        # Replace common problematic characters
-        replacements = {
-            '\u2018': "'",  # Left single quotation mark
-            '\u2019': "'",  # Right single quotation mark
-            '\u201c': '"',  # Left double quotation mark
-            '\u201d': '"',  # Right double quotation mark
-            '\u2013': '-',  # En dash
-            '\u2014': '--', # Em dash
-            '\u00a0': ' ',  # Non-breaking space
-            '\u00ad': '-',  # Soft hyphen
-            '\u00b7': '*',  # Middle dot
-            '\uf0b7': '*',  # Bullet
-            '\u2022': '*',  # Bullet
-            '\u2026': '...', # Ellipsis
-            '\u00a9': '(c)', # Copyright sign
-            '\u00ae': '(R)', # Registered sign
-        }
-        
-        for orig, repl in replacements.items():
-            text = text.replace(orig, repl)
-            
-        return text
+        if text.isascii():
+            return text
+        return _SPECIAL_CHARACTERS.sub(lambda match: _CHARACTER_TABLE[match.group()], text)
     
     @staticmethod
     def _fix_line_breaks(text: str) -> str:
         """Fix incorrect line breaks in paragraphs."""
         # Remove line breaks that occur in the middle of sentences
-        text = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', text)  # Remove hyphenation across lines
-        text = re.sub(r'(\w)\s*\n\s*(\w)', r'\1 \2', text)  # Join words separated by line breaks
+        text = _HYPHENATED_BREAK.sub(r'\1\2', text)  # Remove hyphenation across lines
+        text = _LINE_BREAK.sub(r'\1 \2', text)  # Join words separated by line breaks
         
         # Preserve paragraph breaks (blank lines)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = _PARAGRAPH_BREAK.sub('\n\n', text)
         
         return text
     
     @staticmethod
-    def _remove_extra_whitespace(text: str) -> str:
-        """Remove redundant whitespace."""
+    def _collapse_whitespace(text: str) -> str:
+        """Collapse redundant spaces and blank lines."""
         # Replace multiple spaces with a single space
-        text = re.sub(r' +', ' ', text)
+        text = _SPACES.sub(' ', text)
         
         # Remove spaces at the beginning of lines
-        text = re.sub(r'\n ', '\n', text)
+        text = _LINE_START_SPACE.sub('\n', text)
         
         # Remove extra blank lines (more than 2 in a row)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _BLANK_LINES.sub('\n\n', text)
         
+        return text
+    
+    @staticmethod
+    def _remove_extra_whitespace(text: str) -> str:
+        """Remove redundant whitespace."""
         # Trim leading/trailing whitespace
-        text = text.strip()
+        return TextProcessor._collapse_whitespace(text).strip()
+    
+    def _remove_headers_footers(self, pages: Dict[int, str]) -> None:
+        """
+        Remove header and footer lines repeated across pages, in place.
         
-        return text
+        The first and last few non-blank lines of every page are candidates.
+        A candidate is keyed by its position (top or bottom) and its text,
+        lowercased with whitespace collapsed and numbers treated as wildcards,
+        so "Page 3 of 40" and "Page 4 of 40" match. Keys found on enough pages
+        are removed wherever they are candidates, provided their numbers run
+        like page or section numbers or stay the same (see
+        _numbers_follow_pages); rows of figures or totals that merely share a
+        shape are content. Each page is split once, so the cost is linear in the
+        document length.
+        
+        Args:
+            pages: Dictionary mapping page numbers to raw page text
+        """
+        page_lines = {}
+        page_candidates = {}
+        counts = Counter()
+        numbers_by_key = defaultdict(list)
+        
+        for page_num, text in pages.items():
+            lines = text.split('\n')
+            candidates = self._header_footer_candidates(lines)
+            if candidates:
+                page_lines[page_num] = lines
+                page_candidates[page_num] = candidates
+                # Count each key once per page
+                counts.update({key for _, key, _ in candidates})
+                for _, key, numbers in candidates:
+                    if numbers:
+                        numbers_by_key[key].append((page_num, numbers))
+                
+        if len(page_candidates) < self.header_footer_min_pages:
+            return
+            
+        threshold = max(2, math.ceil(self.header_footer_fraction * len(page_candidates)))
+        repeated = {key for key, count in counts.items()
+                    if count >= threshold and _numbers_follow_pages(numbers_by_key[key])}
+        if not repeated:
+            return
+            
+        for page_num, candidates in page_candidates.items():
+            remove = {index for index, key, _ in candidates if key in repeated}
+            if remove:
+                lines = page_lines[page_num]
+                pages[page_num] = '\n'.join(line for index, line in enumerate(lines) if index not in remove)
     
-    def _remove_headers_footers(self, text: str) -> str:
-        """Attempt to identify and remove headers and footers."""
-        # This is a simplified implementation - a more robust approach would
-        # analyze repetitive patterns across multiple pages
-        
-        lines = text.split('\n')
-        if len(lines) < 5:
-            return text  # Not enough lines to safely identify headers/footers
-        
-        # Skip potentially the first and last lines if they look like headers/footers
-        # This is a very basic heuristic - a real implementation would be more sophisticated
-        filtered_lines = []
-        skip_first = False
-        skip_last = False
-        
-        # Simple heuristics: headers/footers are often short and may contain
-        # page numbers or document identifiers
-        if len(lines[0]) < 80 and (re.search(r'\bpage\b|\d+', lines[0].lower()) or 
-                                  len(lines[0].strip()) < 30):
-            skip_first = True
-            
-        if len(lines[-1]) < 80 and (re.search(r'\bpage\b|\d+', lines[-1].lower()) or
-                                   len(lines[-1].strip()) < 30):
-            skip_last = True
-        
-        # Build filtered text
-        for i, line in enumerate(lines):
-            if (i == 0 and skip_first) or (i == len(lines) - 1 and skip_last):
-                continue
-            filtered_lines.append(line)
+    def _header_footer_candidates(self, lines: List[str]) -> List[Tuple[int, Tuple[str, str], Tuple[int, ...]]]:
+        """
+        Key the first and last non-blank lines of a page.
+        
+        Args:
+            lines: Lines of the page
             
-        return '\n'.join(filtered_lines)
\ No newline at end of file
+        Returns:
+            List of (line index, (position, normalized text), numbers in the
+            line) tuples
+        """
+        candidates = []
+        for position, indexes in (('top', range(len(lines))),
+                                  ('bottom', range(len(lines) - 1, -1, -1))):
+            found = 0
+            for index in indexes:
+                if found == self.header_footer_lines:
+                    break
+                normalized = ' '.join(lines[index].lower().split())
+                if normalized:
+                    numbers = tuple(int(number) for number in _DIGITS.findall(normalized))
+                    candidates.append((index, (position, _DIGITS.sub('#', normalized)), numbers))
+                    found += 1
+        return candidates
\ No newline at end of file
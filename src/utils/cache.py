@@ -0,0 +1,143 @@
+import os
+import tempfile
+from typing import Dict, Any, Optional
+
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GiB
+
+
+class DiskCache:
+    """Size-bounded on-disk key/value store with least-recently-used eviction."""
+    
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, suffix: str = '.bin'):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Byte budget for all entries together
+            suffix: File extension for entry files
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(size for _, _, size in self._scan())
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read an entry and mark it as recently used.
+        
+        Args:
+            key: Entry key (a hex digest)
+            
+        Returns:
+            Entry contents, or None if the key is not cached
+        """
+        path = self._path(key)
+        
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Entry recency is tracked through the file's modification time
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+            
+        self.hits += 1
+        return data
+    
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store an entry, evicting least recently used entries if over budget.
+        
+        Args:
+            key: Entry key (a hex digest)
+            data: Entry contents
+        """
+        if len(data) > self.max_bytes:
+            return
+            
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        try:
+            self._total_bytes -= os.path.getsize(path)
+        except OSError:
+            pass
+            
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+            
+        self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for path, _, _ in self._scan():
+            os.remove(path)
+        self._total_bytes = 0
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size of the cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes
+        }
+    
+    def _path(self, key: str) -> str:
+        """Map a key to its entry file, sharded by the first two characters."""
+        return os.path.join(self.cache_dir, key[:2], key + self.suffix)
+    
+    def _scan(self):
+        """List (path, mtime, size) for every entry on disk."""
+        entries = []
+        
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(self.suffix):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_mtime, stat.st_size))
+                    
+        return entries
+    
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = sorted(self._scan(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        
+        # Evict down to 90% of the budget so a full cache does not rescan on every put
+        target = self.max_bytes * 0.9
+        
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+            
+        self._total_bytes = total
\ No newline at end of file
@@ -10,24 +10,58 @@ class Config:
         'extractors': {
             'default': 'auto',
             'pypdf': {},
-            'pdfplumber': {},
+            'pdfplumber': {
+                'low_memory': False,
+                'text_mode': 'default'
+            },
             'ocr': {
                 'dpi': 300,
-                'lang': 'eng'
+                'lang': 'eng',
+                'workers': 1,
+                'window_size': 4,
+                'adaptive_dpi': False,
+                'low_dpi': 150,
+                'min_confidence': 60,
+                'ocr_backend': 'pytesseract',
+                'grayscale': False,
+                'render_cache': {
+                    'dir': None,
+                    'max_bytes': 512 * 1024 * 1024
+                }
+            },
+            'cache': {
+                'dir': None,
+                'max_bytes': 1024 * 1024 * 1024
+            },
+            'sandbox': {
+                'enabled': False,
+                'timeout': 120,
+                'max_memory_mb': 2048,
+                'max_documents': 50
             }
         },
         'processors': {
             'text_processor': {
                 'remove_extra_whitespace': True,
                 'fix_line_breaks': True,
-                'remove_headers_footers': False,
-                'normalize_characters': True
+                'remove_headers_footers': True,
+                'header_footer_lines': 3,
+                'header_footer_fraction': 0.5,
+                'header_footer_min_pages': 3,
+                'normalize_characters': True,
+                'chunk_size': 1024 * 1024
             },
             'content_analyzer': {
                 'extract_keywords': True,
                 'num_keywords': 15,
                 'language': 'english',
-                'generate_summary': False
+                'generate_summary': False,
+                'summary_sentences': 5,
+                'summary_window': 50,
+                'keyword_engine': 'nltk',
+                'nltk_data': None,
+                'corpus_index': None,
+                'update_corpus_index': True
             },
             'entity_extractor': {
                 'extract_emails': True,
@@ -0,0 +1,182 @@
+import io
+import os
+import mmap
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from typing import Union, BinaryIO, Iterator
+
+
+# Anything the extractors accept as a PDF: a filesystem path, the raw bytes
+# (bytes, bytearray, memoryview, mmap) or a readable, seekable binary file object.
+PDFSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+
+class BufferReader(io.RawIOBase):
+    """Read-only, seekable file object over an in-memory buffer, without copying it."""
+    
+    def __init__(self, buffer):
+        """
+        Initialize the reader.
+        
+        Args:
+            buffer: Any object supporting the buffer protocol
+        """
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes()
+        self._pos = max(self._pos, end)
+        return data
+    
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._pos = max(0, position)
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def close(self) -> None:
+        # Release the export so an underlying mmap can be closed by its owner
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def is_path(source: PDFSource) -> bool:
+    """Check whether a PDF source is a filesystem path."""
+    return isinstance(source, (str, os.PathLike))
+
+
+def is_buffer(source: PDFSource) -> bool:
+    """Check whether a PDF source is an in-memory buffer."""
+    return isinstance(source, (bytes, bytearray, memoryview, mmap.mmap))
+
+
+def check_source(source: PDFSource) -> None:
+    """
+    Validate a PDF source before extraction.
+    
+    Args:
+        source: PDF path, buffer or binary file object
+        
+    Raises:
+        FileNotFoundError: If a path source does not exist
+        TypeError: If the source is not a supported type
+    """
+    if is_path(source):
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"PDF file not found: {source}")
+    elif not is_buffer(source) and not hasattr(source, 'read'):
+        raise TypeError(f"Unsupported PDF source type: {type(source).__name__}")
+
+
+@contextmanager
+def open_pdf_stream(source: PDFSource) -> Iterator[BinaryIO]:
+    """
+    Open a PDF source as a seekable binary stream without copying it.
+    
+    Paths are memory-mapped so parsers read pages straight from the page
+    cache instead of through buffered file I/O. Buffers are wrapped in a
+    zero-copy reader, and file objects are used as they are.
+    
+    Args:
+        source: PDF path, buffer or binary file object
+        
+    Yields:
+        Seekable binary stream positioned at the start of the PDF
+    """
+    check_source(source)
+    
+    if is_path(source):
+        with open(source, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # Empty files cannot be mapped; let the parser report the error
+                yield file
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+    elif is_buffer(source):
+        with BufferReader(source) as stream:
+            yield stream
+    else:
+        source.seek(0)
+        yield source
+
+
+@contextmanager
+def pdf_source_path(source: PDFSource) -> Iterator[str]:
+    """
+    Provide a filesystem path for a PDF source.
+    
+    Needed for tools such as poppler that only read files. Path sources are
+    used directly; other sources are written to a temporary file once and
+    removed afterwards.
+    
+    Args:
+        source: PDF path, buffer or binary file object
+        
+    Yields:
+        Path to a file containing the PDF
+    """
+    check_source(source)
+    
+    if is_path(source):
+        yield os.fspath(source)
+        return
+        
+    fd, path = tempfile.mkstemp(suffix='.pdf')
+    try:
+        with os.fdopen(fd, 'wb') as file, open_pdf_stream(source) as stream:
+            for chunk in iter(lambda: stream.read(1024 * 1024), b''):
+                file.write(chunk)
+        yield path
+    finally:
+        os.remove(path)
+
+
+def source_digest(source: PDFSource, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hex digest of a PDF source's contents.
+    
+    Args:
+        source: PDF path, buffer or binary file object
+        chunk_size: Number of bytes to read at a time from files
+        
+    Returns:
+        Hex digest string
+    """
+    check_source(source)
+    
+    if is_buffer(source):
+        return hashlib.sha256(source).hexdigest()
+        
+    digest = hashlib.sha256()
+    with open_pdf_stream(source) as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b''):
+            digest.update(chunk)
+        if not is_path(source):
+            stream.seek(0)
+    return digest.hexdigest()
\ No newline at end of file
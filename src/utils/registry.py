@@ -0,0 +1,108 @@
+import importlib
+from typing import Dict, Any, List, Union
+
+
+class PluginRegistry:
+    """Registry of named classes that are only imported when first used."""
+    
+    def __init__(self, entry_point_group: str = None):
+        """
+        Initialize the registry.
+        
+        Args:
+            entry_point_group: Entry point group third-party packages can use
+                to add classes, e.g. 'scoreme.extractors'
+        """
+        self.entry_point_group = entry_point_group
+        self._targets: Dict[str, Union[str, type]] = {}
+        self._loaded: Dict[str, type] = {}
+        self._entry_points_loaded = False
+    
+    def register(self, name: str, target: Union[str, type]) -> None:
+        """
+        Register a class under a name.
+        
+        Args:
+            name: Name the class is created by
+            target: The class itself, or a 'package.module:ClassName' string
+                imported on first use
+        """
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+    
+    def load(self, name: str) -> type:
+        """
+        Import and return the class registered under a name.
+        
+        Args:
+            name: Registered name
+            
+        Returns:
+            The registered class
+            
+        Raises:
+            KeyError: If nothing is registered under the name
+        """
+        if name in self._loaded:
+            return self._loaded[name]
+        
+        if name not in self._targets:
+            self._load_entry_points()
+        if name not in self._targets:
+            raise KeyError(name)
+        
+        target = self._targets[name]
+        if isinstance(target, str):
+            module_name, _, attribute = target.partition(':')
+            target = getattr(importlib.import_module(module_name), attribute)
+        elif not isinstance(target, type):
+            # An entry point discovered from an installed plugin
+            target = target.load()
+        
+        self._loaded[name] = target
+        return target
+    
+    def create(self, name: str, config: Dict[str, Any] = None) -> Any:
+        """
+        Create an instance of the class registered under a name.
+        
+        Args:
+            name: Registered name
+            config: Configuration passed to the class
+            
+        Returns:
+            New instance
+            
+        Raises:
+            KeyError: If nothing is registered under the name
+        """
+        return self.load(name)(config)
+    
+    def names(self) -> List[str]:
+        """
+        List the registered names, including entry point plugins, without importing them.
+        
+        Returns:
+            Registered names, built-in ones first
+        """
+        self._load_entry_points()
+        return list(self._targets)
+    
+    def _load_entry_points(self) -> None:
+        """Add the entry points of the registry's group, once."""
+        if self._entry_points_loaded or not self.entry_point_group:
+            return
+        self._entry_points_loaded = True
+        
+        # importlib.metadata is itself slow to import; only plugin lookups need it
+        from importlib import metadata
+        
+        try:
+            entry_points = metadata.entry_points(group=self.entry_point_group)
+        except Exception as e:
+            print(f"Error reading plugins for {self.entry_point_group}: {str(e)}")
+            return
+        
+        for entry_point in entry_points:
+            # Built-in names take precedence over plugins
+            self._targets.setdefault(entry_point.name, entry_point)
\ No newline at end of file
@@ -0,0 +1,86 @@
+import io
+import hashlib
+from typing import Dict, Any, Optional
+from PIL import Image
+from .cache import DiskCache, DEFAULT_MAX_BYTES
+
+
+class RenderCache:
+    """On-disk cache of rendered page images, shared across OCR runs."""
+    
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the render cache.
+        
+        Args:
+            cache_dir: Directory holding the cached page images
+            max_bytes: Byte budget for all cached images together
+        """
+        self.cache = DiskCache(cache_dir, max_bytes, suffix='.png')
+    
+    @staticmethod
+    def make_key(doc_key: str, page: int, dpi: int, mode: str) -> str:
+        """
+        Build the cache key for one rendered page.
+        
+        Args:
+            doc_key: Hash of the PDF contents
+            page: Page number (1-indexed, as passed to the renderer)
+            dpi: Rendering DPI
+            mode: PIL colour mode of the rendered image (e.g. 'L')
+            
+        Returns:
+            Hex digest key
+        """
+        return hashlib.sha256(f"{doc_key}:{page}:{dpi}:{mode}".encode()).hexdigest()
+    
+    def get(self, doc_key: str, page: int, dpi: int, mode: str) -> Optional[Image.Image]:
+        """
+        Load a cached page image.
+        
+        Args:
+            doc_key: Hash of the PDF contents
+            page: Page number (1-indexed)
+            dpi: Rendering DPI
+            mode: PIL colour mode
+            
+        Returns:
+            The page image, or None if it is not cached
+        """
+        data = self.cache.get(self.make_key(doc_key, page, dpi, mode))
+        if data is None:
+            return None
+            
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.load()
+        except (OSError, SyntaxError) as e:
+            print(f"Error reading cached page image: {str(e)}")
+            return None
+            
+        return image
+    
+    def put(self, doc_key: str, page: int, dpi: int, image: Image.Image) -> None:
+        """
+        Store a rendered page image.
+        
+        Args:
+            doc_key: Hash of the PDF contents
+            page: Page number (1-indexed)
+            dpi: Rendering DPI
+            image: Rendered page
+        """
+        # Fast PNG compression: scanned text pages still shrink several times
+        # over raw pixels, without making the cache a rendering bottleneck
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', compress_level=1)
+        
+        try:
+            self.cache.put(self.make_key(doc_key, page, dpi, image.mode), buffer.getvalue())
+        except OSError as e:
+            print(f"Error writing cached page image: {str(e)}")
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the underlying cache."""
+        return self.cache.stats
\ No newline at end of file
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+from typing import Dict, Iterable
+
+
+# Terms looked up per query, below SQLite's default limit on bound parameters
+_QUERY_BATCH = 500
+
+
+class DocumentFrequencyIndex:
+    """Persistent, incrementally updated document frequencies of a corpus."""
+    
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Open (or create) the index.
+        
+        The index is a SQLite database with one row per term and one per
+        indexed document, so adding a document only updates the counts of
+        its own terms, and looking up a term is an index seek regardless of
+        corpus size.
+        
+        Args:
+            path: Database file
+            timeout: Seconds to wait for another process writing to the index
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, timeout=timeout)
+        # Write-ahead logging lets readers and one writer work concurrently
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents (key BLOB PRIMARY KEY) WITHOUT ROWID")
+            # Counting the documents table would scan it, so the total is kept here
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self._conn.execute("INSERT OR IGNORE INTO totals VALUES ('documents', 0)")
+    
+    def add(self, key: bytes, terms: Iterable[str]) -> bool:
+        """
+        Count the terms of a document, once per document.
+        
+        Args:
+            key: Identifier of the document, e.g. a digest of its text
+            terms: Terms in the document; repeats are counted once
+            
+        Returns:
+            True if the document was added, False if it was already indexed
+        """
+        with self._conn:
+            if self._conn.execute("INSERT OR IGNORE INTO documents VALUES (?)", (key,)).rowcount == 0:
+                return False
+            self._conn.executemany(
+                "INSERT INTO terms VALUES (?, 1) ON CONFLICT (term) DO UPDATE SET df = df + 1",
+                ((term,) for term in set(terms)))
+            self._conn.execute("UPDATE totals SET value = value + 1 WHERE name = 'documents'")
+        return True
+    
+    def __contains__(self, key: bytes) -> bool:
+        """Whether a document has been indexed."""
+        return self._conn.execute("SELECT 1 FROM documents WHERE key = ?", (key,)).fetchone() is not None
+    
+    @property
+    def document_count(self) -> int:
+        """Number of documents indexed."""
+        return self._conn.execute("SELECT value FROM totals WHERE name = 'documents'").fetchone()[0]
+    
+    def document_frequencies(self, terms: Iterable[str]) -> Dict[str, int]:
+        """
+        Look up how many documents contain each term.
+        
+        Args:
+            terms: Terms to look up
+            
+        Returns:
+            Dictionary mapping terms to document frequencies; terms not in
+            the index are left out
+        """
+        terms = list(terms)
+        frequencies = {}
+        
+        for start in range(0, len(terms), _QUERY_BATCH):
+            batch = terms[start:start + _QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            frequencies.update(self._conn.execute(
+                f"SELECT term, df FROM terms WHERE term IN ({placeholders})", batch))
+        
+        return frequencies
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import json
+import filecmp
+import tempfile
+import unittest
+from benchmarks.metrics import levenshtein, character_errors, percentile
+from benchmarks.extractors import compare_to_baseline, load_ground_truth
+from benchmarks.corpus import generate_corpus
+from src.extractors.pypdf_extractor import PyPDFExtractor
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the benchmark metrics."""
+    
+    def test_levenshtein(self):
+        """Test the bit-parallel edit distance on known pairs."""
+        self.assertEqual(levenshtein("kitten", "sitting"), 3)
+        self.assertEqual(levenshtein("", "abc"), 3)
+        self.assertEqual(levenshtein("flaw", "lawn"), 2)
+        self.assertEqual(levenshtein("same text", "same text"), 0)
+        self.assertEqual(levenshtein("a" * 200, "a" * 150 + "b" * 50), 50)
+    
+    def test_character_errors_ignore_layout(self):
+        """Test that whitespace differences are not counted as errors."""
+        errors, characters = character_errors(["Hello\n  world"], ["Hello world"])
+        
+        self.assertEqual((errors, characters), (0, 11))
+        self.assertEqual(percentile([4, 1, 3, 2], 50), 2)
+        self.assertEqual(percentile([4, 1, 3, 2], 100), 4)
+    
+    def test_compare_to_baseline_flags_regressions(self):
+        """Test that slowdowns beyond the tolerance are reported."""
+        def run(pages_per_second, cer):
+            return {'extractors': {'pypdf': {
+                'pages_per_second': pages_per_second,
+                'latency_ms': {'p99': 10.0},
+                'peak_rss_mb': 50.0,
+                'cpu_seconds': 1.0,
+                'cer': cer
+            }}}
+        
+        self.assertEqual(compare_to_baseline(run(95, 0.01), run(100, 0.01)), [])
+        
+        regressions = compare_to_baseline(run(50, 0.05), run(100, 0.01))
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("pypdf: pages_per_second"))
+    
+    
+    def test_corpus_is_reproducible(self):
+        """Test that the same seed gives identical files with matching ground truth."""
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            options = {'kinds': ['text', 'scanned', 'entities'], 'documents': 1, 'pages': 2}
+            manifest = generate_corpus(first, seed=7, **options)
+            generate_corpus(second, seed=7, **options)
+            
+            names = sorted(os.listdir(first))
+            self.assertEqual(filecmp.cmpfiles(first, second, names, shallow=False)[0], names)
+            self.assertEqual([document['pages'] for document in manifest['documents']], [2, 2, 2])
+            
+            # The text layer reproduces the ground truth; scanned pages have none
+            pdf_path = os.path.join(first, "text_000.pdf")
+            pages = [text for _, text in PyPDFExtractor().iter_pages(pdf_path)]
+            self.assertEqual(character_errors(pages, load_ground_truth(pdf_path))[0], 0)
+            
+            scanned = PyPDFExtractor().extract_text(os.path.join(first, "scanned_000.pdf"))
+            self.assertEqual(scanned, "")
+            
+            with open(os.path.join(first, "entities_000.entities.json"), encoding='utf-8') as f:
+                entities = json.load(f)
+            self.assertTrue(all(entities[name] for name in ('emails', 'phones', 'urls', 'dates')))
+            
+            # Every recorded entity is on one line of the document as written
+            lines = [line for page in load_ground_truth(os.path.join(first, "entities_000.pdf"))
+                     for line in page.split("\n")]
+            for values in entities.values():
+                for value in values:
+                    self.assertTrue(any(value in line for line in lines), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,8 +1,21 @@
+import io
 import os
+import sys
+import time
 import unittest
 import tempfile
+import multiprocessing
+from unittest import mock
+import PyPDF2
 from src.extractors.pypdf_extractor import PyPDFExtractor
 from src.extractors.pdf_plumber_extractor import PDFPlumberExtractor
+from src.extractors.ocr_extractor import OCRExtractor
+from src.extractors.hybrid_extractor import HybridExtractor
+from src.extractors.hedged_extractor import HedgedExtractor
+from src.extractors.sandboxed_extractor import SandboxedExtractor
+from src.extractors.extractor_factory import ExtractorFactory
+from src.extractors.ocr_backends import OCRBackend, get_backend, _page_confidences
+from src.models.extraction_result import ExtractionResult
 
 
 class TestExtractors(unittest.TestCase):
@@ -14,6 +27,19 @@ class TestExtractors(unittest.TestCase):
         test_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.test_pdf_path = os.path.join(test_dir, "test3.pdf")
         
+        # Small generated PDF with blank pages for tests that need a real file
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.blank_pdf_path = os.path.join(self.temp_dir.name, "blank.pdf")
+        writer = PyPDF2.PdfWriter()
+        for _ in range(3):
+            writer.add_blank_page(width=612, height=792)
+        with open(self.blank_pdf_path, 'wb') as f:
+            writer.write(f)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+        
     def test_pypdf_extractor(self):
         """Test PyPDFExtractor functionality."""
         if not os.path.exists(self.test_pdf_path):
@@ -53,6 +79,397 @@ class TestExtractors(unittest.TestCase):
         metadata = extractor.get_metadata(self.test_pdf_path)
         self.assertIsInstance(metadata, dict)
         self.assertIn('pages', metadata)
+    
+    
+    def test_extract_all_matches_individual_calls(self):
+        """Test that extract_all returns the same data as the separate methods."""
+        pdf_path = self.test_pdf_path if os.path.exists(self.test_pdf_path) else self.blank_pdf_path
+        
+        for extractor in (PyPDFExtractor(), PDFPlumberExtractor()):
+            result = extractor.extract_all(pdf_path)
+            self.assertEqual(result.extracted_text, extractor.extract_text(pdf_path))
+            self.assertEqual(result.text_by_page, extractor.extract_text_by_page(pdf_path))
+            self.assertEqual(result.metadata['pages'], extractor.get_metadata(pdf_path)['pages'])
+    
+    def test_extract_all_blank_pages(self):
+        """Test extract_all on a PDF without a text layer."""
+        result = PyPDFExtractor().extract_all(self.blank_pdf_path)
+        
+        self.assertEqual(result.metadata['pages'], 3)
+        self.assertEqual(result.text_by_page, {0: "", 1: "", 2: ""})
+        self.assertEqual(result.extracted_text, "")
+    
+    
+    def test_pdfplumber_low_memory_releases_pages(self):
+        """Test that low-memory mode closes each page and returns the same text."""
+        import pdfplumber.page
+        
+        expected = PDFPlumberExtractor().extract_all(self.blank_pdf_path)
+        extractor = PDFPlumberExtractor({'low_memory': True, 'text_mode': 'simple'})
+        
+        with mock.patch.object(pdfplumber.page.Page, 'close', autospec=True) as close:
+            result = extractor.extract_all(self.blank_pdf_path)
+            
+        # Once per page after its text is taken, and again when the document closes
+        self.assertEqual(close.call_count, 6)
+        self.assertEqual(result.text_by_page, expected.text_by_page)
+        self.assertEqual(result.metadata, expected.metadata)
+    
+    
+    def test_ocr_renders_in_page_windows(self):
+        """Test that OCR rasterizes page windows and returns pages in order."""
+        def fake_convert(pdf_path, dpi, first_page, last_page):
+            return [mock.Mock(page=page) for page in range(first_page, last_page + 1)]
+            
+        extractor = OCRExtractor({'window_size': 2})
+        
+        with mock.patch.object(OCRExtractor, '_read_document_info', return_value={'pages': 5}), \
+                mock.patch('src.extractors.ocr_extractor.convert_from_path', side_effect=fake_convert) as convert, \
+                mock.patch('pytesseract.image_to_string', side_effect=lambda image, lang: f"page {image.page}"):
+            pages = extractor.extract_text_by_page(self.blank_pdf_path)
+            
+        self.assertEqual(pages, {i: f"page {i + 1}" for i in range(5)})
+        windows = [(call.kwargs['first_page'], call.kwargs['last_page']) for call in convert.call_args_list]
+        self.assertEqual(windows, [(1, 2), (3, 4), (5, 5)])
+    
+    
+    def test_ocr_metadata_does_not_rasterize(self):
+        """Test that OCR metadata is read from the PDF structure."""
+        extractor = OCRExtractor()
+        
+        with mock.patch('src.extractors.ocr_extractor.convert_from_path') as convert:
+            metadata = extractor.get_metadata(self.blank_pdf_path)
+            
+        convert.assert_not_called()
+        self.assertEqual(metadata['pages'], 3)
+        self.assertEqual(metadata['extraction_method'], 'ocr')
+    
+    
+    def test_hybrid_extractor_ocrs_only_unusable_pages(self):
+        """Test that the hybrid extractor sends only empty or garbage pages to OCR."""
+        text_layer = ExtractionResult.from_pages({
+            0: "A page with a perfectly good text layer on it.",
+            1: "",
+            2: "\ufffd\ufffd(cid:12)(cid:7)\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd\ufffd",
+        }, {'pages': 3})
+        extractor = HybridExtractor()
+        
+        with mock.patch.object(extractor.text_extractor, 'extract_all', return_value=text_layer), \
+                mock.patch.object(extractor.ocr_extractor, 'extract_pages',
+                                  return_value={1: "scanned one", 2: "scanned two"}) as extract_pages:
+            result = extractor.extract_all(self.blank_pdf_path)
+            
+        extract_pages.assert_called_once_with(self.blank_pdf_path, [1, 2])
+        self.assertEqual(result.text_by_page[0], "A page with a perfectly good text layer on it.")
+        self.assertEqual(result.text_by_page[2], "scanned two")
+        self.assertEqual(result.metadata['page_engines'], {0: 'pypdf', 1: 'ocr', 2: 'ocr'})
+    
+    
+    def test_cached_extractor_skips_parsing_on_hit(self):
+        """Test that a cache hit returns the stored result without parsing."""
+        config = {'cache': {'dir': os.path.join(self.temp_dir.name, "cache")}}
+        extractor = ExtractorFactory.create_extractor('pypdf', config)
+        
+        first = extractor.extract_all(self.blank_pdf_path)
+        
+        with mock.patch.object(extractor.extractor, 'extract_all') as extract_all:
+            second = extractor.extract_all(self.blank_pdf_path)
+            
+        extract_all.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(extractor.stats['hits'], 1)
+        self.assertEqual(extractor.stats['misses'], 1)
+    
+    
+    def test_cached_extractor_does_not_cache_failures(self):
+        """Test that a failed extraction that still read metadata is reported and not cached."""
+        config = {'cache': {'dir': os.path.join(self.temp_dir.name, "cache")}}
+        extractor = ExtractorFactory.create_extractor('pypdf', config)
+        
+        with mock.patch.object(PyPDF2.PageObject, 'extract_text', side_effect=ValueError("bad content stream")):
+            failed = extractor.extract_all(self.blank_pdf_path)
+        
+        self.assertEqual(failed.metadata['pages'], 3)
+        self.assertEqual([(error.kind, error.extractor) for error in failed.errors], [('error', 'pypdf')])
+        self.assertIn("bad content stream", failed.errors[0].message)
+        
+        result = extractor.extract_all(self.blank_pdf_path)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(extractor.stats['misses'], 2)
+    
+    
+    def test_iter_pages_page_range(self):
+        """Test that iter_pages yields only the requested pages, in order."""
+        for extractor in (PyPDFExtractor(), PDFPlumberExtractor()):
+            pages = extractor.iter_pages(self.blank_pdf_path, range(1, 5))
+            
+            self.assertNotIsInstance(pages, (list, dict))
+            self.assertEqual(list(pages), [(1, ""), (2, "")])
+    
+    
+    def test_in_memory_sources(self):
+        """Test that extractors accept bytes, memoryviews and file objects."""
+        with open(self.blank_pdf_path, 'rb') as f:
+            data = f.read()
+            
+        for extractor in (PyPDFExtractor(), PDFPlumberExtractor()):
+            expected = extractor.extract_all(self.blank_pdf_path)
+            
+            for source in (data, memoryview(data), io.BytesIO(data)):
+                self.assertEqual(extractor.extract_all(source), expected)
+                
+        with self.assertRaises(TypeError):
+            PyPDFExtractor().extract_all(12345)
+    
+    
+    def test_ocr_adaptive_dpi_rerenders_low_confidence_pages(self):
+        """Test that adaptive OCR re-renders only low-confidence pages at high DPI."""
+        def fake_convert(pdf_path, dpi, first_page, last_page):
+            return [mock.Mock(page=page, dpi=dpi) for page in range(first_page, last_page + 1)]
+            
+        def fake_ocr(image, extensions, lang):
+            # Page 2 is hard to read at low resolution
+            confidence = 40 if image.page == 2 and image.dpi < 300 else 90
+            tsv = f"level\tconf\ttext\n1\t-1\t\n5\t{confidence}\tword"
+            return f"page {image.page} at {image.dpi}", tsv
+            
+        extractor = OCRExtractor({'adaptive_dpi': True, 'low_dpi': 150, 'dpi': 300})
+        
+        with mock.patch.object(OCRExtractor, '_read_document_info', return_value={'pages': 3}), \
+                mock.patch('src.extractors.ocr_extractor.convert_from_path', side_effect=fake_convert) as convert, \
+                mock.patch('pytesseract.pytesseract.run_and_get_multiple_output', side_effect=fake_ocr):
+            result = extractor.extract_all(self.blank_pdf_path)
+            
+        self.assertEqual(result.text_by_page[1], "page 2 at 300")
+        self.assertEqual(result.text_by_page[2], "page 3 at 150")
+        self.assertEqual(result.metadata['page_dpi'], {0: 150, 1: 300, 2: 150})
+        self.assertEqual(result.metadata['page_confidence'], {0: 90, 1: 90, 2: 90})
+        self.assertEqual(convert.call_count, 2)
+    
+    
+    def test_ocr_render_cache_skips_rasterization(self):
+        """Test that repeat OCR in another language reuses cached page renders."""
+        from PIL import Image
+        
+        def fake_convert(pdf_path, dpi, first_page, last_page, grayscale=False):
+            return [Image.new('L', (8, 8), page) for page in range(first_page, last_page + 1)]
+            
+        render_cache = {'dir': os.path.join(self.temp_dir.name, "renders")}
+        
+        with mock.patch.object(OCRExtractor, '_read_document_info', return_value={'pages': 3}), \
+                mock.patch('src.extractors.ocr_extractor.convert_from_path', side_effect=fake_convert) as convert, \
+                mock.patch('pytesseract.image_to_string',
+                           side_effect=lambda image, lang: f"{lang} {image.getpixel((0, 0))}"):
+            first = OCRExtractor({'render_cache': render_cache, 'lang': 'eng'}).extract_text_by_page(self.blank_pdf_path)
+            second = OCRExtractor({'render_cache': render_cache, 'lang': 'deu'}).extract_text_by_page(self.blank_pdf_path)
+            
+        self.assertEqual(first, {0: "eng 1", 1: "eng 2", 2: "eng 3"})
+        self.assertEqual(second, {0: "deu 1", 1: "deu 2", 2: "deu 3"})
+        self.assertEqual(convert.call_count, 1)
+        self.assertTrue(convert.call_args.kwargs['grayscale'])
+    
+    
+    def test_hedged_extractor_reports_winner(self):
+        """Test that hedged extraction returns one engine's result and names it."""
+        extractor = HedgedExtractor({'deadline': 30})
+        result = extractor.extract_all(self.blank_pdf_path)
+        
+        self.assertIn(result.metadata['hedge_winner'], ['pypdf', 'pdfplumber'])
+        self.assertEqual(result.metadata['pages'], 3)
+    
+    
+    def test_hedged_extractor_deadline_bounds_latency(self):
+        """Test that a hung engine does not hold the result past the deadline."""
+        extractor = HedgedExtractor({'deadline': 1})
+        
+        start = time.monotonic()
+        with mock.patch.object(PyPDFExtractor, 'extract_all', side_effect=lambda path: time.sleep(30)):
+            result = extractor.extract_all(self.blank_pdf_path)
+            
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(result.metadata['hedge_winner'], 'pdfplumber')
+    
+    
+    def test_hedged_extractor_reports_start_failure(self):
+        """Test that an engine that cannot be started is reported, and started engines are stopped."""
+        start = multiprocessing.process.BaseProcess.start
+        started = []
+        
+        def start_first(process):
+            if started:
+                raise OSError("cannot fork")
+            start(process)
+            started.append(process)
+            
+        with mock.patch.object(multiprocessing.process.BaseProcess, 'start', start_first):
+            result = HedgedExtractor({'deadline': 30}).extract_all(self.blank_pdf_path)
+            
+        self.assertEqual([(error.kind, error.message) for error in result.errors],
+                         [('error', "OSError: cannot fork")])
+        self.assertFalse(started[0].is_alive())
+    
+    
+    def test_sandboxed_extractor_reuses_and_recycles_worker(self):
+        """Test that the sandbox worker serves several documents and is recycled."""
+        extractor = SandboxedExtractor('pypdf', {'sandbox': {'max_documents': 2}})
+        try:
+            result = extractor.extract_all(self.blank_pdf_path)
+            first_worker = extractor._process.pid
+            extractor.extract_all(self.blank_pdf_path)
+            self.assertEqual(extractor._process.pid, first_worker)
+            extractor.extract_all(self.blank_pdf_path)
+            self.assertNotEqual(extractor._process.pid, first_worker)
+        finally:
+            extractor.close()
+            
+        self.assertEqual(result.metadata['pages'], 3)
+        self.assertEqual(result.errors, [])
+    
+    
+    def test_sandboxed_extractor_reports_structured_errors(self):
+        """Test that timeouts and parse failures come back as errors, not empty text."""
+        bad_pdf_path = os.path.join(self.temp_dir.name, "bad.pdf")
+        with open(bad_pdf_path, 'wb') as f:
+            f.write(b"not a pdf")
+            
+        extractor = SandboxedExtractor('pypdf', {'sandbox': {'timeout': 1}})
+        try:
+            result = extractor.extract_all(bad_pdf_path)
+            self.assertEqual([error.kind for error in result.errors], ['error'])
+            
+            # A page that fails after the metadata was read is still an error
+            with mock.patch.object(PyPDF2.PageObject, 'extract_text', side_effect=ValueError("bad page")):
+                extractor.close()
+                result = extractor.extract_all(self.blank_pdf_path)
+            self.assertEqual(result.metadata['pages'], 3)
+            self.assertEqual([error.kind for error in result.errors], ['error'])
+            
+            with mock.patch.object(PyPDF2, 'PdfReader', side_effect=MemoryError):
+                extractor.close()
+                result = extractor.extract_all(self.blank_pdf_path)
+            self.assertEqual([error.kind for error in result.errors], ['memory'])
+            
+            with mock.patch.object(PyPDFExtractor, 'extract_all', side_effect=lambda path: time.sleep(30)):
+                extractor.close()
+                result = extractor.extract_all(self.blank_pdf_path)
+            self.assertEqual([error.kind for error in result.errors], ['timeout'])
+            
+            # A fresh worker takes over after the timeout
+            self.assertEqual(extractor.extract_all(self.blank_pdf_path).metadata['pages'], 3)
+        finally:
+            extractor.close()
+    
+    
+    def test_sandboxed_extractors_can_start_processes(self):
+        """Test that extractors running their own processes work inside the sandbox."""
+        def fake_convert(pdf_path, dpi, first_page, last_page):
+            return [mock.Mock(page=page) for page in range(first_page, last_page + 1)]
+            
+        hedged = ExtractorFactory.create_extractor('hedged', {'sandbox': {'enabled': True}})
+        ocr = ExtractorFactory.create_extractor('ocr', {'workers': 2, 'window_size': 1,
+                                                        'sandbox': {'enabled': True}})
+        try:
+            result = hedged.extract_all(self.blank_pdf_path)
+            self.assertEqual(result.errors, [])
+            self.assertIn(result.metadata['hedge_winner'], ['pypdf', 'pdfplumber'])
+            
+            # The mocks are inherited by the sandbox worker and its OCR workers
+            with mock.patch.object(OCRExtractor, '_read_document_info', return_value={'pages': 3}), \
+                    mock.patch('src.extractors.ocr_extractor.convert_from_path', side_effect=fake_convert), \
+                    mock.patch('pytesseract.image_to_string', side_effect=lambda image, lang: f"page {image.page}"):
+                result = ocr.extract_all(self.blank_pdf_path)
+            self.assertEqual(result.errors, [])
+            self.assertEqual(result.text_by_page, {i: f"page {i + 1}" for i in range(3)})
+        finally:
+            hedged.close()
+            ocr.close()
+            
+        # On timeout the engines the worker started are killed with it
+        pid_path = os.path.join(self.temp_dir.name, "engines.txt")
+        
+        def hang(path):
+            with open(pid_path, 'a') as f:
+                f.write(f"{os.getpid()}\n")
+            time.sleep(60)
+            
+        hedged = ExtractorFactory.create_extractor('hedged', {'sandbox': {'enabled': True, 'timeout': 2}})
+        try:
+            with mock.patch.object(PyPDFExtractor, 'extract_all', side_effect=hang), \
+                    mock.patch.object(PDFPlumberExtractor, 'extract_all', side_effect=hang):
+                result = hedged.extract_all(self.blank_pdf_path)
+        finally:
+            hedged.close()
+        self.assertEqual([error.kind for error in result.errors], ['timeout'])
+        
+        with open(pid_path) as f:
+            engine_pids = [int(line) for line in f]
+        self.assertEqual(len(engine_pids), 2)
+        time.sleep(0.5)
+        for pid in engine_pids:
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    # A killed process may linger as a zombie until reaped
+                    self.assertEqual(f.read().rsplit(')', 1)[1].split()[0], 'Z')
+            except FileNotFoundError:
+                pass
+    
+    
+    def test_main_reuses_one_sandbox_worker_for_a_directory(self):
+        """Test that batch mode extracts every file with one extractor and one worker."""
+        import main
+        
+        pdf_dir = os.path.join(self.temp_dir.name, "batch")
+        os.makedirs(pdf_dir)
+        for n in range(3):
+            with open(self.blank_pdf_path, 'rb') as src, open(os.path.join(pdf_dir, f"doc{n}.pdf"), 'wb') as dst:
+                dst.write(src.read())
+                
+        start, close = SandboxedExtractor._start, SandboxedExtractor.close
+        workers, closes = set(), []
+        
+        def record_start(extractor):
+            start(extractor)
+            workers.add(extractor._process.pid)
+            
+        def record_close(extractor):
+            closes.append(extractor)
+            close(extractor)
+            
+        with mock.patch.object(sys, 'argv', ['main.py', pdf_dir, '--extractor', 'pypdf', '--sandbox']), \
+                mock.patch.object(SandboxedExtractor, '_start', record_start), \
+                mock.patch.object(SandboxedExtractor, 'close', record_close), \
+                mock.patch('builtins.print'):
+            main.main()
+            
+        self.assertEqual(len(workers), 1)
+        self.assertEqual(len(closes), 1)
+        self.assertIsNone(closes[0]._process)
+    
+    
+    def test_wrapping_extractors_forward_close(self):
+        """Test that closing a cached hybrid extractor shuts down its OCR worker pool."""
+        config = {'cache': {'dir': os.path.join(self.temp_dir.name, "cache")}}
+        extractor = ExtractorFactory.create_extractor('auto', config)
+        ocr_extractor = extractor.extractor.ocr_extractor
+        ocr_extractor._get_executor()
+        
+        extractor.close()
+        
+        self.assertIsNone(ocr_extractor._executor)
+        with self.assertRaises(TypeError):
+            OCRBackend()
+    
+    
+    def test_ocr_backend_confidences_per_page(self):
+        """Test that batch TSV output is split into per-page confidences."""
+        tsv = ("level\tpage_num\tconf\ttext\n"
+               "1\t1\t-1\t\n5\t1\t80\tfoo\n5\t1\t90\tbar\n"
+               "1\t2\t-1\t\n5\t2\t40\tbaz\n")
+        
+        self.assertEqual(_page_confidences(tsv), {1: 85.0, 2: 40.0})
+        self.assertIs(get_backend('batch'), get_backend('batch'))
+        with self.assertRaises(ValueError):
+            get_backend('unknown')
 
 
 if __name__ == "__main__":
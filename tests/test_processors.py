@@ -1,8 +1,24 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 from src.models.document import Document
 from src.processors.text_processor import TextProcessor
 from src.processors.content_analyzer import ContentAnalyzer
 from src.processors.entity_extractor import EntityExtractor
+from benchmarks.entities import legacy_extract
+
+
+def make_nltk_data(data_dir: str) -> None:
+    """Write a minimal NLTK data directory: a short stopword list and untrained Punkt parameters."""
+    os.makedirs(os.path.join(data_dir, 'corpora', 'stopwords'))
+    with open(os.path.join(data_dir, 'corpora', 'stopwords', 'english'), 'w') as f:
+        f.write("the\nand\nfor\n")
+    # Empty Punkt parameters: a valid, untrained sentence tokenizer
+    punkt_dir = os.path.join(data_dir, 'tokenizers', 'punkt_tab', 'english')
+    os.makedirs(punkt_dir)
+    for name in ('collocations.tab', 'sent_starters.txt', 'abbrev_types.txt', 'ortho_context.tab'):
+        open(os.path.join(punkt_dir, name), 'w').close()
 
 
 class TestProcessors(unittest.TestCase):
@@ -33,6 +49,112 @@ class TestProcessors(unittest.TestCase):
         self.assertIsInstance(processed_doc, Document)
         self.assertIsNotNone(processed_doc.extracted_text)
     
+    def test_text_processor_derives_full_text_from_pages(self):
+        """Test that cleaning pages once gives the same full text as cleaning it whole."""
+        pages = {
+            0: "Intro\u2014text with hyphen-\nated words and  extra   spaces\n",
+            1: "   ",
+            2: "",
+            3: "a\nb\n c",
+            4: "\u201cquoted\u201d line\n\n\n\nnext paragraph\u2026 end-",
+            5: "\ncontinued on the last page"
+        }
+        full_text = "\n\n".join(text for text in pages.values() if text).strip()
+        document = Document(path="/path/to/test.pdf", filename="test.pdf",
+                            extracted_text=full_text, text_by_page=dict(pages))
+        processor = TextProcessor()
+        
+        processor.process(document)
+        
+        self.assertEqual(document.extracted_text, processor._clean_text(full_text))
+        self.assertEqual(document.text_by_page, {n: processor._clean_text(text) for n, text in pages.items()})
+    
+    def test_text_processor_clean_stream_matches_whole_text(self):
+        """Test that cleaning in small chunks gives the same text as cleaning it whole."""
+        pages = [
+            "  Intro\u2014text with hyphen-\n",
+            "ated words and  extra   spaces\n",
+            "",
+            "a\nb\n c \u00a0",
+            "\u201cquoted\u201d line\n\n\n\nnext paragraph\u2026 end-",
+            "\ncontinued on the last page\n\n"
+        ]
+        processor = TextProcessor()
+        expected = processor._clean_text("\n\n".join(text for text in pages if text).strip())
+        
+        for chunk_size in (1, 2, 5, 16, 1024):
+            chunks = list(processor.clean_stream(iter(pages), chunk_size=chunk_size))
+            self.assertEqual("".join(chunks), expected)
+    
+    def test_text_processor_clean_stream_bounds_text_without_safe_cuts(self):
+        """Test that text without cuts between non-whitespace characters is still streamed."""
+        processor = TextProcessor()
+        pages = ["a b c 1 2 3 " * 2000]
+        
+        chunks = list(processor.clean_stream(iter(pages), chunk_size=16))
+        
+        self.assertEqual("".join(chunks), processor._clean_text(pages[0].strip()))
+        self.assertLessEqual(max(len(chunk) for chunk in chunks), 4 * 16)
+        
+        pages = ["a\n" * 10000]
+        
+        chunks = list(processor.clean_stream(iter(pages), chunk_size=16))
+        
+        self.assertGreater(len(chunks), 1)
+        self.assertLessEqual(max(len(chunk) for chunk in chunks), 4096 + 16)
+        self.assertEqual("".join(chunks).split(), processor._clean_text(pages[0]).split())
+    
+    def test_text_processor_removes_repeated_headers_and_footers(self):
+        """Test that lines repeated at the top or bottom of pages are removed, and nothing else."""
+        bodies = [
+            ["Revenue grew in the north.", "Table 1", "Costs fell.", "Margins held."],
+            ["Hiring slowed.", "Figure 2", "Churn was flat.", "Cash rose."],
+            ["Body of a page without header."],
+            ["Outlook is stable.", "Chart 3", "Risks remain.", "Total 42"]
+        ]
+        pages = {
+            n: "\n".join([f"ACME Corp  Annual Report {2020 + n}"] + lines + ["", f"Page {n + 1} of 4", ""])
+            for n, lines in enumerate(bodies)
+        }
+        pages[2] = "Body of a page without header.\nPage 3 of 4"
+        full_text = "\n\n".join(pages[n] for n in sorted(pages)).strip()
+        document = Document(path="/path/to/test.pdf", filename="test.pdf",
+                            extracted_text=full_text, text_by_page=dict(pages))
+        
+        TextProcessor().process(document)
+        
+        self.assertEqual(document.text_by_page[0], "Revenue grew in the north.\nTable 1 Costs fell.\nMargins held.")
+        self.assertEqual(document.text_by_page[2], "Body of a page without header.")
+        self.assertNotIn("ACME", document.extracted_text)
+        self.assertNotIn("Page", document.extracted_text)
+        self.assertIn("Total 42", document.extracted_text)
+        
+        # Too few pages to tell headers from content
+        document = Document(path="/path/to/test.pdf", filename="test.pdf",
+                            extracted_text=pages[0], text_by_page={0: pages[0]})
+        TextProcessor().process(document)
+        self.assertIn("Page 1 of 4", document.extracted_text)
+    
+    def test_text_processor_keeps_varying_numeric_lines(self):
+        """Test that rows of figures sharing a shape across pages are not taken for headers."""
+        rows = [("107 203 16", "Total 1037"), ("98 311 25", "Total 1210"),
+                ("240 17 9", "Total 880"), ("66 402 31", "Total 1502")]
+        pages = {
+            n: f"Quarterly Ledger\n{row}\nRegion figures.\nMore figures.\n{total}\n{n + 1}"
+            for n, (row, total) in enumerate(rows)
+        }
+        document = Document(path="/path/to/test.pdf", filename="test.pdf",
+                            extracted_text="\n\n".join(pages[n] for n in sorted(pages)),
+                            text_by_page=dict(pages))
+        
+        TextProcessor().process(document)
+        
+        for n, (row, total) in enumerate(rows):
+            self.assertIn(row, document.text_by_page[n])
+            self.assertIn(total, document.text_by_page[n])
+            self.assertNotIn("Ledger", document.text_by_page[n])
+            self.assertFalse(document.text_by_page[n].endswith(str(n + 1)))
+    
     def test_content_analyzer(self):
         """Test ContentAnalyzer functionality."""
         processor = ContentAnalyzer()
@@ -41,6 +163,124 @@ class TestProcessors(unittest.TestCase):
         self.assertIsInstance(processed_doc, Document)
         self.assertIsInstance(processed_doc.keywords, list)
     
+    def test_fast_keyword_counts_keep_words_of_letters(self):
+        """Test that the fast keyword engine counts lowercase words of three or more letters."""
+        text = ("The report's figures, and John's notes: wouldn't change "
+                "the data. Report figures in 3rd-quarter DATA2 x-ray \u2018data\u2019 area\u00b2")
+        
+        counts = ContentAnalyzer._fast_word_counts(text, frozenset(['the', 'and', 'wouldn']))
+        
+        self.assertEqual(counts, {'report': 2, 'figures': 2, 'john': 1, 'notes': 1,
+                                  'change': 1, 'data': 3, 'quarter': 1, 'ray': 1})
+    
+    def test_fast_keyword_engine_matches_nltk_top_keywords(self):
+        """Test that both keyword engines pick the same top keywords from ordinary prose."""
+        text = (
+            "Quarterly Report\n\n"
+            "Revenue grew 12% in the third quarter, driven by strong demand for cloud services. "
+            "The company's cloud revenue reached $4.2 billion, while hardware revenue declined. "
+            "Operating margins improved as costs for data centers fell for the second quarter "
+            "in a row. Management expects demand for cloud services to remain strong, although "
+            "currency effects may weigh on revenue in Europe.\n\n"
+            "Customers signed 340 new contracts, and the average contract value rose. Hardware "
+            "sales in Asia were flat; in Europe they fell by 5%. The board approved a dividend "
+            "of $0.40 per share and a new buyback program. Margins in the services business were "
+            "the highest since 2019, and management said the company's data centers are running "
+            "near capacity.\n\n"
+            "Outlook: the company expects revenue of $15 billion to $16 billion for the full year. "
+            "Risks include currency swings, supply constraints for hardware, and slower demand "
+            "from customers in Europe."
+        )
+        
+        with tempfile.TemporaryDirectory() as data_dir:
+            make_nltk_data(data_dir)
+            keywords = [ContentAnalyzer({'nltk_data': data_dir, 'keyword_engine': engine, 'num_keywords': 10}).process(
+                Document(path="", filename="", extracted_text=text)).keywords
+                for engine in ('nltk', 'fast')]
+            
+        self.assertEqual(keywords[0], keywords[1])
+        self.assertEqual(len(keywords[0]), 10)
+    
+    def test_content_analyzer_reads_nltk_data_dir_once(self):
+        """Test that NLTK data is read from the configured directory, once, and never downloaded."""
+        import nltk.data
+        
+        with tempfile.TemporaryDirectory() as data_dir:
+            make_nltk_data(data_dir)
+            text = "The report covers the market. The market grew, and the report says so."
+            with mock.patch.object(nltk.data, 'find', wraps=nltk.data.find) as find, \
+                    mock.patch('nltk.download') as download:
+                keywords = [ContentAnalyzer({'nltk_data': data_dir, 'keyword_engine': engine}).process(
+                    Document(path="", filename="", extracted_text=text)).keywords
+                    for engine in ('nltk', 'fast', 'nltk')]
+                
+            self.assertEqual(keywords, [['report', 'market', 'covers', 'grew', 'says']] * 3)
+            self.assertEqual(find.call_count, 2)
+            download.assert_not_called()
+            
+        # Missing data fails without searching again
+        missing_dir = os.path.join(data_dir, 'missing')
+        with mock.patch.object(nltk.data, 'find', wraps=nltk.data.find) as find:
+            searches = []
+            for _ in range(3):
+                document = ContentAnalyzer({'nltk_data': missing_dir}).process(
+                    Document(path="", filename="", extracted_text=text))
+                self.assertEqual(document.keywords, [])
+                searches.append(find.call_count)
+        self.assertEqual(searches[1:], searches[:1] * 2)
+    
+    def test_content_analyzer_ranks_keywords_by_corpus_tfidf(self):
+        """Test that words common across the corpus rank below words specific to a document."""
+        texts = [
+            "report report report revenue revenue",
+            "report report report hiring hiring",
+            "report report report market market",
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            make_nltk_data(os.path.join(temp_dir, 'nltk_data'))
+            config = {'nltk_data': os.path.join(temp_dir, 'nltk_data'),
+                      'corpus_index': os.path.join(temp_dir, 'df.sqlite'), 'num_keywords': 2}
+            analyzer = ContentAnalyzer(config)
+            
+            keywords = [analyzer.process(Document(path="", filename="", extracted_text=text)).keywords
+                        for text in texts + texts[:1]]
+            
+            # Early documents see a small corpus: "report" still wins the second one
+            self.assertEqual(keywords, [['report', 'revenue'], ['report', 'hiring'],
+                                        ['market', 'report'], ['revenue', 'report']])
+            self.assertEqual(analyzer._df_index.document_count, 3)
+            analyzer._df_index.close()
+    
+    def test_content_analyzer_summary_ranks_central_sentences(self):
+        """Test that the summary keeps the best-connected sentences, in document order."""
+        text = ("Weather was cold in March. Market revenue grew strongly this quarter. "
+                "Revenue growth came from the market in Europe. Our cat likes boxes. "
+                "Market growth and revenue growth will continue. Lunch is served at noon.")
+        
+        with tempfile.TemporaryDirectory() as data_dir:
+            make_nltk_data(data_dir)
+            analyzer = ContentAnalyzer({'nltk_data': data_dir, 'generate_summary': True,
+                                        'extract_keywords': False, 'summary_sentences': 3})
+            document = analyzer.process(Document(path="", filename="", extracted_text=text))
+            
+        self.assertEqual(document.summary, "Market revenue grew strongly this quarter. "
+                                           "Revenue growth came from the market in Europe. "
+                                           "Market growth and revenue growth will continue.")
+    
+    def test_summary_window_zero_compares_all_sentences(self):
+        """Test that a summary window of 0 links every pair of sentences, not none."""
+        sentences = ["Market revenue grew.", "Our cat likes boxes.", "Lunch is at noon.",
+                     "The market report came out.", "Revenue beat the report."]
+        stop_words = frozenset(['the', 'our'])
+        
+        scores = {window: ContentAnalyzer({'summary_window': window})._rank_sentences(sentences, stop_words)
+                  for window in (0, 1, len(sentences))}
+        
+        self.assertEqual(scores[0], scores[len(sentences)])
+        self.assertNotEqual(scores[0], scores[1])
+        self.assertGreater(scores[0][0], scores[0][1])
+    
     def test_entity_extractor(self):
         """Test EntityExtractor functionality."""
         processor = EntityExtractor()
@@ -54,6 +294,51 @@ class TestProcessors(unittest.TestCase):
         self.assertIn('urls', processed_doc.entities)
         self.assertIn('example@example.com', processed_doc.entities['emails'])
         self.assertIn('https://www.example.com', processed_doc.entities['urls'])
+    
+    def test_entity_extractor_single_scan_matches_previous_extraction(self):
+        """Test that overlapping entities of different types are all found, as before."""
+        text = ("See https://example.com/12/05/2023 or mail 555-123-4567@example.com, "
+                "a.b@c.de@example.org and call (555) 123-4567 on 3 March 2024 or Mar 4, 2024.")
+        
+        entities = EntityExtractor()._extract_entities(text)
+        
+        self.assertEqual(entities, legacy_extract(text))
+        self.assertEqual(entities['dates'], ['12/05/2023', '3 March 2024', 'Mar 4, 2024'])
+        self.assertEqual(entities['phones'], ['555-123-4567'])
+        self.assertEqual(entities['emails'], ['555-123-4567@example.com', 'a.b@c.de'])
+        
+        only_dates = EntityExtractor({'extract_emails': False, 'extract_phones': False,
+                                      'extract_urls': False})._extract_entities(text)
+        self.assertEqual(only_dates, {'dates': entities['dates']})
+    
+    def test_entity_extractor_records_pages_and_offsets(self):
+        """Test that entities are recorded with their page and offsets."""
+        document = Document(
+            path="/path/to/test.pdf",
+            filename="test.pdf",
+            text_by_page={0: "Mail a@example.com today.", 1: "Call 555-123-4567 or a@example.com."}
+        )
+        
+        EntityExtractor().process(document)
+        
+        self.assertEqual([tuple(record) for record in document.entity_table], [
+            ('emails', 'a@example.com', 0, 5, 18),
+            ('phones', '555-123-4567', 1, 5, 17),
+            ('emails', 'a@example.com', 1, 21, 34)
+        ])
+        self.assertEqual(document.entity_table[1].page, 1)
+        self.assertEqual(document.entities, {'emails': ['a@example.com'], 'phones': ['555-123-4567'],
+                                             'urls': [], 'dates': []})
+    
+    def test_document_entities_can_still_be_set(self):
+        """Test that entities can be passed to Document and assigned, as before the entity table."""
+        entities = {'emails': ['a@example.com']}
+        document = Document(path="/path/to/test.pdf", filename="test.pdf", entities=entities)
+        self.assertEqual(document.entities, entities)
+        
+        document.entities = {'urls': ['https://example.com']}
+        self.assertEqual(document.entities, {'urls': ['https://example.com']})
+        self.assertEqual(len(document.entity_table), 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import unittest
+import tempfile
+import subprocess
+from unittest import mock
+from src.utils.cache import DiskCache
+from src.utils.registry import PluginRegistry
+from src.utils.term_index import DocumentFrequencyIndex
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test cases for the on-disk LRU cache."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+    
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits and misses."""
+        cache = DiskCache(self.cache_dir)
+        
+        self.assertIsNone(cache.get("aa11"))
+        cache.put("aa11", b"value")
+        self.assertEqual(cache.get("aa11"), b"value")
+        
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(cache.stats['bytes'], 5)
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted over budget."""
+        cache = DiskCache(self.cache_dir, max_bytes=250)
+        
+        cache.put("aa01", b"x" * 100)
+        cache.put("aa02", b"x" * 100)
+        
+        # Make the first entry older, then touch it so the second becomes LRU
+        old = time.time() - 60
+        os.utime(cache._path("aa01"), (old, old))
+        os.utime(cache._path("aa02"), (old - 1, old - 1))
+        cache.get("aa01")
+        
+        cache.put("aa03", b"x" * 100)
+        
+        self.assertIsNone(cache.get("aa02"))
+        self.assertEqual(cache.get("aa01"), b"x" * 100)
+        self.assertEqual(cache.get("aa03"), b"x" * 100)
+        self.assertLessEqual(cache.stats['bytes'], 250)
+
+
+
+class TestPluginRegistry(unittest.TestCase):
+    """Test cases for the lazy-loading plugin registry."""
+    
+    def test_imports_on_first_use(self):
+        """Test that a registered module is only imported when loaded."""
+        registry = PluginRegistry()
+        registry.register('decoder', 'json.decoder:JSONDecoder')
+        
+        with mock.patch('importlib.import_module', wraps=__import__('importlib').import_module) as import_module:
+            self.assertEqual(registry.names(), ['decoder'])
+            import_module.assert_not_called()
+            
+            decoder_class = registry.load('decoder')
+            registry.load('decoder')
+            
+        self.assertEqual(decoder_class.__name__, 'JSONDecoder')
+        self.assertEqual(import_module.call_count, 1)
+        with self.assertRaises(KeyError):
+            registry.load('missing')
+    
+    def test_entry_point_plugins(self):
+        """Test that plugins are discovered from entry points without replacing built-ins."""
+        plugin = mock.Mock()
+        plugin.name = 'plugin'
+        shadow = mock.Mock()
+        shadow.name = 'builtin'
+        
+        registry = PluginRegistry('scoreme.extractors')
+        registry.register('builtin', dict)
+        
+        with mock.patch('importlib.metadata.entry_points', return_value=[plugin, shadow]) as entry_points:
+            self.assertEqual(registry.names(), ['builtin', 'plugin'])
+            self.assertIs(registry.load('plugin'), plugin.load.return_value)
+            
+        entry_points.assert_called_once_with(group='scoreme.extractors')
+        self.assertIs(registry.load('builtin'), dict)
+    
+    def test_cli_entry_points_skip_backend_imports(self):
+        """Test that importing the CLI entry points loads no PDF, OCR or NLP library."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        heavy = ['PyPDF2', 'pdfplumber', 'pdfminer', 'pdf2image', 'pytesseract', 'PIL', 'nltk']
+        code = ("import sys, main, process_test_files, processor_pipeline; "
+                f"print(','.join(name for name in {heavy!r} if name in sys.modules))")
+        
+        completed = subprocess.run([sys.executable, '-c', code], cwd=root,
+                                   capture_output=True, text=True, check=True)
+        
+        self.assertEqual(completed.stdout.strip(), "")
+    
+    def test_sandboxed_extractor_skips_engine_import(self):
+        """Test that creating a sandboxed extractor leaves the engine to the worker."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys; from src.extractors.extractor_factory import ExtractorFactory; "
+                "ExtractorFactory.create_extractor('pypdf', {'sandbox': {'enabled': True}}); "
+                "print('PyPDF2' in sys.modules)")
+        
+        completed = subprocess.run([sys.executable, '-c', code], cwd=root,
+                                   capture_output=True, text=True, check=True)
+        
+        self.assertEqual(completed.stdout.strip(), "False")
+
+
+class TestDocumentFrequencyIndex(unittest.TestCase):
+    """Test cases for the persistent document-frequency index."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.temp_dir.name, "index", "df.sqlite")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+    
+    def test_counts_each_document_once_and_persists(self):
+        """Test that documents update counts once and the counts survive reopening."""
+        index = DocumentFrequencyIndex(self.index_path)
+        
+        self.assertTrue(index.add(b"doc1", ["market", "report", "market"]))
+        self.assertTrue(index.add(b"doc2", ["market", "growth"]))
+        self.assertFalse(index.add(b"doc1", ["market", "report"]))
+        index.close()
+        
+        index = DocumentFrequencyIndex(self.index_path)
+        self.assertIn(b"doc2", index)
+        self.assertEqual(index.document_count, 2)
+        self.assertEqual(index.document_frequencies(["market", "report", "growth", "missing"]),
+                         {"market": 2, "report": 1, "growth": 1})
+        
+        # Lookups are batched below SQLite's parameter limit
+        index.add(b"doc3", [f"term{n}" for n in range(1200)])
+        self.assertEqual(len(index.document_frequencies(f"term{n}" for n in range(1500))), 1200)
+        index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file